@@ -0,0 +1 @@
+"""Benchmark throughput pipeline scoring VADER (lihat `python -m benchmarks.run --help`)."""
@@ -0,0 +1,326 @@
+"""
+Benchmark pipeline scoring & I/O yang bisa diulang:
+
+    python -m benchmarks.run                          # data asli + 100k baris sintetis
+    python -m benchmarks.run --sizes base 100k 1m --workers 4
+    python -m benchmarks.run --save-baseline          # simpan benchmarks/baseline.json (di-commit)
+    python -m benchmarks.run --compare benchmarks/baseline.json
+
+Setiap kasus dijalankan di proses baru (spawn) sehingga peak RSS tidak
+tercampur antar kasus. Hasil per run (bertimestamp) ditulis ke
+benchmarks/results/ yang di-ignore git; baseline disimpan terpisah di
+benchmarks/baseline.json agar bisa di-commit dan dibandingkan di mesin/CI
+lain. Data sintetis dibuat dari `data/Data Ulasan.tsv`
+dengan seed tetap: separuh baris salinan persis, separuh diberi sufiks unik,
+jadi rasio dedup tetap realistis di setiap ukuran. Kasus `parallel` dilewati
+jika mesin hanya punya 1 CPU atau --workers < 2 (hasilnya hanya jalur serial).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import metadata
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURATION ---
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+REVIEWS_TSV = os.path.join(ROOT_DIR, 'data', 'Data Ulasan.tsv')
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+BASELINE_PATH = os.path.join(ROOT_DIR, 'benchmarks', 'baseline.json')
+SIZES = {'base': None, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DEFAULT_SIZES = ['base', '100k']
+SUITES = {
+    'scoring': ['apply', 'per_text', 'columnar', 'dedup', 'parallel'],
+    'export': ['xlsx', 'csv', 'parquet'],
+    'ingest': ['xlsx', 'csv', 'parquet'],
+}
+SEED = 42
+UNIQUE_RATIO = 0.5
+# xlsx (openpyxl) sangat lambat untuk jutaan baris; di atas batas ini kasus xlsx dilewati
+XLSX_MAX_ROWS = 100_000
+# Kasus parallel butuh >= 2 worker di mesin >= 2 CPU; selain itu score_texts_parallel
+# jatuh ke jalur serial dan angkanya hanya duplikat kasus columnar
+PARALLEL_MIN_WORKERS = 2
+REGRESSION_THRESHOLD = 0.10
+PACKAGES = ['vaderSentiment', 'numpy', 'pandas', 'pyarrow', 'openpyxl']
+
+
+# --- DATA ---
+def synthetic_frame(size, seed=SEED):
+    """Dataset benchmark: kolom content + skor/label acak (untuk kasus export/ingest)."""
+    base = pd.read_csv(REVIEWS_TSV, sep='\t')['content'].astype(str).to_numpy(dtype=object)
+    n = SIZES[size] or len(base)
+    rng = np.random.default_rng(seed)
+    if SIZES[size] is None:
+        texts = base.copy()
+    else:
+        texts = base[rng.integers(0, len(base), n)]
+        vary = np.flatnonzero(rng.random(n) < UNIQUE_RATIO)
+        suffixes = rng.integers(0, 10_000_000, len(vary))
+        texts[vary] = [f"{texts[i]} #{s}" for i, s in zip(vary, suffixes)]
+
+    pos = rng.random(n) * 0.5
+    neg = rng.random(n) * (1 - pos) * 0.5
+    compound = np.round(rng.uniform(-1, 1, n), 4)
+    return pd.DataFrame({
+        'content': texts,
+        'neg': np.round(neg, 3),
+        'neu': np.round(1 - pos - neg, 3),
+        'pos': np.round(pos, 3),
+        'compound': compound,
+        'label': np.select([compound >= 0.05, compound <= -0.05], ['Positive', 'Negative'], 'Neutral'),
+    })
+
+
+def _peak_rss_mb(who):
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux melaporkan KB, macOS bytes
+    return round(peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+# --- CASES (dijalankan di proses anak) ---
+def _time_scoring(case, texts, workers):
+    from core.lexicon import load_analyzer
+    from core.parallel import score_texts_parallel, shutdown_pools
+    from core.scoring import score_texts
+
+    analyzer = load_analyzer()
+    extra = {}
+    started = time.perf_counter()
+    if case == 'apply':
+        # Jalur lama halaman dashboard: dict per baris lewat Series.apply
+        pd.Series(texts).apply(analyzer.polarity_scores)
+    elif case == 'per_text':
+        latencies = np.empty(len(texts), dtype=np.int64)
+        polarity_scores, clock = analyzer.polarity_scores, time.perf_counter_ns
+        for i, text in enumerate(texts):
+            t0 = clock()
+            polarity_scores(text)
+            latencies[i] = clock() - t0
+        extra = {
+            'p50_ms': round(float(np.percentile(latencies, 50)) / 1e6, 4),
+            'p99_ms': round(float(np.percentile(latencies, 99)) / 1e6, 4),
+            'max_ms': round(float(latencies.max()) / 1e6, 4),
+        }
+    elif case == 'columnar':
+        score_texts(texts, analyzer)
+    elif case == 'dedup':
+        score_texts(texts, analyzer, dedup=True)
+    elif case == 'parallel':
+        # Pool dibuat & di-warm sebelum timer agar yang diukur hanya scoring.
+        # Pool ditutup dengan wait=True: worker di-join & di-reap sebelum proses kasus
+        # keluar (tanpa itu _exit_function multiprocessing bisa menggantung saat join),
+        # dan peak RSS RUSAGE_CHILDREN baru mencakup worker yang sudah di-reap
+        score_texts_parallel(texts[:workers * 2], analyzer, workers=workers, chunk_size=1, min_rows=0)
+        started = time.perf_counter()
+        score_texts_parallel(texts, analyzer, workers=workers, min_rows=0)
+        extra['workers'] = workers
+    seconds = time.perf_counter() - started
+    if case == 'parallel':
+        shutdown_pools(wait=True)
+    return seconds, extra
+
+
+def _io_path(workdir, size, fmt):
+    return os.path.join(workdir, f"{size}.{fmt}")
+
+
+def _time_export(fmt, frame, workdir, size):
+    from core.export import write_results
+
+    path = _io_path(workdir, size, fmt)
+    started = time.perf_counter()
+    write_results(frame, path, fmt)
+    return time.perf_counter() - started, {'bytes': os.path.getsize(path)}
+
+
+def _time_ingest(fmt, frame, workdir, size):
+    from core.export import write_results
+    from core.ingest import iter_frames
+
+    path = _io_path(workdir, size, fmt)
+    if not os.path.exists(path):
+        write_results(frame, path, fmt)
+    started = time.perf_counter()
+    rows = sum(len(chunk) for chunk in iter_frames(path, fmt))
+    return time.perf_counter() - started, {'rows_read': rows}
+
+
+def run_case(suite, case, size, data_path, workdir, workers, repeat):
+    """Satu kasus benchmark (dipanggil di proses spawn baru); kembalikan dict hasil."""
+    frame = pd.read_parquet(data_path)
+    rows = len(frame)
+    timings, extra = [], {}
+    for _ in range(repeat):
+        if suite == 'scoring':
+            seconds, extra = _time_scoring(case, frame['content'].tolist(), workers)
+        elif suite == 'export':
+            seconds, extra = _time_export(case, frame, workdir, size)
+        else:
+            seconds, extra = _time_ingest(case, frame, workdir, size)
+        timings.append(seconds)
+    seconds = statistics.median(timings)
+    return {
+        'suite': suite,
+        'case': case,
+        'size': size,
+        'rows': rows,
+        'seconds': round(seconds, 4),
+        'rows_per_sec': round(rows / seconds, 1) if seconds else None,
+        'peak_rss_mb': _peak_rss_mb(0),          # RUSAGE_SELF
+        # RUSAGE_CHILDREN: worker pool yang sudah di-reap (shutdown_pools(wait=True)); hanya kasus parallel
+        'children_peak_rss_mb': _peak_rss_mb(-1) if case == 'parallel' else None,
+        **extra,
+    }
+
+
+# --- RUNNER ---
+def environment():
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+        'seed': SEED,
+    }
+
+
+def parallel_skip_reason(workers, cpu_count=None):
+    """Alasan kasus parallel dilewati (None jika bisa dijalankan)."""
+    cpu_count = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    if cpu_count < PARALLEL_MIN_WORKERS:
+        return f"cpu_count={cpu_count}, jalur paralel akan serial"
+    if workers < PARALLEL_MIN_WORKERS:
+        return f"workers={workers}, jalur paralel akan serial"
+    return None
+
+
+def run(sizes, suites, workers, repeat, log=print):
+    results = []
+    parallel_skip = parallel_skip_reason(workers)
+    context = get_context('spawn')
+    with tempfile.TemporaryDirectory(prefix='vader-bench-') as workdir:
+        for size in sizes:
+            data_path = os.path.join(workdir, f"{size}-data.parquet")
+            synthetic_frame(size).to_parquet(data_path, index=False)
+            rows = SIZES[size] or len(pd.read_parquet(data_path, columns=['content']))
+            for suite in suites:
+                for case in SUITES[suite]:
+                    if case == 'xlsx' and rows > XLSX_MAX_ROWS:
+                        log(f"  skip {suite}/{case} @ {size} (> {XLSX_MAX_ROWS:,} baris)")
+                        continue
+                    if case == 'parallel' and parallel_skip:
+                        log(f"  skip {suite}/{case} @ {size} ({parallel_skip})")
+                        continue
+                    # Proses baru per kasus: peak RSS terisolasi, tidak ada cache antar kasus
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                        result = executor.submit(
+                            run_case, suite, case, size, data_path, workdir, workers, repeat,
+                        ).result()
+                    results.append(result)
+                    log(format_result(result))
+    return results
+
+
+def format_result(result):
+    line = (
+        f"  {result['suite']:<8} {result['case']:<9} {result['size']:>5} "
+        f"{result['rows']:>9,} baris {result['seconds']:>9.3f} s {result['rows_per_sec'] or 0:>12,.0f} baris/s"
+    )
+    if result.get('p50_ms') is not None:
+        line += f"  p50 {result['p50_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms"
+    if result.get('peak_rss_mb') is not None:
+        line += f"  RSS {result['peak_rss_mb']:,.0f} MB"
+    return line
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD, log=print):
+    """Bandingkan rows/sec dengan baseline; kembalikan daftar kasus yang turun > threshold."""
+    previous = {(r['suite'], r['case'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    log(f"\nPerbandingan dengan baseline {baseline.get('environment', {}).get('commit')} "
+        f"({baseline.get('environment', {}).get('timestamp')}):")
+    for result in results:
+        key = (result['suite'], result['case'], result['size'])
+        old = previous.get(key)
+        if not old or not old.get('rows_per_sec') or not result.get('rows_per_sec'):
+            log(f"  {'/'.join(key):<28} (tidak ada di baseline)")
+            continue
+        change = result['rows_per_sec'] / old['rows_per_sec'] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  <-- REGRESI'
+            regressions.append({'key': key, 'change': change})
+        log(f"  {'/'.join(key):<28} {old['rows_per_sec']:>12,.0f} -> {result['rows_per_sec']:>12,.0f} baris/s "
+            f"({change:+.1%}){flag}")
+    return regressions
+
+
+def write_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description="Benchmark pipeline scoring VADER.")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=DEFAULT_SIZES,
+                        help=f"Ukuran dataset (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument('--suites', nargs='+', choices=list(SUITES), default=list(SUITES))
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="Jumlah proses untuk kasus parallel (default: jumlah CPU)")
+    parser.add_argument('--repeat', type=int, default=1, help="Ulangi tiap kasus, ambil median (default: 1)")
+    parser.add_argument('-o', '--output', help="File JSON hasil (default: benchmarks/results/<waktu>.json)")
+    parser.add_argument('--save-baseline', action='store_true', help=f"Simpan juga sebagai {BASELINE_PATH}")
+    parser.add_argument('--compare', metavar='JSON', help="Bandingkan dengan hasil/baseline sebelumnya")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help="Batas penurunan rows/sec yang dianggap regresi (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    print(f"Benchmark {', '.join(args.suites)} @ {', '.join(args.sizes)} (workers={args.workers})")
+    report = {'environment': environment()}
+    report['results'] = run(args.sizes, args.suites, args.workers, args.repeat)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    write_report(report, output)
+    print(f"\nHasil: {output}")
+    if args.save_baseline:
+        write_report(report, BASELINE_PATH)
+        print(f"Baseline: {BASELINE_PATH}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report['results'], json.load(f), args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
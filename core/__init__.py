@@ -0,0 +1,67 @@
+"""
+Pipeline analisis sentimen VADER yang dipakai bersama oleh halaman dashboard, CLI & server.
+
+Nama publik diekspor secara lazy (PEP 562): `import core` tidak memuat submodul apa pun,
+jadi worker pool, CLI & server hanya mengimpor modul yang benar-benar dipakai
+(tanpa PIL, pyarrow, asyncio, sqlite3, langid bila tidak perlu).
+"""
+import importlib
+
+# Submodul -> nama yang diekspor dari paket `core`
+_SUBMODULE_EXPORTS = {
+    'core.aggregate': ('compound_histogram', 'label_counts', 'segment_counts', 'summarize'),
+    'core.artifact': (
+        'build_reviews_artifact', 'build_validation_artifact', 'load_reviews', 'load_validation',
+    ),
+    'core.assets': ('asset_bytes', 'asset_data_uri', 'asset_html', 'build_assets'),
+    'core.calibration': (
+        'best_thresholds', 'sweep_confusions', 'sweep_thresholds', 'symmetric_sweep', 'threshold_grid',
+    ),
+    'core.dataset': ('file_fingerprint', 'lexicon_version', 'score_reviews', 'text_fingerprints'),
+    'core.export': ('EXPORT_FORMATS', 'export_bytes', 'write_excel', 'write_result_stream', 'write_results'),
+    'core.ingest': (
+        'UPLOAD_TYPES', 'content_hash', 'count_rows', 'detect_format', 'iter_frames', 'read_preview',
+    ),
+    'core.instrument': ('StageTimings', 'current_rss_mb'),
+    'core.language': ('detect_languages', 'translate_rows'),
+    'core.lexicon': ('compile_lexicon', 'list_overlays', 'load_analyzer', 'overlay_key', 'read_overlay'),
+    'core.metrics': (
+        'bootstrap_ci', 'classification_report', 'confusion_matrix', 'encode_labels', 'evaluate',
+    ),
+    'core.parallel': (
+        'DEFAULT_CHUNK_SIZE', 'PARALLEL_MIN_ROWS', 'default_workers', 'score_texts_parallel', 'submit_chunk',
+    ),
+    'core.pipeline': ('analyze_text', 'collect_results', 'score_file', 'score_frames'),
+    'core.scoring': (
+        'LABELS', 'NEG_THRESHOLD', 'POS_THRESHOLD', 'SCORE_COLUMNS', 'THRESHOLDS_PATH', 'dedupe_texts',
+        'get_thresholds', 'label_compound', 'label_from_compound', 'reset_thresholds', 'save_thresholds',
+        'score_texts', 'scores_frame', 'scores_to_frame', 'take_scores',
+    ),
+    'core.search': ('SearchIndex', 'build_index', 'load_index', 'parse_query', 'tokenize'),
+    'core.sentences': ('aggregate_sentences', 'iter_sentence_scores', 'split_sentences'),
+    'core.server': ('MicroBatcher', 'ScoringService', 'start_server'),
+    'core.table': (
+        'PAGE_SIZES', 'filter_rows', 'page_bounds', 'page_count', 'page_rows', 'query_rows', 'sort_rows',
+    ),
+    'core.translation': (
+        'GoogleBackend', 'StubBackend', 'TranslationCache', 'Translator', 'TranslatorBackend',
+        'translate_concurrent',
+    ),
+}
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Simpan di namespace paket: akses berikutnya tidak lewat __getattr__ lagi
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+"""
+Agregasi untuk grafik: jumlah label, histogram compound per label dan
+breakdown per segmen/waktu, dihitung sekali dengan np.bincount atas kode
+integer. Grafik cukup menerima frame agregat kecil (puluhan baris) berapa
+pun jumlah baris datasetnya.
+"""
+import numpy as np
+import pandas as pd
+
+from core.metrics import encode_labels
+from core.scoring import LABELS
+
+# --- CONFIGURATION ---
+HIST_BINS = 40
+HIST_RANGE = (-1.0, 1.0)
+SEGMENT_TOP = 20
+OTHER_SEGMENT = '(lainnya)'
+
+
+def label_counts(labels, classes=LABELS):
+    """DataFrame (label, count) berurutan sesuai `classes`; singkatan P/NT/N ikut dipetakan."""
+    codes = encode_labels(labels, classes)
+    counts = np.bincount(codes[codes >= 0], minlength=len(classes))
+    return pd.DataFrame({'label': list(classes), 'count': counts})
+
+
+def compound_histogram(compound, labels=None, bins=HIST_BINS, value_range=HIST_RANGE, classes=LABELS):
+    """
+    Histogram compound dengan bin tetap (bin_start, bin_end, label, count).
+    Dengan `labels`, hitungan dipecah per label (untuk stacked bar).
+    """
+    low, high = value_range
+    compound = np.asarray(compound, dtype=np.float64)
+    valid = ~np.isnan(compound)
+    scaled = (np.where(valid, compound, low) - low) / (high - low) * bins
+    bin_index = np.clip(scaled.astype(np.int64), 0, bins - 1)
+    edges = np.linspace(low, high, bins + 1)
+
+    if labels is None:
+        counts = np.bincount(bin_index[valid], minlength=bins)
+        return pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
+
+    codes = encode_labels(labels, classes)
+    valid &= codes >= 0
+    counts = np.bincount(codes[valid] * bins + bin_index[valid], minlength=len(classes) * bins)
+    return pd.DataFrame({
+        'bin_start': np.tile(edges[:-1], len(classes)),
+        'bin_end': np.tile(edges[1:], len(classes)),
+        'label': np.repeat(list(classes), bins),
+        'count': counts,
+    })
+
+
+def segment_counts(segments, labels, freq=None, top=SEGMENT_TOP, classes=LABELS):
+    """
+    Jumlah label per segmen (kolom kategori, atau periode waktu jika `freq`
+    diisi, mis. 'M'/'W'). Segmen di luar `top` terbanyak digabung ke '(lainnya)';
+    segmen waktu selalu ditampilkan lengkap & berurutan.
+    """
+    segments = pd.Series(segments, copy=False).reset_index(drop=True)
+    if freq is not None:
+        segments = pd.to_datetime(segments, errors='coerce').dt.to_period(freq)
+    seg_codes, uniques = pd.factorize(segments, sort=freq is not None)
+    label_codes = encode_labels(labels, classes)
+    valid = (seg_codes >= 0) & (label_codes >= 0)
+    k = len(classes)
+    counts = np.bincount(seg_codes[valid] * k + label_codes[valid], minlength=len(uniques) * k)
+    counts = counts.reshape(len(uniques), k)
+    names = np.asarray(uniques.astype(str), dtype=object)
+
+    if freq is None and len(uniques) > top:
+        order = np.argsort(-counts.sum(axis=1), kind='stable')
+        keep, rest = order[:top], order[top:]
+        counts = np.vstack([counts[keep], counts[rest].sum(axis=0, keepdims=True)])
+        names = np.append(names[keep], OTHER_SEGMENT)
+
+    return pd.DataFrame({
+        'segment': np.repeat(names, k),
+        'label': np.tile(list(classes), len(names)),
+        'count': counts.ravel(),
+    })
+
+
+def summarize(df, label_column='label', compound_column='compound'):
+    """Agregat standar satu dataset terskor: jumlah label + histogram compound per label."""
+    return {
+        'rows': len(df),
+        'label_counts': label_counts(df[label_column]),
+        'histogram': compound_histogram(df[compound_column], df[label_column]),
+        'mean_compound': float(np.nanmean(df[compound_column].to_numpy(dtype=np.float64))) if len(df) else 0.0,
+    }
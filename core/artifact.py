@@ -0,0 +1,187 @@
+"""
+Artifact Feather (Arrow IPC, tanpa kompresi agar bisa di-memory-map) berisi
+dataset yang sudah diskor, dibuat sekali secara offline:
+
+    python -m core.artifact
+
+Halaman Argumentation memuat artifact ini dan hanya kembali ke TSV + scoring
+jika artifact tidak ada atau sudah basi (hash TSV / versi lexicon berubah).
+Artifact ulasan menyimpan fingerprint per teks, sehingga saat TSV bertambah
+hanya baris baru/berubah yang diskor lalu digabung dan artifact ditulis ulang.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from core.dataset import file_fingerprint, lexicon_version, score_reviews
+from core.scoring import LABELS, SCORE_COLUMNS, label_compound
+
+# --- CONFIGURATION ---
+ARTIFACT_VERSION = 3
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))
+REVIEWS_TSV = os.path.join(DATA_DIR, 'Data Ulasan.tsv')
+REVIEWS_ARTIFACT = os.path.join(DATA_DIR, 'scored_reviews.feather')
+VALIDATION_TSV = os.path.join(DATA_DIR, 'CM.tsv')
+VALIDATION_ARTIFACT = os.path.join(DATA_DIR, 'validation.feather')
+VALIDATION_FLOATS = ['compound', 'negatif', 'netral', 'positif']
+VALIDATION_LABELS = ['label_manual', 'label_vader']
+
+_META_KEY = b'vader_artifact'
+
+
+def _typed_reviews(df):
+    # Skor tetap float64 (bukan float32) agar label & kalibrasi threshold dari artifact
+    # identik dengan jalur bulk/CLI/server yang melabel compound float64 dari score_texts
+    df = df.copy()
+    for name in SCORE_COLUMNS:
+        df[name] = df[name].astype('float64')
+    df['label'] = pd.Categorical(df['label'], categories=LABELS)
+    return df
+
+
+def _typed_validation(df):
+    # Kolom 'scores' hanya string dict dari neg/neu/pos/compound, tidak perlu disimpan
+    df = df.drop(columns=['scores'], errors='ignore')
+    for name in VALIDATION_FLOATS:
+        if name in df.columns:
+            df[name] = df[name].astype('float64')
+    for name in VALIDATION_LABELS:
+        if name in df.columns:
+            df[name] = df[name].astype('category')
+    return df
+
+
+def write_artifact(df, path, meta):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    schema_meta = dict(table.schema.metadata or {})
+    schema_meta[_META_KEY] = json.dumps(meta).encode('utf-8')
+    table = table.replace_schema_metadata(schema_meta)
+    # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi;
+    # nama unik per proses & thread agar penulis bersamaan (sesi Streamlit lain, CLI) tidak saling menimpa
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_artifact(path):
+    """(DataFrame, metadata) dari artifact yang di-memory-map, atau (None, None) jika tidak ada."""
+    if not os.path.exists(path):
+        return None, None
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, memory_map=True)
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b'{}'))
+    return table.to_pandas(), meta
+
+
+def _source_meta(source_path):
+    _, _, content_hash = file_fingerprint(source_path)
+    return {
+        'artifact_version': ARTIFACT_VERSION,
+        'source': os.path.basename(source_path),
+        'source_sha256': content_hash,
+    }
+
+
+def _is_fresh(meta, expected):
+    return bool(meta) and all(meta.get(key) == value for key, value in expected.items())
+
+
+def _reviews_meta(source, df):
+    meta = _source_meta(source)
+    meta.update(lexicon_version=lexicon_version(), unique_texts=df.attrs.get('unique_texts', len(df)),
+                built_at=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    return meta
+
+
+def _reusable(meta):
+    # Skor lama hanya boleh dipakai ulang jika format artifact & lexicon sama
+    return _is_fresh(meta, {'artifact_version': ARTIFACT_VERSION, 'lexicon_version': lexicon_version()})
+
+
+def build_reviews_artifact(analyzer, source=REVIEWS_TSV, target=REVIEWS_ARTIFACT, incremental=True):
+    previous = None
+    if incremental:
+        previous, meta = read_artifact(target)
+        if previous is not None and not _reusable(meta):
+            previous = None
+    df = _typed_reviews(score_reviews(source, analyzer, previous=previous))
+    write_artifact(df, target, _reviews_meta(source, df))
+    return df
+
+
+def build_validation_artifact(source=VALIDATION_TSV, target=VALIDATION_ARTIFACT):
+    df = _typed_validation(pd.read_csv(source, sep='\t'))
+    meta = _source_meta(source)
+    meta.update(built_at=time.strftime('%Y-%m-%dT%H:%M:%S'))
+    write_artifact(df, target, meta)
+    return df
+
+
+def load_reviews(analyzer, source=REVIEWS_TSV, artifact=REVIEWS_ARTIFACT, persist=True):
+    """
+    Dataset ulasan terskor dari artifact. Jika TSV berubah, hanya teks baru/berubah
+    yang diskor (fingerprint) lalu artifact ditulis ulang (`persist`); tanpa artifact
+    yang cocok semua baris diskor dari TSV.
+    """
+    df, meta = read_artifact(artifact)
+    expected = _source_meta(source)
+    expected['lexicon_version'] = lexicon_version()
+    if df is not None and _is_fresh(meta, expected):
+        # Label dihitung ulang dari compound agar mengikuti threshold global terkini
+        df['label'] = pd.Categorical(label_compound(df['compound']), categories=LABELS)
+        df.attrs['unique_texts'] = meta.get('unique_texts', len(df))
+        df.attrs['rescored_texts'] = 0
+        df.attrs['source'] = 'artifact'
+        return df
+    previous = df if df is not None and _reusable(meta) else None
+    df = _typed_reviews(score_reviews(source, analyzer, previous=previous))
+    df.attrs['source'] = 'incremental' if previous is not None else 'tsv'
+    if persist:
+        try:
+            write_artifact(df, artifact, _reviews_meta(source, df))
+        except OSError:
+            # Folder data read-only (mis. deploy): tetap pakai hasil di memori
+            pass
+    return df
+
+
+def load_validation(source=VALIDATION_TSV, artifact=VALIDATION_ARTIFACT):
+    """Data pembanding Manual vs VADER (CM.tsv) dari artifact; fallback ke TSV."""
+    df, meta = read_artifact(artifact)
+    if df is not None and _is_fresh(meta, _source_meta(source)):
+        return df
+    return pd.read_csv(source, sep='\t')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build artifact Feather dataset VADER yang sudah diskor.")
+    parser.add_argument('--reviews', default=REVIEWS_TSV, help="TSV ulasan (default: data/Data Ulasan.tsv)")
+    parser.add_argument('--reviews-out', default=REVIEWS_ARTIFACT)
+    parser.add_argument('--validation', default=VALIDATION_TSV, help="TSV pembanding (default: data/CM.tsv)")
+    parser.add_argument('--validation-out', default=VALIDATION_ARTIFACT)
+    parser.add_argument('--full', action='store_true',
+                        help="Skor ulang semua baris (default: hanya teks baru/berubah)")
+    args = parser.parse_args(argv)
+
+    from core.lexicon import load_analyzer
+
+    started = time.perf_counter()
+    df = build_reviews_artifact(load_analyzer(), args.reviews, args.reviews_out, incremental=not args.full)
+    print(f"{args.reviews_out}: {len(df):,} baris, {df.attrs['rescored_texts']:,} teks diskor "
+          f"({os.path.getsize(args.reviews_out) / 1e6:.2f} MB)")
+    if os.path.exists(args.validation):
+        cm = build_validation_artifact(args.validation, args.validation_out)
+        print(f"{args.validation_out}: {len(cm):,} baris ({os.path.getsize(args.validation_out) / 1e6:.2f} MB)")
+    print(f"Selesai dalam {time.perf_counter() - started:.2f} detik.")
+
+
+if __name__ == '__main__':
+    main()
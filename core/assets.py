@@ -0,0 +1,167 @@
+"""
+Aset gambar siap saji: varian kecil (WebP, fallback PNG/JPEG) dibuat sekali
+pada ukuran tampil, disimpan di `.cache/img/` dan di-cache di memori per
+(path, mtime). Halaman cukup mengirim payload kecil yang sudah ter-encode,
+tanpa decode/resize gambar asli di setiap rerun.
+
+    python -m core.assets    # build semua varian di ASSET_VARIANTS
+"""
+import argparse
+import base64
+import html
+import io
+import os
+from functools import lru_cache
+
+from PIL import Image, ImageOps, features
+
+from core.lexicon import CACHE_DIR, ROOT_DIR
+
+# --- CONFIGURATION ---
+IMG_DIR = os.path.join(ROOT_DIR, 'img')
+ASSET_CACHE_DIR = os.path.join(CACHE_DIR, 'img')
+ASSET_CACHE_SIZE = 16
+DEFAULT_QUALITY = 80
+# Lebar varian (px) per file di img/: 2x lebar tampil agar tetap tajam di layar HiDPI.
+# Grafik (teks tipis) di-encode lossless, foto lossy.
+ASSET_VARIANTS = {
+    'profile.png': {'width': 440},
+    'f1.png': {'width': 630, 'lossless': True},
+}
+MIMETYPES = {'webp': 'image/webp', 'png': 'image/png', 'jpeg': 'image/jpeg'}
+
+
+def image_format(lossless=False):
+    """WebP jika Pillow mendukung; selain itu PNG (lossless) atau JPEG (foto)."""
+    if features.check('webp'):
+        return 'webp'
+    return 'png' if lossless else 'jpeg'
+
+
+def encode_variant(path, width, fmt, quality=DEFAULT_QUALITY, lossless=False):
+    """Decode `path`, perkecil ke lebar `width` (tidak pernah diperbesar) lalu encode ke `fmt`."""
+    with Image.open(path) as image:
+        if image.format == 'JPEG':
+            # Decode JPEG langsung di resolusi lebih kecil (jauh lebih cepat dari decode penuh)
+            image.draft('RGB', (width, width * 10))
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        if fmt == 'jpeg':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+        output = io.BytesIO()
+        if fmt == 'webp':
+            image.save(output, 'WEBP', quality=quality, lossless=lossless, method=6)
+        elif fmt == 'png':
+            image.save(output, 'PNG', optimize=True)
+        else:
+            image.save(output, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return output.getvalue()
+
+
+def variant_path(path, mtime_ns, width, fmt, quality=DEFAULT_QUALITY, lossless=False):
+    """Path varian di `.cache/img/`; mtime sumber & opsi encode ada di nama file."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    mode = 'lossless' if lossless else f"q{quality}"
+    return os.path.join(ASSET_CACHE_DIR, f"{stem}-{width}w-{mode}-{mtime_ns:x}.{fmt}")
+
+
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def _load_variant(path, mtime_ns, width, fmt, quality, lossless):
+    cached = variant_path(path, mtime_ns, width, fmt, quality, lossless)
+    try:
+        with open(cached, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    data = encode_variant(path, width, fmt, quality, lossless)
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cached}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cached)
+    except OSError:
+        # Direktori read-only: varian tetap dipakai dari memori
+        pass
+    return data
+
+
+def _resolve(name, width=None, lossless=None):
+    path = name if os.path.isabs(name) else os.path.join(IMG_DIR, name)
+    spec = ASSET_VARIANTS.get(os.path.basename(path), {})
+    width = width or spec.get('width')
+    if width is None:
+        raise ValueError(f"Lebar varian untuk {name!r} tidak diketahui; isi `width` atau ASSET_VARIANTS.")
+    lossless = spec.get('lossless', False) if lossless is None else lossless
+    return path, int(width), lossless
+
+
+def asset_bytes(name, width=None, quality=DEFAULT_QUALITY, lossless=None):
+    """
+    (bytes, mimetype) varian gambar `name` (nama file di img/ atau path absolut).
+    Hanya os.stat per panggilan; encode terjadi sekali per mtime file sumber.
+    """
+    path, width, lossless = _resolve(name, width, lossless)
+    fmt = image_format(lossless)
+    data = _load_variant(path, os.stat(path).st_mtime_ns, width, fmt, quality, lossless)
+    return data, MIMETYPES[fmt]
+
+
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def _data_uri(path, mtime_ns, width, quality, lossless):
+    fmt = image_format(lossless)
+    data = _load_variant(path, mtime_ns, width, fmt, quality, lossless)
+    return f"data:{MIMETYPES[fmt]};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def asset_data_uri(name, width=None, quality=DEFAULT_QUALITY, lossless=None):
+    """Varian gambar sebagai data URI (base64 di-cache bersama bytes-nya)."""
+    path, width, lossless = _resolve(name, width, lossless)
+    return _data_uri(path, os.stat(path).st_mtime_ns, width, quality, lossless)
+
+
+def asset_html(name, display_width=None, caption=None, alt=None, width=None):
+    """
+    Tag <img> (+ caption) untuk st.markdown(..., unsafe_allow_html=True).
+    Tidak lewat st.image karena st.image meng-encode ulang WebP ke PNG/JPEG
+    dan memperkecil varian 2x ke lebar tampil di setiap rerun.
+    """
+    uri = asset_data_uri(name, width)
+    alt = html.escape(alt if alt is not None else caption or os.path.basename(name))
+    size = f'width="{int(display_width)}"' if display_width else 'style="width: 100%; height: auto;"'
+    markup = f'<img src="{uri}" alt="{alt}" {size}>'
+    if caption:
+        block_width = f"{int(display_width)}px" if display_width else '100%'
+        markup = (
+            f'<figure style="width: {block_width}; margin: 0;">{markup}'
+            f'<figcaption style="text-align: center; font-size: 14px; color: rgba(49, 51, 63, 0.6);">'
+            f'{html.escape(caption)}</figcaption></figure>'
+        )
+    return markup
+
+
+def build_assets(names=None):
+    """Buat semua varian di ASSET_VARIANTS (build step); kembalikan {nama: (ukuran asli, ukuran varian)}."""
+    sizes = {}
+    for name in names or ASSET_VARIANTS:
+        path, _, _ = _resolve(name)
+        if not os.path.exists(path):
+            continue
+        data, _ = asset_bytes(name)
+        sizes[name] = (os.path.getsize(path), len(data))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build varian gambar kecil (WebP) untuk dashboard.")
+    parser.add_argument('names', nargs='*', help="Nama file di img/ (default: semua di ASSET_VARIANTS)")
+    args = parser.parse_args(argv)
+    for name, (original, variant) in build_assets(args.names).items():
+        print(f"{name}: {original / 1e3:,.1f} KB -> {variant / 1e3:,.1f} KB ({variant / original:.1%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Kalibrasi threshold compound terhadap label manual (CM.tsv).
+
+Skor compound per kelas manual diurutkan sekali; untuk setiap kandidat
+threshold jumlah prediksi Positive/Negative didapat dari np.searchsorted
+(hitungan kumulatif), sehingga seluruh grid (pos x neg) tersapu dalam
+O(n log n + grid) tanpa melabel ulang per kandidat.
+"""
+import numpy as np
+import pandas as pd
+
+from core.metrics import encode_labels, scores_from_confusion
+from core.scoring import LABELS, THRESHOLD_DECIMALS
+
+# --- CONFIGURATION ---
+SWEEP_STEP = 0.01
+SWEEP_MAX = 0.95
+SWEEP_METRICS = ['accuracy', 'macro_f1', 'weighted_f1']
+
+_POSITIVE, _NEUTRAL, _NEGATIVE = (LABELS.index(name) for name in ('Positive', 'Neutral', 'Negative'))
+
+
+def threshold_grid(step=SWEEP_STEP, maximum=SWEEP_MAX):
+    """Kandidat threshold positif 0..maximum (negatif = cerminannya)."""
+    return np.round(np.arange(0, maximum + step / 2, step), THRESHOLD_DECIMALS)
+
+
+def sweep_confusions(compound, true_codes, pos_grid, neg_grid):
+    """
+    Confusion matrix (len(pos_grid), len(neg_grid), k, k) untuk setiap pasangan
+    threshold; baris yang label manualnya tidak dikenal (-1) diabaikan.
+    """
+    compound = np.asarray(compound, dtype=np.float64)
+    true_codes = np.asarray(true_codes, dtype=np.int64)
+    valid = (true_codes >= 0) & ~np.isnan(compound)
+    compound, true_codes = compound[valid], true_codes[valid]
+    pos_grid = np.asarray(pos_grid, dtype=np.float64)
+    neg_grid = np.asarray(neg_grid, dtype=np.float64)
+
+    k = len(LABELS)
+    cms = np.zeros((len(pos_grid), len(neg_grid), k, k), dtype=np.int64)
+    for cls in range(k):
+        scores = np.sort(compound[true_codes == cls])
+        # Positive: compound >= pos, Negative: compound <= neg, sisanya Neutral
+        n_pos = len(scores) - np.searchsorted(scores, pos_grid, side='left')
+        n_neg = np.searchsorted(scores, neg_grid, side='right')
+        cms[:, :, cls, _POSITIVE] = n_pos[:, None]
+        cms[:, :, cls, _NEGATIVE] = n_neg[None, :]
+        cms[:, :, cls, _NEUTRAL] = len(scores) - n_pos[:, None] - n_neg[None, :]
+    return cms
+
+
+def sweep_thresholds(compound, y_true, pos_grid=None, neg_grid=None):
+    """
+    DataFrame long (pos_threshold, neg_threshold, accuracy, macro_f1, weighted_f1)
+    untuk semua pasangan threshold dengan neg < pos.
+    """
+    pos_grid = threshold_grid() if pos_grid is None else np.asarray(pos_grid, dtype=np.float64)
+    neg_grid = 0.0 - threshold_grid() if neg_grid is None else np.asarray(neg_grid, dtype=np.float64)
+    scores = scores_from_confusion(sweep_confusions(compound, encode_labels(y_true), pos_grid, neg_grid))
+    pos, neg = np.meshgrid(pos_grid, neg_grid, indexing='ij')
+    frame = pd.DataFrame({
+        'pos_threshold': pos.ravel(),
+        'neg_threshold': neg.ravel(),
+        **{name: scores[name].ravel() for name in SWEEP_METRICS},
+    })
+    # Pasangan neg >= pos membuat Neutral negatif (tumpang tindih), bukan label yang valid
+    return frame[frame['neg_threshold'] < frame['pos_threshold']].reset_index(drop=True)
+
+
+def symmetric_sweep(sweep):
+    """Baris sweep dengan neg = -pos (kurva satu dimensi untuk grafik)."""
+    mask = np.isclose(sweep['neg_threshold'], -sweep['pos_threshold'])
+    return sweep[mask].reset_index(drop=True)
+
+
+def best_thresholds(sweep, metric='macro_f1'):
+    """Baris sweep dengan metrik tertinggi (seri: pilih yang paling dekat ke 0)."""
+    ranked = sweep.assign(_width=sweep['pos_threshold'] - sweep['neg_threshold'])
+    ranked = ranked.sort_values([metric, '_width'], ascending=[False, True], kind='stable')
+    return ranked.iloc[0].drop('_width')
@@ -0,0 +1,138 @@
+"""
+Batch scoring tanpa browser, memakai pipeline yang sama dengan dashboard:
+
+    python -m core reviews.csv -c content -o hasil.parquet --workers 8
+    python -m core "data/Data Ulasan.tsv" -c content > hasil.csv
+"""
+import argparse
+import os
+import sys
+import time
+
+from core.export import EXPORT_FORMATS, format_from_path, write_result_stream
+from core.ingest import READ_CHUNK_ROWS, UPLOAD_TYPES, count_rows, detect_format, read_preview
+from core.parallel import DEFAULT_CHUNK_SIZE, default_workers, throughput
+from core.instrument import StageTimings
+from core.pipeline import score_file
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m core',
+        description="Skor sentimen VADER untuk file xlsx/csv/tsv/parquet/arrow secara streaming.",
+    )
+    parser.add_argument('inputs', nargs='+', help=f"File input ({', '.join(UPLOAD_TYPES)})")
+    parser.add_argument('-c', '--column', default='content', help="Kolom teks yang diskor (default: content)")
+    parser.add_argument('-o', '--output', default='-', help="File output; '-' = stdout (default)")
+    parser.add_argument('-f', '--format', choices=list(EXPORT_FORMATS),
+                        help="Format output (default: dari ekstensi output, stdout = csv)")
+    parser.add_argument('--keep-columns', nargs='*', default=None, metavar='COL',
+                        help="Kolom lain yang ikut ditulis (default: semua; tanpa nilai = hanya kolom teks)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Jumlah teks per chunk scoring (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument('--read-chunk-rows', type=int, default=READ_CHUNK_ROWS,
+                        help=f"Jumlah baris per chunk baca file (default: {READ_CHUNK_ROWS})")
+    parser.add_argument('-w', '--workers', type=int, default=default_workers(),
+                        help="Jumlah proses scoring (default: jumlah CPU)")
+    parser.add_argument('--no-dedup', dest='dedup', action='store_false',
+                        help="Skor setiap baris walau teksnya identik")
+    parser.add_argument('--lexicon', action='append', default=[], metavar='PATH',
+                        help="File overlay lexicon (kata<TAB>valence) di atas lexicon VADER; bisa diulang")
+    parser.add_argument('--translate', action='store_true',
+                        help="Deteksi bahasa & terjemahkan teks non-Inggris sebelum diskor")
+    parser.add_argument('--timings', metavar='JSON',
+                        help="Tulis waktu per tahap (read/score/label/write/...) ke file JSON")
+    parser.add_argument('--profile', action='store_true',
+                        help="Sertakan profil cProfile (fungsi teratas) di --timings dan stderr")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Tanpa laporan progress di stderr")
+    return parser
+
+
+def _log(args, message):
+    if not args.quiet:
+        print(message, file=sys.stderr, flush=True)
+
+
+def run(args, analyzer=None, translator=None):
+    if analyzer is None:
+        from core.lexicon import load_analyzer
+
+        analyzer = load_analyzer(args.lexicon)
+    if args.translate and translator is None:
+        from core.translation import Translator
+
+        translator = Translator()
+
+    fmt = args.format or format_from_path(args.output)
+    for path in args.inputs:
+        columns = read_preview(path, detect_format(path), n=1).columns.tolist()
+        if args.column not in columns:
+            raise ValueError(f"kolom '{args.column}' tidak ada di {path} (tersedia: {', '.join(map(str, columns))})")
+    totals = {'rows': 0, 'unique': 0}
+    timings = StageTimings(profile=args.profile) if (args.timings or args.profile) else None
+    started = time.perf_counter()
+
+    def parts():
+        for path in args.inputs:
+            file_format = detect_format(path)
+            total = count_rows(path, file_format) or 0
+            stats = {}
+            file_started = time.perf_counter()
+            results = score_file(
+                path, file_format, args.column, analyzer,
+                keep_columns=args.keep_columns,
+                read_chunk_rows=args.read_chunk_rows,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                dedup=args.dedup,
+                translator=translator if args.translate else None,
+                stats=stats,
+                timings=timings,
+            )
+            for rows_done, part in results:
+                rate, eta = throughput(rows_done, max(total, rows_done), time.perf_counter() - file_started)
+                _log(args, f"{path}: {rows_done:,}/~{max(total, rows_done):,} baris • "
+                           f"{rate:,.0f} baris/detik • ETA {eta:,.1f} detik")
+                # Waktu sampai generator dilanjutkan = waktu menulis potongan ini
+                write_started = time.perf_counter()
+                yield part
+                if timings is not None:
+                    timings.add('write', time.perf_counter() - write_started, len(part))
+            totals['rows'] += stats.get('rows', 0)
+            totals['unique'] += stats.get('unique', 0)
+
+    target = sys.stdout.buffer if args.output == '-' else args.output
+    if timings is None:
+        rows = write_result_stream(parts(), target, fmt)
+    else:
+        with timings.profiled():
+            rows = write_result_stream(parts(), target, fmt)
+    elapsed = time.perf_counter() - started
+    _log(args, f"Selesai: {rows:,} baris ({totals['unique']:,} teks unik) dalam {elapsed:,.2f} detik "
+               f"({rows / elapsed if elapsed else 0:,.0f} baris/detik).")
+    if timings is not None:
+        _log(args, timings.frame().to_string(index=False, float_format=lambda value: f"{value:,.3f}"))
+        if args.profile:
+            _log(args, timings.profile_text())
+        if args.timings:
+            with open(args.timings, 'w', encoding='utf-8') as f:
+                f.write(timings.to_json(indent=2))
+    return rows
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        run(args)
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Output dipotong (mis. `| head`): alihkan stdout ke devnull agar flush saat exit tidak error
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import hashlib
+import os
+from functools import lru_cache
+from importlib import metadata
+
+import numpy as np
+import pandas as pd
+import vaderSentiment.vaderSentiment as vader_module
+
+from core.scoring import SCORE_COLUMNS, dedupe_texts, score_texts, scores_to_frame, take_scores
+
+# --- CONFIGURATION ---
+_HASH_CHUNK = 1 << 20
+FINGERPRINT_COLUMN = 'fingerprint'
+
+# Memo hash konten per (path, mtime, size) agar file tidak di-hash ulang tiap rerun
+_hash_memo = {}
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    """Kembalikan (path absolut, mtime_ns, sha256) sebagai cache key dataset."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    memo_key = (path, stat.st_mtime_ns, stat.st_size)
+    content_hash = _hash_memo.get(memo_key)
+    if content_hash is None:
+        content_hash = _sha256_file(path)
+        _hash_memo[memo_key] = content_hash
+    return path, stat.st_mtime_ns, content_hash
+
+
+@lru_cache(maxsize=1)
+def lexicon_version():
+    """Versi vaderSentiment + hash file lexicon/emoji bawaannya."""
+    try:
+        version = metadata.version('vaderSentiment')
+    except metadata.PackageNotFoundError:
+        version = 'unknown'
+    lexicon_dir = os.path.dirname(os.path.abspath(vader_module.__file__))
+    digest = hashlib.sha256()
+    for name in ('vader_lexicon.txt', 'emoji_utf8_lexicon.txt'):
+        lexicon_path = os.path.join(lexicon_dir, name)
+        if os.path.exists(lexicon_path):
+            digest.update(_sha256_file(lexicon_path).encode())
+    return f"{version}+{digest.hexdigest()[:12]}"
+
+
+def text_fingerprints(texts):
+    """Fingerprint uint64 per teks (SipHash pandas dengan key tetap), stabil antar proses/run."""
+    return pd.util.hash_array(np.asarray(texts, dtype=object))
+
+
+def _reuse_scores(uniques, fingerprints, previous, analyzer):
+    """
+    Skor per teks unik: ambil dari `previous` (DataFrame terskor dengan kolom
+    fingerprint) jika fingerprint-nya sudah ada, skor VADER hanya untuk sisanya.
+    Kembalikan (dict kolom skor, jumlah teks yang diskor ulang).
+    """
+    lookup = pd.Index(previous[FINGERPRINT_COLUMN].to_numpy())
+    positions = np.arange(len(lookup))
+    if not lookup.is_unique:
+        keep = ~lookup.duplicated()
+        lookup, positions = lookup[keep], positions[keep]
+    found = lookup.get_indexer(fingerprints)
+    hit = found >= 0
+    rows = positions[found[hit]]
+
+    columns = {name: np.empty(len(uniques), dtype=np.float64) for name in SCORE_COLUMNS}
+    for name in SCORE_COLUMNS:
+        columns[name][hit] = previous[name].to_numpy()[rows]
+    missing = np.flatnonzero(~hit)
+    if missing.size:
+        fresh = score_texts([uniques[i] for i in missing], analyzer)
+        for name in SCORE_COLUMNS:
+            columns[name][missing] = fresh[name]
+    return columns, int(missing.size)
+
+
+def score_reviews(path, analyzer, text_column='content', previous=None):
+    """
+    Baca TSV ulasan lalu hitung neg/neu/pos/compound dan label VADER.
+    Setiap teks unik hanya diskor sekali; jumlahnya disimpan di df.attrs['unique_texts'].
+
+    Dengan `previous` (hasil skor sebelumnya yang punya kolom fingerprint), hanya
+    teks baru/berubah yang diskor; jumlahnya di df.attrs['rescored_texts'].
+    """
+    df = pd.read_csv(path, sep='\t')
+    uniques, codes = dedupe_texts(df[text_column])
+    fingerprints = text_fingerprints(uniques)
+    if previous is not None and FINGERPRINT_COLUMN in previous.columns:
+        columns, rescored = _reuse_scores(uniques, fingerprints, previous, analyzer)
+    else:
+        columns, rescored = score_texts(uniques, analyzer), len(uniques)
+    scored = scores_to_frame(take_scores(columns, codes), index=df.index)
+    scored[FINGERPRINT_COLUMN] = fingerprints[codes]
+    df = pd.concat([df, scored], axis=1)
+    df.attrs['unique_texts'] = len(uniques)
+    df.attrs['rescored_texts'] = rescored
+    return df
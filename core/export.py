@@ -0,0 +1,175 @@
+import io
+import os
+
+import pandas as pd
+
+from core.scoring import LABELS
+
+# --- CONFIGURATION ---
+EXPORT_FORMATS = {
+    'xlsx': {
+        'label': 'Excel (.xlsx)',
+        'ext': 'xlsx',
+        'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    },
+    'csv': {'label': 'CSV (.csv)', 'ext': 'csv', 'mime': 'text/csv'},
+    'parquet': {'label': 'Parquet (.parquet)', 'ext': 'parquet', 'mime': 'application/vnd.apache.parquet'},
+    'jsonl': {'label': 'JSON Lines (.jsonl)', 'ext': 'jsonl', 'mime': 'application/x-ndjson'},
+}
+# Jumlah baris yang dikonversi ke objek Python sekaligus saat menulis xlsx
+EXCEL_WRITE_CHUNK = 10000
+
+
+def format_from_path(path, default='csv'):
+    """Format ekspor dari ekstensi file output ('-' / tanpa ekstensi -> default)."""
+    ext = os.path.splitext(str(path))[1].lower().lstrip('.')
+    return ext if ext in EXPORT_FORMATS else default
+
+
+def _flat(df):
+    # Kolom dict/list (mis. kolom 'scores' format lama) tidak ikut diekspor;
+    # cukup cek nilai pertama yang tidak kosong per kolom object
+    nested = [name for name in df.columns
+              if df[name].dtype == object
+              and isinstance(next(iter(df[name].dropna()), None), (dict, list))]
+    return df.drop(columns=nested) if nested else df
+
+
+def _write_excel_parts(parts, handle, sheet_name='Sentiment Results'):
+    from openpyxl import Workbook
+
+    # Workbook write-only: baris langsung di-stream, sheet tidak disimpan di memori
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    header = None
+    rows = 0
+    for part in parts:
+        part = _flat(part)
+        if header is None:
+            header = list(part.columns)
+            sheet.append([str(name) for name in header])
+        for start in range(0, len(part), EXCEL_WRITE_CHUNK):
+            block = part.iloc[start:start + EXCEL_WRITE_CHUNK][header].astype(object)
+            block = block.where(block.notna(), None)
+            for row in block.itertuples(index=False, name=None):
+                sheet.append(row)
+        rows += len(part)
+    workbook.save(handle)
+    return rows
+
+
+def _arrow_table(part):
+    import pyarrow as pa
+
+    # Tipe kolom per potongan bergantung isi chunk (kolom kosong = float NaN / null,
+    # object campuran); object & kolom tanpa nilai -> string, lalu large_string agar stabil
+    unstable = [name for name in part.columns
+                if part[name].dtype == object or (len(part) and part[name].isna().all())]
+    part = part.astype({name: pd.StringDtype() for name in unstable})
+    table = pa.Table.from_pandas(part, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) or pa.types.is_string(field.type):
+            table = table.set_column(i, field.with_type(pa.large_string()), table.column(i).cast(pa.large_string()))
+    return table
+
+
+def _conform(table, schema):
+    """Samakan tabel potongan berikutnya dengan schema potongan pertama (ParquetWriter butuh satu schema)."""
+    import pyarrow as pa
+
+    columns = []
+    for field in schema:
+        column = table.column(field.name)
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(
+                    f"Kolom '{field.name}' berubah tipe antar chunk ({field.type} -> {column.type}); "
+                    f"perbesar --read-chunk-rows atau pilih format lain: {e}"
+                ) from e
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _write_parquet_parts(parts, handle):
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    try:
+        for part in parts:
+            part = _flat(part)
+            if 'label' in part.columns:
+                part = part.assign(label=pd.Categorical(part['label'], categories=LABELS))
+            table = _arrow_table(part)
+            if writer is None:
+                writer = pq.ParquetWriter(handle, table.schema)
+            else:
+                table = _conform(table, writer.schema)
+            writer.write_table(table)
+            rows += len(part)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def write_result_stream(parts, target, fmt):
+    """
+    Tulis iterator DataFrame hasil ke `target` (path atau file biner) secara
+    bertahap per potongan, sehingga hasil tidak perlu digabung di memori.
+    Kembalikan jumlah baris yang ditulis.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format ekspor '{fmt}' tidak didukung. Gunakan: {', '.join(EXPORT_FORMATS)}")
+
+    own_handle = isinstance(target, (str, os.PathLike))
+    handle = open(target, 'wb') if own_handle else target
+    try:
+        if fmt == 'xlsx':
+            return _write_excel_parts(parts, handle)
+        if fmt == 'parquet':
+            return _write_parquet_parts(parts, handle)
+
+        rows = 0
+        wrote_header = False
+        for part in parts:
+            part = _flat(part)
+            if fmt == 'csv':
+                # Flag, bukan rows == 0: potongan pertama yang kosong tetap menulis header sekali
+                text = part.to_csv(index=False, header=not wrote_header)
+                wrote_header = True
+            else:
+                text = part.to_json(orient='records', lines=True, force_ascii=False)
+                if text and not text.endswith('\n'):
+                    text += '\n'
+            handle.write(text.encode('utf-8'))
+            rows += len(part)
+        return rows
+    finally:
+        if own_handle:
+            handle.close()
+
+
+def write_excel(df, target, sheet_name='Sentiment Results'):
+    """Tulis DataFrame ke xlsx dengan workbook write-only openpyxl."""
+    own_handle = isinstance(target, (str, os.PathLike))
+    handle = open(target, 'wb') if own_handle else target
+    try:
+        return _write_excel_parts([df], handle, sheet_name=sheet_name)
+    finally:
+        if own_handle:
+            handle.close()
+
+
+def write_results(df, target, fmt):
+    """Tulis hasil ke path / file biner `target` dalam format EXPORT_FORMATS."""
+    return write_result_stream([df], target, fmt)
+
+
+def export_bytes(df, fmt):
+    """Bytes hasil ekspor untuk st.download_button."""
+    output = io.BytesIO()
+    write_results(df, output, fmt)
+    return output.getvalue()
@@ -0,0 +1,174 @@
+import hashlib
+import os
+
+import pandas as pd
+
+# --- CONFIGURATION ---
+# Ekstensi yang diterima uploader / CLI -> format internal
+FORMATS = {
+    'xlsx': 'xlsx',
+    'csv': 'csv',
+    'tsv': 'tsv',
+    'parquet': 'parquet',
+    'feather': 'arrow',
+    'arrow': 'arrow',
+}
+UPLOAD_TYPES = list(FORMATS)
+READ_CHUNK_ROWS = 50000
+_HASH_CHUNK = 1 << 20
+
+
+def detect_format(name):
+    """Format file dari ekstensinya ('xlsx', 'csv', 'tsv', 'parquet', 'arrow')."""
+    ext = os.path.splitext(str(name))[1].lower().lstrip('.')
+    if ext not in FORMATS:
+        raise ValueError(f"Format file '.{ext}' tidak didukung. Gunakan: {', '.join(UPLOAD_TYPES)}")
+    return FORMATS[ext]
+
+
+def _rewind(source):
+    # File-like (mis. UploadedFile Streamlit) dibaca ulang dari awal di setiap fungsi
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    return source
+
+
+def _csv_sep(fmt):
+    return '\t' if fmt == 'tsv' else ','
+
+
+def _xlsx_rows(source):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_rewind(source), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, ())
+        header = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+        yield header
+        yield from rows
+    finally:
+        workbook.close()
+
+
+def content_hash(source):
+    """sha256 isi file (path atau file-like), dibaca per blok 1 MB."""
+    digest = hashlib.sha256()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(block)
+    else:
+        source = _rewind(source)
+        for block in iter(lambda: source.read(_HASH_CHUNK), b''):
+            digest.update(block)
+        source.seek(0)
+    return digest.hexdigest()
+
+
+def read_preview(source, fmt, n=5):
+    """Beberapa baris pertama (semua kolom) tanpa membaca seluruh file."""
+    if fmt == 'xlsx':
+        # openpyxl read-only: hanya n baris pertama yang di-parse, bukan seluruh workbook
+        rows = _xlsx_rows(source)
+        try:
+            header = next(rows)
+            data = [row for _, row in zip(range(n), rows)]
+        finally:
+            rows.close()
+        return pd.DataFrame(data, columns=header)
+    if fmt in ('csv', 'tsv'):
+        return pd.read_csv(_rewind(source), sep=_csv_sep(fmt), nrows=n)
+    return next(iter_frames(source, fmt, chunk_size=n), pd.DataFrame())
+
+
+def count_rows(source, fmt):
+    """
+    Jumlah baris data untuk progress bar. Parquet/Arrow/xlsx dari metadata;
+    CSV/TSV diperkirakan dari jumlah baris fisik (bisa lebih jika ada
+    newline di dalam field ber-quote).
+    """
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(_rewind(source)).metadata.num_rows
+    if fmt == 'arrow':
+        import pyarrow.ipc as ipc
+
+        # Jumlah baris dari metadata batch, tanpa memuat isi kolom
+        return ipc.open_file(_rewind(source)).count_rows()
+    if fmt == 'xlsx':
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(_rewind(source), read_only=True)
+        try:
+            max_row = workbook.active.max_row
+        finally:
+            workbook.close()
+        return max(max_row - 1, 0) if max_row else None
+
+    source = _rewind(source)
+    if hasattr(source, 'getbuffer'):
+        # Hitung langsung di memoryview buffer upload per blok (tanpa menyalin seluruh isi file)
+        with source.getbuffer() as data:
+            lines = sum(data[start:start + _HASH_CHUNK].tobytes().count(b'\n')
+                        for start in range(0, len(data), _HASH_CHUNK))
+            lines += 1 if len(data) and data[-1] != ord('\n') else 0
+    else:
+        with open(source, 'rb') as f:
+            lines = sum(block.count(b'\n') for block in iter(lambda: f.read(1 << 20), b''))
+    return max(lines - 1, 0)
+
+
+def iter_frames(source, fmt, columns=None, chunk_size=READ_CHUNK_ROWS):
+    """
+    Baca file per chunk DataFrame (maks `chunk_size` baris), hanya kolom `columns`
+    jika diberikan. CSV/TSV lewat read_csv(chunksize), Parquet per row-group batch,
+    Arrow/Feather per record batch, xlsx lewat openpyxl read-only.
+    """
+    if fmt in ('csv', 'tsv'):
+        yield from pd.read_csv(_rewind(source), sep=_csv_sep(fmt), usecols=columns, chunksize=chunk_size)
+
+    elif fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(_rewind(source))
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+
+    elif fmt == 'arrow':
+        import pyarrow.ipc as ipc
+
+        options = None
+        if columns is not None:
+            # Proyeksi saat baca: hanya buffer kolom `columns` yang dimuat dari file
+            schema = ipc.open_file(_rewind(source)).schema
+            missing = [name for name in columns if schema.get_field_index(name) < 0]
+            if missing:
+                raise KeyError(f"Kolom tidak ditemukan: {missing}")
+            options = ipc.IpcReadOptions(included_fields=sorted({schema.get_field_index(name) for name in columns}))
+        reader = ipc.open_file(_rewind(source), options=options)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                # included_fields mengikuti urutan skema; kembalikan ke urutan `columns`
+                batch = batch.select(columns)
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size).to_pandas()
+
+    elif fmt == 'xlsx':
+        rows = _xlsx_rows(source)
+        header = next(rows)
+        wanted = header if columns is None else list(columns)
+        positions = [header.index(name) for name in wanted]
+        buffer = []
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in positions])
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=wanted)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=wanted)
+
+    else:
+        raise ValueError(f"Format '{fmt}' tidak didukung.")
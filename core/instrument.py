@@ -0,0 +1,188 @@
+"""
+Instrumentasi ringan per tahap pipeline (baca file, deteksi bahasa, terjemahan,
+scoring, labelling, render tabel, ekspor): wall time, jumlah baris, delta RSS
+dan jumlah panggilan. Opsional menangkap profil cProfile untuk satu job.
+Hasilnya bisa ditampilkan sebagai DataFrame atau diekspor ke JSON.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# --- CONFIGURATION ---
+PROFILE_LIMIT = 30
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss_mb():
+    """RSS proses saat ini (MB); None jika platform tidak mendukung (mis. Windows)."""
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/statm', 'rb') as f:
+                return int(f.read().split()[1]) * _PAGE_SIZE / (1 << 20)
+        except (OSError, ValueError, IndexError):
+            return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Selain Linux hanya tersedia peak RSS (bytes di macOS)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1 << 20)
+
+
+class StageTimings:
+    """
+    Akumulator waktu per tahap. Tahap dengan nama sama dijumlahkan (seconds,
+    rows, rss_delta_mb) dan dihitung `calls`-nya, sehingga tahap per chunk
+    terlihat sebagai satu baris ringkasan.
+    """
+
+    def __init__(self, profile=False):
+        self.stages = {}
+        self.created_at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self._profiler = cProfile.Profile() if profile else None
+        self._profiled = False
+
+    def add(self, name, seconds, rows=0, rss_delta_mb=None):
+        stage = self.stages.setdefault(name, {'seconds': 0.0, 'rows': 0, 'calls': 0, 'rss_delta_mb': 0.0})
+        stage['seconds'] += seconds
+        stage['rows'] += int(rows or 0)
+        stage['calls'] += 1
+        if rss_delta_mb is not None:
+            stage['rss_delta_mb'] += rss_delta_mb
+
+    @contextmanager
+    def stage(self, name, rows=0):
+        """
+        `with timings.stage('export', rows=n): ...`. Jika jumlah baris baru
+        diketahui di dalam blok: `with timings.stage('load') as info: ...; info['rows'] = len(df)`.
+        """
+        info = {'rows': rows}
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        try:
+            yield info
+        finally:
+            seconds = time.perf_counter() - started
+            rss_after = current_rss_mb()
+            delta = None if rss_before is None or rss_after is None else rss_after - rss_before
+            self.add(name, seconds, info['rows'], delta)
+
+    def iter(self, name, iterable, rows=len):
+        """Bungkus iterator: waktu setiap next() dicatat ke tahap `name`, baris = rows(item)."""
+        iterator = iter(iterable)
+        try:
+            while True:
+                rss_before = current_rss_mb()
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                seconds = time.perf_counter() - started
+                rss_after = current_rss_mb()
+                delta = None if rss_before is None or rss_after is None else rss_after - rss_before
+                self.add(name, seconds, rows(item) if rows else 0, delta)
+                yield item
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+
+    @property
+    def profiling(self):
+        return self._profiler is not None
+
+    def start_profile(self):
+        """Mulai cProfile (no-op jika dibuat tanpa profile=True); pasangkan dengan stop_profile()."""
+        if self._profiler is not None:
+            self._profiler.enable()
+
+    def stop_profile(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiled = True
+
+    @contextmanager
+    def profiled(self):
+        """Aktifkan cProfile selama blok (hanya jika dibuat dengan profile=True)."""
+        self.start_profile()
+        try:
+            yield
+        finally:
+            self.stop_profile()
+
+    def profile_rows(self, limit=PROFILE_LIMIT):
+        """Fungsi teratas menurut cumulative time dari profil cProfile (list of dict)."""
+        if not self._profiled:
+            return []
+        stats = pstats.Stats(self._profiler)
+        rows = []
+        for (filename, line, func), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': f"{os.path.basename(filename)}:{line}({func})",
+                'calls': calls,
+                'tottime': round(total, 6),
+                'cumtime': round(cumulative, 6),
+            })
+        rows.sort(key=lambda row: row['cumtime'], reverse=True)
+        return rows[:limit]
+
+    def profile_text(self, limit=PROFILE_LIMIT):
+        """Laporan pstats (cumulative) sebagai teks."""
+        if not self._profiled:
+            return ''
+        output = io.StringIO()
+        pstats.Stats(self._profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        return output.getvalue()
+
+    @property
+    def total_seconds(self):
+        return sum(stage['seconds'] for stage in self.stages.values())
+
+    def frame(self):
+        """DataFrame per tahap: seconds, share, rows, rows_per_sec, calls, rss_delta_mb."""
+        columns = ['stage', 'seconds', 'share', 'rows', 'rows_per_sec', 'calls', 'rss_delta_mb']
+        if not self.stages:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame([{'stage': name, **stage} for name, stage in self.stages.items()])
+        total = df['seconds'].sum()
+        df['share'] = df['seconds'] / total if total else 0.0
+        df['rows_per_sec'] = (df['rows'] / df['seconds']).where((df['rows'] > 0) & (df['seconds'] > 0))
+        return df[columns]
+
+    def to_dict(self):
+        return {
+            'created_at': self.created_at,
+            'total_seconds': round(self.total_seconds, 6),
+            'stages': [
+                {'stage': name, **{key: round(value, 6) if isinstance(value, float) else value
+                                   for key, value in stage.items()}}
+                for name, stage in self.stages.items()
+            ],
+            'profile': self.profile_rows(),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+@contextmanager
+def stage(timings, name, rows=0):
+    """Seperti StageTimings.stage, tetapi no-op jika `timings` None."""
+    if timings is None:
+        yield {'rows': rows}
+        return
+    with timings.stage(name, rows) as info:
+        yield info
+
+
+def timed_iter(timings, name, iterable, rows=len):
+    """Seperti StageTimings.iter, tetapi langsung mengembalikan `iterable` jika `timings` None."""
+    return iterable if timings is None else timings.iter(name, iterable, rows)
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+
+import langid
+import numpy as np
+import pandas as pd
+
+from core.instrument import stage
+from core.scoring import as_text_list
+from core.translation import translate_concurrent
+
+# --- CONFIGURATION ---
+TARGET_LANG = 'en'
+LANG_CACHE_SIZE = 100000
+# Batas total waktu terjemahan bulk (detik); sisa batch memakai teks asli
+TRANSLATE_TIMEOUT = 120
+
+# Cache hasil langid per teks unik (dipakai ulang antar file/rerun)
+_lang_cache = OrderedDict()
+# Live Demo (per kalimat) & server memanggil detect_language dari banyak thread sekaligus
+_cache_lock = threading.Lock()
+
+
+def detect_language(text):
+    with _cache_lock:
+        lang = _lang_cache.get(text)
+        if lang is not None:
+            _lang_cache.move_to_end(text)
+            return lang
+    # langid di luar lock: thread lain tidak menunggu klasifikasi teks yang berbeda
+    lang = langid.classify(text)[0]
+    with _cache_lock:
+        _lang_cache[text] = lang
+        if len(_lang_cache) > LANG_CACHE_SIZE:
+            _lang_cache.popitem(last=False)
+    return lang
+
+
+def detect_languages(texts):
+    """
+    Kode bahasa untuk setiap teks. Teks difaktorisasi menjadi nilai unik,
+    langid hanya dijalankan sekali per teks unik, lalu hasilnya disebar
+    kembali ke semua baris lewat indeks integer.
+    """
+    codes, uniques = pd.factorize(np.asarray(as_text_list(texts), dtype=object))
+    unique_langs = np.array([detect_language(text) for text in uniques], dtype=object)
+    return unique_langs[codes] if len(codes) else np.empty(0, dtype=object)
+
+
+def translate_rows(texts, translator, langs=None, target=TARGET_LANG, max_workers=4,
+                   timeout=TRANSLATE_TIMEOUT, timings=None, cancel=None):
+    """
+    Deteksi bahasa lalu terjemahkan hanya teks unik non-`target`.
+
+    Kembalikan (teks siap skor, kode bahasa, mask baris yang diterjemahkan).
+    Teks yang gagal/timeout diterjemahkan tetap memakai teks asli dan tidak
+    dihitung di mask (hanya baris yang teksnya benar-benar berubah).
+    Waktu deteksi & terjemahan dicatat ke `timings` (StageTimings) jika diberikan;
+    `cancel` diteruskan ke translate_concurrent.
+    """
+    texts = np.asarray(as_text_list(texts), dtype=object)
+    if langs is None:
+        with stage(timings, 'detect_language', rows=len(texts)):
+            langs = detect_languages(texts)
+    else:
+        langs = np.asarray(langs, dtype=object)
+    foreign = langs != target
+    if not foreign.any():
+        return texts, langs, foreign
+
+    codes, uniques = pd.factorize(texts[foreign])
+    with stage(timings, 'translate', rows=len(uniques)):
+        translated = translate_concurrent(list(uniques), translator, target=target,
+                                          max_workers=max_workers, timeout=timeout, cancel=cancel)
+    result = texts.copy()
+    result[foreign] = np.asarray(translated, dtype=object)[codes]
+    return result, langs, foreign & (result != texts)
@@ -0,0 +1,138 @@
+"""
+Lexicon VADER terkompilasi: dict kata -> valence dan emoji -> deskripsi disimpan
+dalam format marshal di `.cache/`, sehingga analyzer baru (rerun Streamlit,
+worker pool, CLI) tidak perlu mem-parse ulang file teks lexicon. Set booster &
+negasi sudah berupa konstanta modul vaderSentiment dan tidak perlu dikompilasi.
+
+Overlay lexicon domain (file `kata<TAB>valence`, mis. data/lexicons/*.tsv)
+ditumpuk di atas lexicon dasar; hasil gabungannya di-cache per hash konten
+overlay sehingga memilih overlay yang sama tidak mem-parse ulang apa pun.
+
+    python -m core.lexicon    # build ulang file terkompilasi
+"""
+import marshal
+import os
+from functools import lru_cache
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from core.dataset import file_fingerprint, lexicon_version
+
+# --- CONFIGURATION ---
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache')
+OVERLAY_DIR = os.path.join(ROOT_DIR, 'data', 'lexicons')
+COMPILED_FORMAT = 1
+OVERLAY_CACHE_SIZE = 16
+
+
+def compiled_lexicon_path():
+    return os.path.join(CACHE_DIR, f"lexicon-{lexicon_version()}.marshal")
+
+
+def compile_lexicon(path=None):
+    """Parse lexicon bawaan sekali lalu simpan hasilnya (marshal) ke `path`."""
+    path = path or compiled_lexicon_path()
+    analyzer = SentimentIntensityAnalyzer()
+    data = {
+        'format': COMPILED_FORMAT,
+        'version': lexicon_version(),
+        'lexicon': analyzer.lexicon,
+        'emojis': analyzer.emojis,
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Direktori read-only: tetap kembalikan hasil parse tanpa menyimpan
+        pass
+    return data
+
+
+@lru_cache(maxsize=1)
+def load_compiled_lexicon():
+    """Dict lexicon/emoji terkompilasi; dibagi read-only oleh semua analyzer di proses ini."""
+    path = compiled_lexicon_path()
+    try:
+        with open(path, 'rb') as f:
+            data = marshal.loads(f.read())
+        if data.get('format') == COMPILED_FORMAT and data.get('version') == lexicon_version():
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return compile_lexicon(path)
+
+
+def list_overlays(directory=OVERLAY_DIR):
+    """Path file overlay (.tsv/.txt) yang tersedia, urut nama."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(('.tsv', '.txt'))
+    )
+
+
+def read_overlay(path):
+    """Parse overlay `kata<TAB>valence` (baris kosong / diawali # diabaikan)."""
+    entries = {}
+    with open(path, encoding='utf-8-sig') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            if len(parts) < 2:
+                raise ValueError(f"{os.path.basename(path)}:{line_no}: format harus 'kata<TAB>valence'")
+            try:
+                entries[parts[0].strip().lower()] = float(parts[1])
+            except ValueError:
+                raise ValueError(f"{os.path.basename(path)}:{line_no}: valence '{parts[1]}' bukan angka") from None
+    return entries
+
+
+def overlay_key(overlays):
+    """Cache key overlay: tuple (path absolut, sha256 konten) sesuai urutan tumpukan."""
+    return tuple((path, content_hash) for path, _, content_hash in map(file_fingerprint, overlays))
+
+
+@lru_cache(maxsize=OVERLAY_CACHE_SIZE)
+def _overlay_lexicon(key):
+    lexicon = dict(load_compiled_lexicon()['lexicon'])
+    for path, _ in key:
+        lexicon.update(read_overlay(path))
+    return lexicon
+
+
+def load_analyzer(overlays=()):
+    """
+    SentimentIntensityAnalyzer dari lexicon terkompilasi, tanpa parse file teks
+    lexicon. `overlays` = path file overlay yang ditumpuk berurutan (yang terakhir
+    menang); kombinasi yang sama dipakai ulang dari cache selama kontennya sama.
+    """
+    data = load_compiled_lexicon()
+    key = overlay_key(overlays)
+    analyzer = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    analyzer.lexicon = _overlay_lexicon(key) if key else data['lexicon']
+    analyzer.emojis = data['emojis']
+    # Dipakai worker pool untuk membangun analyzer yang sama di proses lain
+    analyzer.overlay_key = key
+    return analyzer
+
+
+def analyzer_overlays(analyzer):
+    """Path overlay yang dipakai `analyzer` (kosong untuk lexicon bawaan)."""
+    return tuple(path for path, _ in getattr(analyzer, 'overlay_key', ()))
+
+
+def main():
+    path = compiled_lexicon_path()
+    data = compile_lexicon(path)
+    print(f"{path}: {len(data['lexicon']):,} kata, {len(data['emojis']):,} emoji")
+
+
+if __name__ == '__main__':
+    main()
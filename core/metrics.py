@@ -0,0 +1,114 @@
+"""
+Metrik evaluasi label Manual vs VADER (confusion matrix, precision/recall/F1,
+rata-rata macro & weighted, bootstrap CI) dengan label yang di-encode ke
+integer sehingga semua hitungan berupa operasi NumPy, bukan loop per baris.
+"""
+import numpy as np
+import pandas as pd
+
+from core.scoring import LABELS
+
+# --- CONFIGURATION ---
+# Singkatan label di CM.tsv -> label lengkap VADER
+LABEL_ALIASES = {'P': 'Positive', 'NT': 'Neutral', 'N': 'Negative'}
+BOOTSTRAP_SAMPLES = 2000
+BOOTSTRAP_ALPHA = 0.05
+REPORT_COLUMNS = ['precision', 'recall', 'f1', 'support']
+
+
+def encode_labels(labels, classes=LABELS):
+    """Label (singkatan/lengkap) -> kode integer sesuai urutan `classes`; -1 untuk label asing/NaN."""
+    # Alias dipetakan per nilai unik saja, lalu disebar ke baris lewat kode factorize
+    codes, uniques = pd.factorize(np.asarray(labels, dtype=object))
+    mapped = pd.Categorical([LABEL_ALIASES.get(v, v) for v in uniques], categories=classes).codes
+    mapped = np.append(mapped, -1).astype(np.int64)
+    return mapped[codes]
+
+
+def confusion_matrix(true_codes, pred_codes, n_classes=len(LABELS)):
+    """Matriks k x k (baris = manual, kolom = prediksi) lewat satu np.bincount."""
+    true_codes = np.asarray(true_codes, dtype=np.int64)
+    pred_codes = np.asarray(pred_codes, dtype=np.int64)
+    valid = (true_codes >= 0) & (pred_codes >= 0)
+    flat = true_codes[valid] * n_classes + pred_codes[valid]
+    return np.bincount(flat, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
+def _safe_divide(num, den):
+    num = np.asarray(num, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros_like(num), where=np.asarray(den) > 0)
+
+
+def scores_from_confusion(cm):
+    """
+    Precision/recall/F1 per kelas + accuracy/macro/weighted dari confusion matrix.
+    Menerima satu matriks (k, k) atau tumpukan (..., k, k), mis. hasil bootstrap.
+    """
+    cm = np.asarray(cm, dtype=np.float64)
+    tp = np.diagonal(cm, axis1=-2, axis2=-1)
+    support = cm.sum(axis=-1)
+    predicted = cm.sum(axis=-2)
+    total = support.sum(axis=-1)
+
+    precision = _safe_divide(tp, predicted)
+    recall = _safe_divide(tp, support)
+    f1 = _safe_divide(2 * precision * recall, precision + recall)
+    return {
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'support': support,
+        'accuracy': _safe_divide(tp.sum(axis=-1), total),
+        'macro_f1': f1.mean(axis=-1),
+        'weighted_f1': _safe_divide((f1 * support).sum(axis=-1), total),
+    }
+
+
+def classification_report(cm, classes=LABELS):
+    """DataFrame per kelas + baris 'macro avg' / 'weighted avg' (gaya sklearn)."""
+    scores = scores_from_confusion(cm)
+    report = pd.DataFrame({name: scores[name] for name in REPORT_COLUMNS}, index=list(classes))
+    total = scores['support'].sum()
+    weights = _safe_divide(scores['support'], total)
+    metrics = ['precision', 'recall', 'f1']
+    report.loc['macro avg'] = [*(report.loc[list(classes), metrics].mean()), total]
+    report.loc['weighted avg'] = [*(report.loc[list(classes), metrics].mul(weights, axis=0).sum()), total]
+    report['support'] = report['support'].astype(np.int64)
+    return report
+
+
+def bootstrap_ci(cm, n_samples=BOOTSTRAP_SAMPLES, alpha=BOOTSTRAP_ALPHA, seed=0):
+    """
+    Interval kepercayaan bootstrap untuk accuracy, macro F1 & weighted F1.
+
+    Resample n baris dengan pengembalian setara dengan satu draw multinomial
+    atas sel confusion matrix, jadi biayanya O(n_samples * k^2) dan tidak
+    bergantung pada jumlah baris.
+    """
+    cm = np.asarray(cm, dtype=np.int64)
+    total = int(cm.sum())
+    index = ['accuracy', 'macro_f1', 'weighted_f1']
+    if total == 0:
+        return pd.DataFrame(np.nan, index=index, columns=['estimate', 'lower', 'upper'])
+    rng = np.random.default_rng(seed)
+    samples = rng.multinomial(total, cm.ravel() / total, size=n_samples).reshape(n_samples, *cm.shape)
+    point = scores_from_confusion(cm)
+    boot = scores_from_confusion(samples)
+    rows = {
+        name: [float(point[name]), *np.quantile(boot[name], [alpha / 2, 1 - alpha / 2])]
+        for name in index
+    }
+    return pd.DataFrame.from_dict(rows, orient='index', columns=['estimate', 'lower', 'upper'])
+
+
+def evaluate(y_true, y_pred, classes=LABELS):
+    """Ringkasan lengkap: (confusion matrix DataFrame, report per kelas, skor gabungan)."""
+    true_codes = encode_labels(y_true, classes)
+    pred_codes = encode_labels(y_pred, classes)
+    cm = confusion_matrix(true_codes, pred_codes, len(classes))
+    cm_frame = pd.DataFrame(
+        cm,
+        index=pd.Index(classes, name='label_manual'),
+        columns=pd.Index(classes, name='label_vader'),
+    )
+    return cm_frame, classification_report(cm, classes), scores_from_confusion(cm)
@@ -0,0 +1,167 @@
+import atexit
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.lexicon import analyzer_overlays, load_analyzer
+from core.scoring import SCORE_COLUMNS, as_text_list, dedupe_texts, score_texts, take_scores
+
+# --- CONFIGURATION ---
+DEFAULT_CHUNK_SIZE = 2000
+# Di bawah jumlah baris ini overhead proses lebih mahal dari scoring-nya sendiri
+PARALLEL_MIN_ROWS = 5000
+MAX_POOLS = 4
+
+# Pool dipakai ulang antar rerun Streamlit agar analyzer di tiap worker tetap "warm"
+_pools = {}
+_worker_analyzer = None
+
+
+def default_workers():
+    return max(1, os.cpu_count() or 1)
+
+
+def _init_worker(overlays=()):
+    global _worker_analyzer
+    # Lexicon terkompilasi (+ overlay yang sama dengan analyzer induk):
+    # worker baru siap dalam hitungan milidetik
+    _worker_analyzer = load_analyzer(overlays)
+
+
+def _score_chunk(texts):
+    return score_texts(texts, _worker_analyzer)
+
+
+def get_process_pool(workers, analyzer=None):
+    """
+    Process pool (spawn) per (jumlah worker, overlay lexicon analyzer), dibuat
+    sekali per proses. Pool terlama ditutup jika lebih dari MAX_POOLS.
+    """
+    key = (workers, getattr(analyzer, 'overlay_key', ()))
+    pool = _pools.get(key)
+    if pool is None:
+        if len(_pools) >= MAX_POOLS:
+            _pools.pop(next(iter(_pools))).shutdown(wait=False, cancel_futures=True)
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(analyzer_overlays(analyzer),),
+        )
+        _pools[key] = pool
+    return pool
+
+
+def submit_chunk(workers, texts, analyzer=None):
+    """Kirim satu chunk teks ke worker pool; kembalikan concurrent Future berisi skor."""
+    return get_process_pool(workers, analyzer).submit(_score_chunk, as_text_list(texts))
+
+
+@atexit.register
+def shutdown_pools(wait=False):
+    """Tutup semua pool; wait=True menunggu & me-reap proses worker (mis. sebelum proses keluar)."""
+    for pool in _pools.values():
+        pool.shutdown(wait=wait, cancel_futures=True)
+    _pools.clear()
+
+
+def concat_scores(parts):
+    """Gabungkan hasil score_texts per chunk (urutan dipertahankan)."""
+    if not parts:
+        return {name: np.empty(0, dtype=np.float64) for name in SCORE_COLUMNS}
+    return {name: np.concatenate([part[name] for part in parts]) for name in SCORE_COLUMNS}
+
+
+def throughput(rows_done, total, elapsed):
+    """Kembalikan (baris/detik, estimasi sisa detik) dari progres saat ini."""
+    rate = rows_done / elapsed if elapsed > 0 else 0.0
+    eta = (total - rows_done) / rate if rate > 0 else float('inf')
+    return rate, eta
+
+
+def _iter_chunk_scores(texts, analyzer, workers, chunk_size, min_rows):
+    workers = default_workers() if workers is None else int(workers)
+    bounds = iter([(start, min(start + chunk_size, len(texts)))
+                   for start in range(0, len(texts), chunk_size)])
+
+    if workers <= 1 or len(texts) < max(min_rows, 2 * chunk_size):
+        for start, stop in bounds:
+            yield start, stop, score_texts(texts[start:stop], analyzer)
+        return
+
+    pool = get_process_pool(workers, analyzer)
+    pending = deque()
+
+    def submit_next():
+        chunk = next(bounds, None)
+        if chunk is not None:
+            start, stop = chunk
+            pending.append((start, stop, pool.submit(_score_chunk, texts[start:stop])))
+
+    try:
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            start, stop, future = pending.popleft()
+            scores = future.result()
+            submit_next()
+            yield start, stop, scores
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+
+def iter_scored_chunks(texts, analyzer, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                       min_rows=PARALLEL_MIN_ROWS, dedup=False, stats=None):
+    """
+    Streaming scoring: yield (start, stop, scores) per chunk sesuai urutan asal.
+
+    Data kecil / workers <= 1 diskor serial dengan `analyzer`; selain itu chunk
+    dikirim ke worker pool dengan jumlah chunk in-flight dibatasi. Jika generator
+    ditutup lebih awal (cancel), chunk yang belum berjalan dibatalkan.
+
+    Dengan `dedup=True` yang diskor hanya teks unik; setiap chunk teks unik yang
+    selesai disebar ke prefix baris yang seluruh teksnya sudah terskor. Jumlah
+    baris & teks unik dicatat ke dict `stats` jika diberikan.
+    """
+    texts = as_text_list(texts)
+    if stats is not None:
+        stats.update(rows=len(texts), unique=len(texts))
+    if not dedup:
+        yield from _iter_chunk_scores(texts, analyzer, workers, chunk_size, min_rows)
+        return
+
+    uniques, codes = dedupe_texts(texts)
+    if stats is not None:
+        stats['unique'] = len(uniques)
+    # Baris kemunculan pertama tiap teks unik (naik monoton, sesuai urutan factorize)
+    first_rows = np.unique(codes, return_index=True)[1]
+    unique_scores = {name: np.empty(len(uniques), dtype=np.float64) for name in SCORE_COLUMNS}
+
+    rows_done = 0
+    chunks = _iter_chunk_scores(uniques, analyzer, workers, chunk_size, min_rows)
+    try:
+        for start, stop, scores in chunks:
+            for name in SCORE_COLUMNS:
+                unique_scores[name][start:stop] = scores[name]
+            row_stop = int(first_rows[stop]) if stop < len(uniques) else len(texts)
+            if row_stop > rows_done:
+                yield rows_done, row_stop, take_scores(unique_scores, codes[rows_done:row_stop])
+                rows_done = row_stop
+    finally:
+        chunks.close()
+
+
+def score_texts_parallel(texts, analyzer, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                         min_rows=PARALLEL_MIN_ROWS, dedup=False):
+    """
+    score_texts versi multi-proses: teks dipecah per chunk, diskor di worker pool,
+    lalu digabung kembali sesuai urutan asal. Otomatis serial (memakai `analyzer`)
+    untuk data kecil atau workers <= 1.
+    """
+    return concat_scores([
+        scores for _, _, scores in iter_scored_chunks(texts, analyzer, workers, chunk_size, min_rows, dedup)
+    ])
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from core.ingest import READ_CHUNK_ROWS, iter_frames
+from core.instrument import stage, timed_iter
+from core.language import TARGET_LANG, detect_language, translate_rows
+from core.parallel import DEFAULT_CHUNK_SIZE, iter_scored_chunks
+from core.scoring import SCORE_COLUMNS, label_from_compound, scores_to_frame
+
+RESULT_COLUMNS = SCORE_COLUMNS + ['label']
+
+
+def analyze_text(text, analyzer, translate=None, target=TARGET_LANG):
+    """
+    Analisis satu teks (Live Demo): deteksi bahasa, terjemahkan lewat callable
+    `translate(text)` jika bukan `target`, lalu skor VADER dan label.
+    """
+    lang = detect_language(text)
+    is_translated = lang != target and translate is not None
+    text_to_analyze = translate(text) if is_translated else text
+    scores = analyzer.polarity_scores(text_to_analyze)
+    return {
+        'lang': lang,
+        'is_translated': is_translated,
+        'text': text_to_analyze,
+        'scores': scores,
+        'label': label_from_compound(scores['compound']),
+    }
+
+
+def score_frames(frames, column, analyzer, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 dedup=False, translator=None, stats=None, timings=None, cancel=None):
+    """
+    Pipeline per chunk: (opsional) deteksi bahasa & terjemahan, lalu scoring
+    streaming. Yield (rows_done, DataFrame hasil) untuk setiap chunk scoring;
+    hasil berisi kolom input + lang/translated_text (jika diterjemahkan) +
+    neg/neu/pos/compound/label. Waktu per tahap (read, detect_language,
+    translate, score, label) dicatat ke `timings` (StageTimings) jika diberikan.
+    Jika `cancel.is_set()` (dicek sebelum tiap chunk baca & selama terjemahan),
+    stream berhenti; chunk yang sudah di-yield tetap valid.
+    """
+    stats = {} if stats is None else stats
+    stats.update(rows=0, unique=0, translated=0)
+
+    rows_before = 0
+    for frame in timed_iter(timings, 'read', frames):
+        if cancel is not None and cancel.is_set():
+            return
+        texts = frame[column]
+        extra = {}
+        if translator is not None:
+            texts, langs, is_translated = translate_rows(texts, translator, timings=timings, cancel=cancel)
+            if cancel is not None and cancel.is_set():
+                # Terjemahan chunk ini terpotong: jangan skor teks yang sebagian belum diterjemahkan
+                return
+            # Dtype string tetap (bukan object berisi None): chunk tanpa terjemahan tidak
+            # menjadi kolom bertipe null di Arrow/Parquet
+            extra = {
+                'lang': pd.array(langs, dtype=pd.StringDtype()),
+                'translated_text': pd.array(np.where(is_translated, texts, None), dtype=pd.StringDtype()),
+            }
+            stats['translated'] += int(is_translated.sum())
+
+        chunk_stats = {}
+        chunks = iter_scored_chunks(texts, analyzer, workers, chunk_size, dedup=dedup, stats=chunk_stats)
+        for start, stop, scores in timed_iter(timings, 'score', chunks, rows=lambda chunk: chunk[1] - chunk[0]):
+            with stage(timings, 'label', rows=stop - start):
+                part = frame.iloc[start:stop]
+                result = part.drop(columns=RESULT_COLUMNS, errors='ignore')
+                for name, values in extra.items():
+                    result[name] = values[start:stop]
+                result = result.join(scores_to_frame(scores, index=part.index))
+            stats['rows'] = rows_before + stop
+            yield rows_before + stop, result
+
+        rows_before += len(frame)
+        stats['unique'] += chunk_stats.get('unique', 0)
+
+
+def score_file(source, fmt, column, analyzer, keep_columns=None, read_chunk_rows=READ_CHUNK_ROWS, **kwargs):
+    """
+    Stream file (xlsx/csv/tsv/parquet/arrow) lewat score_frames. Hanya kolom teks
+    + `keep_columns` yang dibaca (None = semua kolom), sehingga memori puncak
+    dibatasi ukuran chunk, bukan ukuran file.
+    """
+    columns = None
+    if keep_columns is not None:
+        columns = [column] + [name for name in keep_columns if name != column]
+    frames = iter_frames(source, fmt, columns=columns, chunk_size=read_chunk_rows)
+    return score_frames(frames, column, analyzer, **kwargs)
+
+
+def collect_results(parts):
+    """Gabungkan potongan hasil score_frames menjadi satu DataFrame."""
+    if not parts:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# --- CONFIGURATION ---
+SCORE_COLUMNS = ['neg', 'neu', 'pos', 'compound']
+LABELS = ['Positive', 'Neutral', 'Negative']
+POS_THRESHOLD = 0.05
+NEG_THRESHOLD = -0.05
+# Presisi threshold (sama dengan grid kalibrasi) agar nilai yang disimpan = kandidat yang disapu
+THRESHOLD_DECIMALS = 6
+# Threshold hasil kalibrasi (halaman Argumentation); tanpa file ini dipakai ±0.05
+THRESHOLDS_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'thresholds.json')
+)
+
+# Memo threshold per (path, mtime_ns) agar file tidak dibaca ulang tiap label
+_thresholds_memo = {}
+
+
+def get_thresholds(path=THRESHOLDS_PATH):
+    """(pos_threshold, neg_threshold) aktif: dari data/thresholds.json jika ada, selain itu ±0.05."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return POS_THRESHOLD, NEG_THRESHOLD
+    memo_key = (path, mtime_ns)
+    thresholds = _thresholds_memo.get(memo_key)
+    if thresholds is None:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        thresholds = (float(data['pos_threshold']), float(data['neg_threshold']))
+        _thresholds_memo.clear()
+        _thresholds_memo[memo_key] = thresholds
+    return thresholds
+
+
+def save_thresholds(pos_threshold, neg_threshold, path=THRESHOLDS_PATH, **extra):
+    """Simpan threshold global (dipakai dashboard, CLI & server); `extra` ikut dicatat di JSON."""
+    if not -1 <= neg_threshold < pos_threshold <= 1:
+        raise ValueError(f"Threshold tidak valid: neg {neg_threshold} harus < pos {pos_threshold} dalam [-1, 1]")
+    # Dibulatkan: input number_input bisa membawa sisa float (0.1 + 0.2 = 0.30000000000000004)
+    data = {
+        'pos_threshold': round(float(pos_threshold), THRESHOLD_DECIMALS),
+        'neg_threshold': round(float(neg_threshold), THRESHOLD_DECIMALS),
+        **extra,
+    }
+    # File sementara unik per proses & thread: sesi Streamlit lain / CLI bisa menyimpan bersamaan
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def reset_thresholds(path=THRESHOLDS_PATH):
+    """Kembali ke threshold bawaan ±0.05."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def as_text_list(texts):
+    """Samakan input (Series / array / list) menjadi list of str."""
+    if isinstance(texts, (pd.Series, np.ndarray)):
+        texts = texts.tolist()
+    # str() eksplisit: NaN tetap menjadi 'nan' seperti .astype(str) pada pandas lama
+    return [text if type(text) is str else str(text) for text in texts]
+
+
+def dedupe_texts(texts):
+    """
+    Kelompokkan teks identik setelah whitespace dirapikan (tidak mengubah skor VADER,
+    yang memecah token per whitespace). Kembalikan (list teks unik, codes) dengan
+    baris ke-i = uniques[codes[i]]; urutan unik mengikuti kemunculan pertama.
+    """
+    normalized = np.asarray([' '.join(text.split()) for text in as_text_list(texts)], dtype=object)
+    codes, uniques = pd.factorize(normalized)
+    return uniques.tolist(), codes
+
+
+def take_scores(columns, indices):
+    """Sebar skor per teks unik kembali ke baris lewat indeks integer."""
+    return {name: columns[name][indices] for name in SCORE_COLUMNS}
+
+
+def score_texts(texts, analyzer, dedup=False):
+    """
+    Skor VADER untuk satu kolom teks sekaligus.
+
+    Hasil berupa dict kolom -> np.ndarray (neg/neu/pos/compound), diisi langsung
+    ke array yang sudah dialokasikan tanpa menyimpan dict per baris. Dengan
+    `dedup=True` setiap teks unik hanya diskor sekali.
+    """
+    if dedup:
+        uniques, codes = dedupe_texts(texts)
+        return take_scores(score_texts(uniques, analyzer), codes)
+
+    texts = as_text_list(texts)
+    n = len(texts)
+    neg = np.empty(n, dtype=np.float64)
+    neu = np.empty(n, dtype=np.float64)
+    pos = np.empty(n, dtype=np.float64)
+    compound = np.empty(n, dtype=np.float64)
+
+    polarity_scores = analyzer.polarity_scores
+    for i, text in enumerate(texts):
+        s = polarity_scores(text)
+        neg[i] = s['neg']
+        neu[i] = s['neu']
+        pos[i] = s['pos']
+        compound[i] = s['compound']
+
+    return {'neg': neg, 'neu': neu, 'pos': pos, 'compound': compound}
+
+
+def _resolve_thresholds(pos_threshold, neg_threshold):
+    if pos_threshold is None or neg_threshold is None:
+        default_pos, default_neg = get_thresholds()
+        pos_threshold = default_pos if pos_threshold is None else pos_threshold
+        neg_threshold = default_neg if neg_threshold is None else neg_threshold
+    return pos_threshold, neg_threshold
+
+
+def label_compound(compound, pos_threshold=None, neg_threshold=None):
+    """Label Positive/Neutral/Negative dari skor compound (vectorized); default threshold global."""
+    pos_threshold, neg_threshold = _resolve_thresholds(pos_threshold, neg_threshold)
+    compound = np.asarray(compound, dtype=np.float64)
+    return np.select(
+        [compound >= pos_threshold, compound <= neg_threshold],
+        ['Positive', 'Negative'],
+        default='Neutral',
+    )
+
+
+def label_from_compound(compound, pos_threshold=None, neg_threshold=None):
+    """Versi skalar label_compound untuk satu skor (mis. Live Demo)."""
+    pos_threshold, neg_threshold = _resolve_thresholds(pos_threshold, neg_threshold)
+    if compound >= pos_threshold:
+        return 'Positive'
+    if compound <= neg_threshold:
+        return 'Negative'
+    return 'Neutral'
+
+
+def scores_to_frame(columns, index=None):
+    """DataFrame neg/neu/pos/compound/label dari hasil score_texts."""
+    frame = pd.DataFrame({name: columns[name] for name in SCORE_COLUMNS}, index=index)
+    frame['label'] = label_compound(columns['compound'])
+    return frame
+
+
+def scores_frame(texts, analyzer, index=None, dedup=False):
+    """DataFrame kolom neg/neu/pos/compound/label untuk kolom teks."""
+    if index is None and isinstance(texts, pd.Series):
+        index = texts.index
+    return scores_to_frame(score_texts(texts, analyzer, dedup=dedup), index=index)
@@ -0,0 +1,258 @@
+"""
+Inverted index token untuk pencarian full-text atas dataset terskor. Index
+dibangun sekali per versi dataset (hash seluruh teks) dan disimpan di
+`.cache/`; query hanya berupa searchsorted atas vocab terurut + gabungan
+posting list, lalu dipetakan ke posisi baris dengan satu operasi NumPy.
+
+Sintaks query (semua istilah digabung AND, tidak peka huruf besar/kecil):
+
+    audio mic          ulasan yang memuat 'audio' dan 'mic'
+    connect*           awalan kata (connect, connection, connecting, ...)
+    -video             kecualikan ulasan yang memuat 'video'
+    "no sound"         frasa persis (dicek ulang pada kandidat dari index)
+    -"no sound"        kecualikan ulasan yang memuat frasa tersebut
+"""
+import hashlib
+import os
+import re
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from core.dataset import text_fingerprints
+from core.lexicon import CACHE_DIR
+from core.scoring import as_text_list
+
+# --- CONFIGURATION ---
+INDEX_FORMAT = 1
+_TOKEN = re.compile(r'\w+')
+_QUERY_TERM = re.compile(r'(-?)"([^"]*)"?|(-?)(\S+)')
+
+
+def tokenize(text):
+    """Token kata (huruf kecil, \\w+ unicode) dari satu teks."""
+    return _TOKEN.findall(text.lower())
+
+
+def parse_query(query):
+    """
+    Pecah query menjadi (include, exclude, prefixes, phrases, neg_phrases):
+    token wajib, token yang dikecualikan, awalan (`kata*`), frasa persis
+    (urutan token) dan frasa yang dikecualikan (`-"frasa"`).
+    """
+    include, exclude, prefixes, phrases, neg_phrases = [], [], [], [], []
+    for phrase_neg, phrase, term_neg, term in _QUERY_TERM.findall(query or ''):
+        if phrase:
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            if phrase_neg:
+                neg_phrases.append(tokens)
+            else:
+                include.extend(tokens)
+                phrases.append(f" {' '.join(tokens)} ")
+        elif term:
+            is_prefix = term.endswith('*')
+            tokens = tokenize(term)
+            if not tokens:
+                continue
+            if term_neg:
+                exclude.extend(tokens)
+            elif is_prefix:
+                include.extend(tokens[:-1])
+                prefixes.append(tokens[-1])
+            else:
+                include.extend(tokens)
+    return include, exclude, prefixes, phrases, neg_phrases
+
+
+class SearchIndex:
+    """
+    Inverted index atas teks unik: vocab terurut (object array), posting list
+    CSR (`offsets`, `postings` = id teks unik terurut) dan `codes` baris -> id
+    teks unik, sehingga teks duplikat hanya diindeks sekali.
+    """
+
+    def __init__(self, vocab, offsets, postings, codes, texts):
+        self.vocab = vocab
+        self.offsets = offsets
+        self.postings = postings
+        self.codes = codes
+        self.texts = texts
+
+    @property
+    def n_rows(self):
+        return len(self.codes)
+
+    def _term_range(self, low, high):
+        return self.postings[self.offsets[low]:self.offsets[high]]
+
+    def term_docs(self, token):
+        """Id teks unik yang memuat `token` (urut)."""
+        position = int(np.searchsorted(self.vocab, token))
+        if position < len(self.vocab) and self.vocab[position] == token:
+            return self._term_range(position, position + 1)
+        return self.postings[:0]
+
+    def prefix_docs(self, prefix):
+        """Id teks unik yang memuat kata berawalan `prefix` (gabungan posting semua kata)."""
+        low = int(np.searchsorted(self.vocab, prefix, side='left'))
+        high = int(np.searchsorted(self.vocab, prefix + '\U0010ffff', side='left'))
+        if high - low == 1:
+            return self._term_range(low, high)
+        return np.unique(self._term_range(low, high))
+
+    def match_docs(self, query):
+        """Mask boolean per teks unik untuk `query`; None jika query kosong (semua cocok)."""
+        include, exclude, prefixes, phrases, neg_phrases = parse_query(query)
+        if not (include or exclude or prefixes or neg_phrases):
+            return None
+        # Posting terpendek dulu: irisan berikutnya bekerja pada kandidat yang makin kecil
+        postings = [self.term_docs(token) for token in dict.fromkeys(include)]
+        postings += [self.prefix_docs(prefix) for prefix in dict.fromkeys(prefixes)]
+        postings.sort(key=len)
+        if postings:
+            candidates = postings[0]
+            for other in postings[1:]:
+                if not len(candidates):
+                    break
+                candidates = np.intersect1d(candidates, other, assume_unique=True)
+            hit = np.zeros(len(self.texts), dtype=bool)
+            hit[candidates] = True
+        else:
+            hit = np.ones(len(self.texts), dtype=bool)
+        for token in exclude:
+            hit[self.term_docs(token)] = False
+        for tokens in neg_phrases:
+            # Hanya teks yang memuat semua token frasa (dari index) yang dicek urutannya
+            phrase = f" {' '.join(tokens)} "
+            candidates = self.term_docs(tokens[0])
+            for token in tokens[1:]:
+                candidates = np.intersect1d(candidates, self.term_docs(token), assume_unique=True)
+            for doc in candidates[hit[candidates]]:
+                if phrase in self._normalized(doc):
+                    hit[doc] = False
+        if phrases:
+            # Frasa dicek ulang (urutan token berurutan) hanya pada kandidat dari index
+            for doc in np.flatnonzero(hit):
+                text = self._normalized(doc)
+                if not all(phrase in text for phrase in phrases):
+                    hit[doc] = False
+        return hit
+
+    def _normalized(self, doc):
+        return f" {' '.join(tokenize(self.texts[doc]))} "
+
+    def search(self, query):
+        """Posisi baris (int array, urut) yang cocok dengan `query`; None jika query kosong."""
+        hit = self.match_docs(query)
+        if hit is None:
+            return None
+        return np.flatnonzero(hit[self.codes])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            format=np.array([INDEX_FORMAT]),
+            vocab=_pack_strings(self.vocab),
+            vocab_offsets=_string_offsets(self.vocab),
+            texts=_pack_strings(self.texts),
+            texts_offsets=_string_offsets(self.texts),
+            offsets=self.offsets,
+            postings=self.postings,
+            codes=self.codes,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format'][0]) != INDEX_FORMAT:
+                raise ValueError(f"Format index {path} tidak cocok")
+            return cls(
+                vocab=_unpack_strings(data['vocab'], data['vocab_offsets']),
+                offsets=data['offsets'],
+                postings=data['postings'],
+                codes=data['codes'],
+                texts=_unpack_strings(data['texts'], data['texts_offsets']),
+            )
+
+
+def _pack_strings(strings):
+    return np.frombuffer(''.join(strings).encode('utf-8'), dtype=np.uint8)
+
+
+def _string_offsets(strings):
+    lengths = np.fromiter((len(text.encode('utf-8')) for text in strings), dtype=np.int64, count=len(strings))
+    return np.concatenate([[0], np.cumsum(lengths)])
+
+
+def _unpack_strings(packed, offsets):
+    raw = packed.tobytes()
+    return np.array([raw[start:stop].decode('utf-8') for start, stop in zip(offsets[:-1], offsets[1:])], dtype=object)
+
+
+def build_index(texts):
+    """
+    Bangun SearchIndex dari kolom teks. Teks difaktorisasi dulu (duplikat
+    diindeks sekali); setiap teks unik ditokenisasi satu kali.
+    """
+    codes, uniques = pd.factorize(np.asarray(as_text_list(texts), dtype=object))
+    vocab = {}
+    term_ids = array('i')
+    counts = np.zeros(len(uniques), dtype=np.int64)
+    for doc, text in enumerate(uniques):
+        ids = {vocab.setdefault(token, len(vocab)) for token in tokenize(text)}
+        counts[doc] = len(ids)
+        term_ids.extend(ids)
+
+    # Vocab diurutkan agar lookup kata & awalan cukup dengan searchsorted
+    names = np.array(list(vocab), dtype=object)
+    order = np.argsort(names, kind='stable')
+    rank = np.empty(len(names), dtype=np.int32)
+    rank[order] = np.arange(len(names), dtype=np.int32)
+    terms = rank[np.frombuffer(term_ids, dtype=np.int32)] if len(term_ids) else np.empty(0, dtype=np.int32)
+    docs = np.repeat(np.arange(len(uniques), dtype=np.int32), counts)
+
+    # Sort stabil per term: id dokumen dalam setiap posting list tetap urut naik
+    by_term = np.argsort(terms, kind='stable')
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(terms, minlength=len(names)), out=offsets[1:])
+    return SearchIndex(
+        vocab=names[order],
+        offsets=offsets,
+        postings=docs[by_term],
+        codes=codes.astype(np.int32),
+        texts=np.asarray(uniques, dtype=object),
+    )
+
+
+def index_key(texts):
+    """Hash seluruh kolom teks (urutan baris ikut dihitung), dipakai sebagai versi index."""
+    return hashlib.sha256(text_fingerprints(as_text_list(texts)).tobytes()).hexdigest()
+
+
+def index_path(key):
+    return os.path.join(CACHE_DIR, f"search-{key[:24]}-v{INDEX_FORMAT}.npz")
+
+
+def load_index(texts, persist=True):
+    """
+    SearchIndex untuk `texts`: dibaca dari `.cache/` jika versi dataset sama,
+    selain itu dibangun lalu disimpan (kegagalan tulis diabaikan).
+    """
+    path = index_path(index_key(texts))
+    try:
+        return SearchIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        pass
+    index = build_index(texts)
+    if persist:
+        try:
+            index.save(path)
+        except OSError:
+            pass
+    return index
@@ -0,0 +1,147 @@
+"""
+Analisis per kalimat untuk input panjang (Live Demo): teks dipecah menjadi
+kalimat, lalu deteksi bahasa -> terjemahan -> skor VADER dijalankan per
+kalimat di thread pool terbatas. Hasil per kalimat di-cache (LRU, per
+kalimat + overlay lexicon + mode terjemahan), jadi mengedit satu paragraf
+hanya menghitung ulang kalimat yang berubah. Hasil di-stream sesuai urutan
+selesai, dan skor keseluruhan adalah rata-rata compound berbobot jumlah kata.
+"""
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from core.language import TARGET_LANG
+from core.pipeline import analyze_text
+from core.scoring import SCORE_COLUMNS, label_from_compound
+
+# --- CONFIGURATION ---
+SENTENCE_WORKERS = 4
+SENTENCE_CACHE_SIZE = 10000
+# Akhir kalimat: . ! ? … (boleh berulang / diikuti kutip/kurung tutup) lalu spasi; baris baru selalu memisah
+_SENTENCE_END = re.compile(r'(?<=[.!?…])["\')\]]*\s+|\s*\n+\s*')
+
+# Cache hasil per kalimat, dibagi semua sesi di proses ini
+_sentence_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def split_sentences(text):
+    """Pecah teks menjadi list kalimat (tanpa spasi di tepi, kalimat kosong dibuang)."""
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text or '') if sentence and sentence.strip()]
+
+
+def _cache_key(sentence, analyzer, translate):
+    return sentence, getattr(analyzer, 'overlay_key', ()), translate is not None
+
+
+def _cache_get(key):
+    with _cache_lock:
+        result = _sentence_cache.get(key)
+        if result is not None:
+            _sentence_cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key, result):
+    with _cache_lock:
+        _sentence_cache[key] = result
+        if len(_sentence_cache) > SENTENCE_CACHE_SIZE:
+            _sentence_cache.popitem(last=False)
+
+
+def _safe_translate(translate):
+    # Terjemahan yang gagal memakai teks asli, seperti translate_concurrent pada mode bulk
+    def wrapped(text):
+        try:
+            return translate(text)
+        except Exception:
+            return text
+    return wrapped
+
+
+def _analyze_sentence(sentence, analyzer, translate, target):
+    result = analyze_text(sentence, analyzer, translate=translate, target=target)
+    # Label dihitung saat ditampilkan (threshold global bisa berubah), bukan di cache
+    result.pop('label', None)
+    result['words'] = max(1, len(result['text'].split()))
+    return result
+
+
+def _with_label(index, sentence, result, cached):
+    return {
+        'index': index,
+        'sentence': sentence,
+        **result,
+        'label': label_from_compound(result['scores']['compound']),
+        'cached': cached,
+    }
+
+
+def iter_sentence_scores(sentences, analyzer, translate=None, target=TARGET_LANG, max_workers=SENTENCE_WORKERS):
+    """
+    Yield dict hasil per kalimat (index, sentence, lang, is_translated, text,
+    scores, words, label, cached) begitu selesai. Kalimat yang ada di cache
+    dikembalikan lebih dulu; sisanya diproses paralel (maks. `max_workers`
+    kalimat sekaligus), kalimat identik hanya dihitung sekali.
+    """
+    translate = _safe_translate(translate) if translate is not None else None
+    pending = {}
+    for index, sentence in enumerate(sentences):
+        key = _cache_key(sentence, analyzer, translate)
+        result = _cache_get(key)
+        if result is not None:
+            yield _with_label(index, sentence, result, cached=True)
+        else:
+            pending.setdefault(key, []).append(index)
+    if not pending:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {
+        executor.submit(_analyze_sentence, key[0], analyzer, translate, target): key
+        for key in pending
+    }
+    try:
+        for future in as_completed(futures):
+            key = futures[future]
+            result = future.result()
+            _cache_put(key, result)
+            for index in pending[key]:
+                yield _with_label(index, key[0], result, cached=False)
+    finally:
+        # Generator ditutup lebih awal (rerun Streamlit): batalkan kalimat yang belum mulai
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def aggregate_sentences(results):
+    """
+    Skor keseluruhan dari hasil per kalimat: neg/neu/pos/compound rata-rata
+    berbobot jumlah kata (kalimat panjang lebih berpengaruh), label dari
+    compound berbobot, serta jumlah kalimat per label.
+    """
+    results = list(results)
+    if not results:
+        return None
+    weights = np.array([result['words'] for result in results], dtype=np.float64)
+    scores = {
+        name: float(np.average([result['scores'][name] for result in results], weights=weights))
+        for name in SCORE_COLUMNS
+    }
+    counts = {}
+    for result in results:
+        counts[result['label']] = counts.get(result['label'], 0) + 1
+    return {
+        'scores': scores,
+        'label': label_from_compound(scores['compound']),
+        'sentences': len(results),
+        'words': int(weights.sum()),
+        'label_counts': counts,
+    }
+
+
+def clear_sentence_cache():
+    with _cache_lock:
+        _sentence_cache.clear()
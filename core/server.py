@@ -0,0 +1,350 @@
+"""
+Endpoint HTTP lokal (asyncio, tanpa dependency tambahan) untuk pipeline Live Demo:
+deteksi bahasa -> terjemahan -> VADER, dengan micro-batching.
+
+    python -m core.server --port 8765 --workers 4
+    curl -s localhost:8765/score -d '{"texts": ["great app", "aplikasi jelek"]}'
+
+Request yang datang dalam jendela `--window-ms` digabung menjadi satu batch
+(maks `--max-batch` teks) lalu diskor di analyzer yang sudah warm. Setiap
+respons membawa header latensi: X-Queue-Ms, X-Process-Ms, X-Total-Ms, X-Batch-Size.
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from core.language import TARGET_LANG, detect_languages
+from core.parallel import default_workers, submit_chunk
+from core.scoring import SCORE_COLUMNS, as_text_list, label_compound, score_texts
+
+# --- CONFIGURATION ---
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH = 256
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_TEXTS_PER_REQUEST = 10000
+WARMUP_TEXT = "The new update works great, thank you!"
+
+
+class MicroBatcher:
+    """Gabungkan request yang datang berdekatan menjadi satu batch scoring."""
+
+    def __init__(self, process_batch, window=DEFAULT_WINDOW_MS / 1000, max_batch=DEFAULT_MAX_BATCH,
+                 max_concurrent=1):
+        self.process_batch = process_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._runner = None
+
+    def start(self):
+        if self._runner is None:
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def submit(self, texts, translate):
+        """Kembalikan (hasil per teks, timing) setelah batch yang memuat request ini selesai."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, translate, future, time.perf_counter()))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.window
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item[0])
+            # Batch berikutnya boleh dikumpulkan selama batch ini masih diproses
+            await self._slots.acquire()
+            loop.create_task(self._dispatch(batch, size))
+
+    async def _dispatch(self, batch, size):
+        try:
+            started = time.perf_counter()
+            texts = [text for item in batch for text in item[0]]
+            flags = [item[1] for item in batch for _ in item[0]]
+            try:
+                results = await self.process_batch(texts, flags)
+            except Exception as e:
+                for _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finished = time.perf_counter()
+
+            offset = 0
+            for item_texts, _, future, queued in batch:
+                timing = {
+                    'queue_ms': (started - queued) * 1000,
+                    'process_ms': (finished - started) * 1000,
+                    'batch_size': size,
+                }
+                if not future.done():
+                    future.set_result((results[offset:offset + len(item_texts)], timing))
+                offset += len(item_texts)
+        finally:
+            self._slots.release()
+
+
+class ScoringService:
+    """
+    Pipeline per batch: langid per teks unik -> terjemahan teks non-Inggris
+    (hanya yang meminta translate) -> skor VADER. Dengan workers > 1 scoring
+    dijalankan di process pool (analyzer warm di tiap worker).
+    """
+
+    def __init__(self, analyzer, translator=None, workers=1, target=TARGET_LANG):
+        self.analyzer = analyzer
+        self.translator = translator
+        self.workers = workers
+        self.target = target
+        # Thread untuk langid/terjemahan/scoring serial agar event loop tidak terblokir
+        self._threads = ThreadPoolExecutor(max_workers=max(2, workers))
+
+    def _prepare(self, texts, flags):
+        langs = detect_languages(texts)
+        final = list(texts)
+        translated = [None] * len(texts)
+        foreign = [i for i, lang in enumerate(langs) if flags[i] and lang != self.target]
+        if foreign and self.translator is not None:
+            try:
+                outputs = self.translator.translate_batch([texts[i] for i in foreign], target=self.target)
+            except Exception:
+                # Terjemahan gagal: skor teks asli (sama seperti translate_text di Live Demo)
+                outputs = [texts[i] for i in foreign]
+            for i, output in zip(foreign, outputs):
+                final[i] = output
+                translated[i] = output
+        return langs, final, translated
+
+    def warm(self):
+        """
+        Muat model langid & analyzer (serta proses worker pool jika workers > 1)
+        sebelum server menerima request, agar request pertama tidak menanggung biaya start.
+        """
+        detect_languages([WARMUP_TEXT])
+        if self.workers > 1:
+            # Satu chunk per worker: pool menjalankan semua proses sekaligus
+            futures = [submit_chunk(self.workers, [WARMUP_TEXT], self.analyzer) for _ in range(self.workers)]
+            for future in futures:
+                future.result()
+        else:
+            score_texts([WARMUP_TEXT], self.analyzer)
+
+    async def process_batch(self, texts, flags):
+        loop = asyncio.get_running_loop()
+        texts = as_text_list(texts)
+        langs, final, translated = await loop.run_in_executor(self._threads, self._prepare, texts, flags)
+        if self.workers > 1:
+            scores = await asyncio.wrap_future(submit_chunk(self.workers, final, self.analyzer))
+        else:
+            scores = await loop.run_in_executor(self._threads, score_texts, final, self.analyzer)
+
+        labels = label_compound(scores['compound'])
+        return [
+            {
+                'text': texts[i],
+                'lang': langs[i],
+                'translated': translated[i],
+                **{name: float(scores[name][i]) for name in SCORE_COLUMNS},
+                'label': str(labels[i]),
+            }
+            for i in range(len(texts))
+        ]
+
+    def close(self):
+        self._threads.shutdown(wait=False)
+
+
+# --- HTTP ---
+def _response(status, payload, headers=None):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    status = HTTPStatus(status)
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}",
+             'Content-Type: application/json; charset=utf-8',
+             f"Content-Length: {len(body)}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def _parse_payload(body):
+    payload = json.loads(body or b'{}')
+    if not isinstance(payload, dict):
+        raise ValueError("body harus berupa objek JSON")
+    if 'texts' in payload:
+        texts = payload['texts']
+        if not isinstance(texts, list):
+            raise ValueError("'texts' harus berupa array")
+        if not all(isinstance(text, str) for text in texts):
+            raise ValueError("setiap item 'texts' harus berupa string")
+    elif 'text' in payload:
+        if not isinstance(payload['text'], str):
+            raise ValueError("'text' harus berupa string")
+        texts = [payload['text']]
+    else:
+        raise ValueError("body harus berisi 'text' atau 'texts'")
+    if len(texts) > MAX_TEXTS_PER_REQUEST:
+        raise ValueError(f"maksimal {MAX_TEXTS_PER_REQUEST} teks per request")
+    return texts, bool(payload.get('translate', True))
+
+
+def _content_length(headers):
+    """Nilai Content-Length (0 jika tidak ada); ValueError jika bukan bilangan bulat >= 0."""
+    value = headers.get('content-length') or '0'
+    if not value.isdigit():
+        raise ValueError(f"Content-Length tidak valid: {value!r}")
+    return int(value)
+
+
+async def _handle_request(method, path, body, batcher):
+    if path == '/health':
+        return _response(200, {'status': 'ok'})
+    if path != '/score':
+        return _response(404, {'error': 'not found'})
+    if method != 'POST':
+        return _response(405, {'error': 'gunakan POST'})
+
+    started = time.perf_counter()
+    try:
+        texts, translate = _parse_payload(body)
+    except ValueError as e:
+        return _response(400, {'error': str(e)})
+    if not texts:
+        return _response(200, {'results': []})
+
+    results, timing = await batcher.submit(texts, translate)
+    total_ms = (time.perf_counter() - started) * 1000
+    headers = {
+        'X-Queue-Ms': f"{timing['queue_ms']:.2f}",
+        'X-Process-Ms': f"{timing['process_ms']:.2f}",
+        'X-Total-Ms': f"{total_ms:.2f}",
+        'X-Batch-Size': timing['batch_size'],
+        'Server-Timing': f"queue;dur={timing['queue_ms']:.2f}, process;dur={timing['process_ms']:.2f}",
+    }
+    return _response(200, {'results': results}, headers)
+
+
+def make_handler(batcher):
+    async def handle(reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                method, path, _ = (lines[0].split(' ') + ['', ''])[:3]
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = _content_length(headers)
+                except ValueError as e:
+                    # Batas body tidak diketahui: koneksi tidak bisa dipakai ulang
+                    writer.write(_response(400, {'error': str(e)}))
+                    await writer.drain()
+                    break
+                if length > MAX_BODY_BYTES:
+                    writer.write(_response(413, {'error': 'body terlalu besar'}))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                try:
+                    response = await _handle_request(method, path.split('?', 1)[0], body, batcher)
+                except Exception as e:
+                    response = _response(500, {'error': str(e)})
+                writer.write(response)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def start_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, window_ms=DEFAULT_WINDOW_MS,
+                       max_batch=DEFAULT_MAX_BATCH, warm=True):
+    """
+    Jalankan server; kembalikan (asyncio.Server, MicroBatcher). Port 0 = port acak.
+    Dengan `warm` service dipanaskan dulu sehingga server baru listen setelah siap.
+    """
+    if warm:
+        await asyncio.get_running_loop().run_in_executor(None, service.warm)
+    batcher = MicroBatcher(service.process_batch, window=window_ms / 1000, max_batch=max_batch,
+                           max_concurrent=max(1, service.workers))
+    batcher.start()
+    server = await asyncio.start_server(make_handler(batcher), host, port)
+    return server, batcher
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server HTTP lokal untuk scoring VADER dengan micro-batching.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-w', '--workers', type=int, default=default_workers(),
+                        help="Jumlah proses scoring (1 = thread di proses server)")
+    parser.add_argument('--window-ms', type=float, default=DEFAULT_WINDOW_MS,
+                        help="Jendela pengumpulan micro-batch dalam milidetik")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help="Maksimal teks per batch")
+    parser.add_argument('--stub-translator', action='store_true',
+                        help="Pakai translator lokal (tanpa jaringan) untuk test & benchmark")
+    parser.add_argument('--lexicon', action='append', default=[], metavar='PATH',
+                        help="File overlay lexicon (kata<TAB>valence); bisa diulang")
+    args = parser.parse_args(argv)
+
+    from core.lexicon import load_analyzer
+    from core.translation import StubBackend, TranslationCache, Translator
+
+    if args.stub_translator:
+        translator = Translator(StubBackend(), TranslationCache(path=None))
+    else:
+        translator = Translator()
+    service = ScoringService(load_analyzer(args.lexicon), translator, workers=args.workers)
+
+    async def serve():
+        server, batcher = await start_server(service, args.host, args.port, args.window_ms, args.max_batch)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Listening on http://{host}:{port} (POST /score, GET /health)", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await batcher.stop()
+            service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Query tabel hasil di sisi server: filter (label / rentang compound), sort dan
+pagination. Hasil query berupa array posisi baris, jadi halaman dashboard
+cukup mengirim satu halaman `df.iloc[...]` ke browser, bukan seluruh tabel.
+"""
+import numpy as np
+
+# --- CONFIGURATION ---
+PAGE_SIZES = [25, 50, 100, 250]
+DEFAULT_PAGE_SIZE = 50
+
+
+def filter_rows(df, labels=None, compound_range=None, label_column='label', compound_column='compound', rows=None):
+    """
+    Posisi baris (int array) yang labelnya ada di `labels` dan compound di [lo, hi].
+    `rows` membatasi ke posisi kandidat (mis. hasil core.search); None = semua baris.
+    """
+    if rows is not None:
+        mask = np.zeros(len(df), dtype=bool)
+        mask[rows] = True
+    else:
+        mask = np.ones(len(df), dtype=bool)
+    if labels is not None and label_column in df.columns:
+        mask &= df[label_column].isin(list(labels)).to_numpy()
+    if compound_range is not None and compound_column in df.columns:
+        low, high = compound_range
+        compound = df[compound_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        mask &= (compound >= low) & (compound <= high)
+    return np.flatnonzero(mask)
+
+
+def sort_rows(df, positions, by=None, ascending=True):
+    """Urutkan posisi baris menurut kolom `by` (stable, NaN di akhir); None = urutan asli."""
+    if by is None:
+        return positions
+    values = df[by].iloc[positions].reset_index(drop=True)
+    order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    return positions[order]
+
+
+def query_rows(df, labels=None, compound_range=None, sort_by=None, ascending=True, rows=None):
+    """filter_rows + sort_rows dalam satu panggilan."""
+    return sort_rows(df, filter_rows(df, labels, compound_range, rows=rows), sort_by, ascending)
+
+
+def page_count(n_rows, page_size=DEFAULT_PAGE_SIZE):
+    return max(1, -(-n_rows // page_size))
+
+
+def page_bounds(n_rows, page, page_size=DEFAULT_PAGE_SIZE):
+    """(start, stop) untuk halaman 1-based; halaman di luar rentang dijepit."""
+    page = min(max(1, page), page_count(n_rows, page_size))
+    start = (page - 1) * page_size
+    return start, min(start + page_size, n_rows)
+
+
+def page_rows(df, positions, page, page_size=DEFAULT_PAGE_SIZE, columns=None):
+    """Potongan DataFrame untuk satu halaman dari hasil query_rows."""
+    start, stop = page_bounds(len(positions), page, page_size)
+    frame = df if columns is None else df[list(columns)]
+    return frame.iloc[positions[start:stop]]
@@ -0,0 +1,231 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# --- CONFIGURATION ---
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.cache', 'translations.sqlite3')
+MEMORY_CACHE_SIZE = 10000
+# Batas karakter per request Google Translate (~5000), diberi margin
+MAX_BATCH_CHARS = 4500
+# Jumlah teks per panggilan translate_batch pada translate_concurrent
+CONCURRENT_BATCH_SIZE = 50
+# Interval (detik) pengecekan `cancel` selama menunggu batch terjemahan
+CANCEL_POLL_SECONDS = 0.25
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    """Normalisasi teks untuk cache key: NFC + whitespace dirapikan."""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', str(text))).strip()
+
+
+# --- BACKENDS ---
+class TranslatorBackend:
+    """
+    Interface backend: terjemahkan list teks (sudah dinormalisasi) sekaligus.
+    Teks yang gagal diterjemahkan dikembalikan sebagai None (tidak di-cache).
+    """
+
+    name = 'base'
+
+    def translate_batch(self, texts, source='auto', target='en'):
+        raise NotImplementedError
+
+
+class GoogleBackend(TranslatorBackend):
+    """
+    Backend deep_translator.GoogleTranslator. Beberapa teks digabung per baris
+    dalam satu request (maks MAX_BATCH_CHARS); jika jumlah baris hasil tidak
+    cocok, batch tersebut diulang per teks.
+    """
+
+    name = 'google'
+
+    def __init__(self, max_chars=MAX_BATCH_CHARS):
+        self.max_chars = max_chars
+
+    def _packs(self, texts):
+        pack, size = [], 0
+        for text in texts:
+            if pack and size + len(text) + 1 > self.max_chars:
+                yield pack
+                pack, size = [], 0
+            pack.append(text)
+            size += len(text) + 1
+        if pack:
+            yield pack
+
+    def translate_batch(self, texts, source='auto', target='en'):
+        from deep_translator import GoogleTranslator
+
+        translator = GoogleTranslator(source=source, target=target)
+        results = []
+        for pack in self._packs(texts):
+            if len(pack) == 1:
+                results.append(translator.translate(pack[0]) or None)
+                continue
+            lines = (translator.translate('\n'.join(pack)) or '').split('\n')
+            if len(lines) != len(pack):
+                lines = [translator.translate(text) for text in pack]
+            # Hasil kosong = gagal: None agar Translator memakai teks asli tanpa menyimpannya
+            results.extend(line or None for line in lines)
+        return results
+
+
+class StubBackend(TranslatorBackend):
+    """Backend lokal untuk test/benchmark offline: pakai mapping atau kembalikan teks asli."""
+
+    name = 'stub'
+
+    def __init__(self, mapping=None, prefix=''):
+        self.mapping = mapping or {}
+        self.prefix = prefix
+        self.calls = 0
+        self.texts_sent = 0
+
+    def translate_batch(self, texts, source='auto', target='en'):
+        self.calls += 1
+        self.texts_sent += len(texts)
+        return [self.mapping.get(text, self.prefix + text) for text in texts]
+
+
+# --- CACHE ---
+class TranslationCache:
+    """LRU di memori di depan tabel SQLite, key = (teks ternormalisasi, source, target)."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, memory_size=MEMORY_CACHE_SIZE):
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            if path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'text TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, '
+                'translated TEXT NOT NULL, PRIMARY KEY (text, source, target))'
+            )
+            self._db.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_many(self, texts, source, target):
+        """Dict teks -> terjemahan untuk teks yang sudah ada di cache."""
+        found, missing = {}, []
+        with self._lock:
+            for text in texts:
+                key = (text, source, target)
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[text] = self._memory[key]
+                else:
+                    missing.append(text)
+            if self._db is not None and missing:
+                # Batas variabel SQLite: query per 500 teks
+                for start in range(0, len(missing), 500):
+                    part = missing[start:start + 500]
+                    rows = self._db.execute(
+                        'SELECT text, translated FROM translations WHERE source = ? AND target = ? '
+                        f'AND text IN ({",".join("?" * len(part))})',
+                        [source, target, *part],
+                    ).fetchall()
+                    for text, translated in rows:
+                        found[text] = translated
+                        self._remember((text, source, target), translated)
+        return found
+
+    def put_many(self, pairs, source, target):
+        with self._lock:
+            for text, translated in pairs:
+                self._remember((text, source, target), translated)
+            if self._db is not None and pairs:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO translations (text, source, target, translated) VALUES (?, ?, ?, ?)',
+                    [(text, source, target, translated) for text, translated in pairs],
+                )
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# --- TRANSLATOR ---
+class Translator:
+    """Translator ber-cache: hanya teks unik yang belum pernah diterjemahkan dikirim ke backend."""
+
+    def __init__(self, backend=None, cache=None):
+        self.backend = backend if backend is not None else GoogleBackend()
+        self.cache = cache if cache is not None else TranslationCache()
+
+    def translate_batch(self, texts, source='auto', target='en'):
+        normalized = [normalize_text(text) for text in texts]
+        unique = [text for text in dict.fromkeys(normalized) if text]
+        translated = self.cache.get_many(unique, source, target)
+
+        missing = [text for text in unique if text not in translated]
+        if missing:
+            results = self.backend.translate_batch(missing, source=source, target=target)
+            # Hanya terjemahan yang berhasil di-cache; yang gagal dicoba lagi di panggilan berikutnya
+            pairs = [(text, result) for text, result in zip(missing, results) if result]
+            self.cache.put_many(pairs, source, target)
+            translated.update(pairs)
+
+        # Tanpa terjemahan (gagal / teks kosong): teks asli apa adanya, bukan versi ternormalisasi
+        return [translated.get(norm, text) for norm, text in zip(normalized, texts)]
+
+    def translate(self, text, source='auto', target='en'):
+        return self.translate_batch([text], source=source, target=target)[0]
+
+
+def translate_concurrent(texts, translator, source='auto', target='en', max_workers=4,
+                         batch_size=CONCURRENT_BATCH_SIZE, timeout=None, cancel=None):
+    """
+    Terjemahkan banyak teks lewat thread pool terbatas (max_workers request paralel).
+
+    Batch yang gagal atau belum selesai saat `timeout` (detik, total) dikembalikan
+    sebagai teks asli agar proses bulk selalu selesai dalam waktu terbatas.
+    `cancel` (mis. threading.Event) dicek tiap CANCEL_POLL_SECONDS di thread
+    pemanggil; begitu `cancel.is_set()`, batch yang belum selesai tidak ditunggu.
+    """
+    texts = list(texts)
+    results = list(texts)
+    if not texts:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {
+        executor.submit(translator.translate_batch, texts[start:start + batch_size], source, target): start
+        for start in range(0, len(texts), batch_size)
+    }
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = set(futures)
+    try:
+        while pending and not (cancel is not None and cancel.is_set()):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            if cancel is not None:
+                remaining = CANCEL_POLL_SECONDS if remaining is None else min(remaining, CANCEL_POLL_SECONDS)
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    start = futures[future]
+                    translated = future.result()
+                    results[start:start + len(translated)] = translated
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
@@ -0,0 +1,95 @@
+"""
+Komponen Streamlit yang dipakai bersama oleh halaman dashboard. Modul ini
+tidak diimpor oleh CLI, server maupun worker scoring (hanya oleh `pages/`).
+"""
+import streamlit as st
+
+from core.scoring import LABELS
+from core.table import DEFAULT_PAGE_SIZE, PAGE_SIZES, page_bounds, page_count, page_rows
+
+
+def paged_dataframe(df, key, query, sort_options, columns=None, column_config=None, filters=True, search=False):
+    """
+    Tabel dengan filter/sort/pagination di server: hanya baris di halaman aktif
+    yang dikirim ke browser. `query(labels, compound_range, sort_by, ascending, search)`
+    mengembalikan posisi baris; kembalikan jumlah baris yang dirender.
+    """
+    labels, compound_range, sort_by, descending, keywords = tuple(LABELS), (-1.0, 1.0), None, False, ''
+    if search:
+        keywords = st.text_input(
+            "🔎 Cari ulasan",
+            key=f"{key}_search",
+            placeholder='audio -video   connect*   "no sound"',
+            help="Semua kata harus muncul (AND). `kata*` = awalan, `-kata` = kecualikan, "
+                 "\"frasa\" = urutan kata persis, -\"frasa\" = kecualikan frasa. Tidak peka huruf besar/kecil.",
+        )
+    if filters:
+        c_label, c_range, c_sort, c_order = st.columns([2, 2, 1.5, 1])
+        labels = tuple(c_label.multiselect("Filter Label", LABELS, default=LABELS, key=f"{key}_labels"))
+        compound_range = tuple(c_range.slider("Rentang Compound", -1.0, 1.0, (-1.0, 1.0), 0.01, key=f"{key}_range"))
+        sort_by = c_sort.selectbox(
+            "Urutkan", [None, *sort_options], key=f"{key}_sort",
+            format_func=lambda column: "(urutan asli)" if column is None else column,
+        )
+        descending = c_order.checkbox("Menurun", key=f"{key}_desc")
+    positions = query(labels, compound_range, sort_by, not descending, keywords)
+
+    c_size, c_page, c_info = st.columns([1, 1, 3])
+    page_size = c_size.selectbox(
+        "Baris / Halaman", PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key=f"{key}_size"
+    )
+    n_pages = page_count(len(positions), page_size)
+    # Jepit nomor halaman lama jika filter membuat jumlah halaman berkurang
+    if st.session_state.get(f"{key}_page", 1) > n_pages:
+        st.session_state[f"{key}_page"] = n_pages
+    page = c_page.number_input("Halaman", min_value=1, max_value=n_pages, key=f"{key}_page")
+    start, stop = page_bounds(len(positions), page, page_size)
+    c_info.caption(
+        f"Baris {start + 1 if stop else 0:,}–{stop:,} dari {len(positions):,} hasil filter "
+        f"(total {len(df):,} baris) • halaman {page} / {n_pages}"
+    )
+    st.dataframe(
+        page_rows(df, positions, page, page_size, columns),
+        column_config=column_config,
+        use_container_width=True,
+    )
+    return stop - start
+
+
+def performance_panel(timings, key, profile_toggle=False, scope=''):
+    """
+    Expander "Performance": waktu, jumlah baris & delta memori per tahap dari
+    StageTimings (+ profil cProfile jika direkam), bisa diunduh sebagai JSON.
+    `profile_toggle` menambah checkbox `{key}_profile` untuk merekam profil
+    pada rerun berikutnya; `scope` melengkapi keterangan total waktu.
+    """
+    with st.expander("⏱️ Performance"):
+        if profile_toggle:
+            st.checkbox("🔬 Profil cProfile", key=f"{key}_profile", help="Rekam profil fungsi (cProfile) pada rerun halaman.")
+        stages = timings.frame()
+        if stages.empty:
+            st.caption("Belum ada tahap yang tercatat.")
+            return
+        st.caption(f"Total {timings.total_seconds:,.3f} detik di {len(stages)} tahap{scope}.")
+        st.dataframe(
+            stages,
+            column_config={
+                "seconds": st.column_config.NumberColumn("Detik", format="%.3f"),
+                "share": st.column_config.ProgressColumn("Porsi", format="%.0f%%", min_value=0, max_value=1),
+                "rows_per_sec": st.column_config.NumberColumn("Baris/detik", format="%,.0f"),
+                "rss_delta_mb": st.column_config.NumberColumn("Δ RSS (MB)", format="%.1f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+        )
+        profile = timings.profile_text()
+        if profile:
+            st.markdown("**cProfile (cumulative, fungsi teratas)**")
+            st.code(profile, language=None)
+        st.download_button(
+            "📥 Download Timings (JSON)",
+            data=timings.to_json(indent=2),
+            file_name="vader_timings.json",
+            mime="application/json",
+            key=f"{key}_timings",
+        )
@@ -1,8 +1,18 @@
 import streamlit as st
-import pandas as pd
 import os
-from PIL import Image
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import altair as alt
+from core.aggregate import label_counts, summarize
+from core.artifact import load_reviews, load_validation
+from core.assets import asset_html
+from core.calibration import SWEEP_METRICS, best_thresholds, sweep_thresholds, symmetric_sweep
+from core.dataset import file_fingerprint, lexicon_version
+from core.instrument import StageTimings
+from core.lexicon import load_analyzer
+from core.metrics import bootstrap_ci, evaluate
+from core.search import load_index
+from core.scoring import LABELS, POS_THRESHOLD, NEG_THRESHOLD, get_thresholds, reset_thresholds, save_thresholds
+from core.table import query_rows
+from core.ui import paged_dataframe, performance_panel
 
 # --- CONFIGURATION ---
 st.set_page_config(
@@ -37,9 +47,85 @@ st.markdown("""
 # --- INITIALIZATION ---
 @st.cache_resource
 def get_analyzer():
-    return SentimentIntensityAnalyzer()
+    # Analyzer dari lexicon terkompilasi (.cache/), tanpa parse ulang file lexicon
+    return load_analyzer()
 
-sid = get_analyzer()
+@st.cache_data(show_spinner="⏳ Memuat dataset terskor...", max_entries=4)
+def load_scored_reviews(path, mtime_ns, content_hash, lexicon_ver, thresholds):
+    # mtime, hash konten, versi lexicon & threshold global hanya dipakai sebagai cache key.
+    # Data dibaca dari artifact Feather (python -m core.artifact); jika TSV bertambah
+    # hanya teks baru/berubah yang diskor lalu digabung ke artifact
+    return load_reviews(get_analyzer(), source=path)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_validation_data(path, mtime_ns, content_hash):
+    return load_validation(source=path)
+
+@st.cache_data(show_spinner="⏳ Menghitung metrik validasi...", max_entries=4)
+def compute_validation_metrics(reviews_key, validation_key):
+    # Label manual (CM.tsv) vs label VADER terkini dari dataset terskor, dicocokkan per teks;
+    # cache key = fingerprint kedua file + versi lexicon
+    pairs = load_validation_pairs(reviews_key, validation_key)
+    cm, report, scores = evaluate(pairs['label_manual'], pairs['label'])
+    return cm, report, float(scores['accuracy']), bootstrap_ci(cm.to_numpy())
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_validation_pairs(reviews_key, validation_key):
+    # label_manual dari CM.tsv + compound/label terkini dari dataset terskor, dicocokkan per teks
+    df = load_scored_reviews(*reviews_key)
+    df1 = load_validation_data(*validation_key)
+    scored = df.drop_duplicates('content').set_index('content')
+    return df1[['label_manual']].assign(
+        compound=df1['content'].map(scored['compound']),
+        label=df1['content'].map(scored['label']),
+    )
+
+@st.cache_data(show_spinner="⏳ Menyapu threshold...", max_entries=4)
+def compute_threshold_sweep(reviews_key, validation_key):
+    pairs = load_validation_pairs(reviews_key, validation_key)
+    return sweep_thresholds(pairs['compound'], pairs['label_manual'])
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def aggregate_reviews(reviews_key):
+    # Jumlah label & histogram compound dihitung sekali per versi dataset (+ threshold);
+    # grafik hanya menerima frame agregat kecil, bukan baris mentah
+    return summarize(load_scored_reviews(*reviews_key))
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def aggregate_validation(validation_key):
+    return label_counts(load_validation_data(*validation_key)['label_manual'])
+
+LABEL_COLORS = ['#28a745', '#ffc107', '#dc3545']
+
+def label_chart(counts, color):
+    return st.bar_chart(counts.set_index('label')['count'], color=color)
+
+def histogram_chart(histogram):
+    # Histogram compound pre-binned (stacked per label)
+    chart = alt.Chart(histogram).mark_bar().encode(
+        x=alt.X('bin_start:Q', bin='binned', title='Compound'),
+        x2='bin_end:Q',
+        y=alt.Y('sum(count):Q', stack=True, title='Jumlah Ulasan'),
+        color=alt.Color('label:N', scale=alt.Scale(domain=LABELS, range=LABEL_COLORS), title=None),
+        tooltip=['label', 'bin_start', 'bin_end', 'count'],
+    ).properties(height=300)
+    return st.altair_chart(chart, use_container_width=True)
+
+@st.cache_resource(show_spinner="⏳ Menyiapkan index pencarian...", max_entries=4)
+def get_search_index(path, mtime_ns, content_hash, _texts):
+    # Inverted index token per versi file dataset (threshold/lexicon tidak memengaruhi teks);
+    # dibaca dari .cache/ jika sudah pernah dibangun untuk teks yang sama
+    return load_index(_texts)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def query_reviews(reviews_key, labels, compound_range, sort_by, ascending, search=''):
+    # Hanya posisi baris yang di-cache; tabel diambil dari load_scored_reviews (cached).
+    # Kata kunci dicari lewat index token, lalu digabung dengan filter label/compound
+    df = load_scored_reviews(*reviews_key)
+    rows = get_search_index(*reviews_key[:3], df['content']).search(search) if search.strip() else None
+    return query_rows(df, labels, compound_range, sort_by, ascending, rows=rows)
+
+METRIC_NAMES = {'accuracy': 'Accuracy', 'macro_f1': 'Macro F1', 'weighted_f1': 'Weighted F1'}
 
 # Setup Path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -52,13 +138,36 @@ st.markdown("Studi kasus analisis sentimen pada ulasan aplikasi **ZOOM** (Google
 st.markdown("---")
 
 # --- MAIN CONTENT ---
+# Waktu per tahap untuk rerun ini (panel Performance di bawah halaman)
+timings = StageTimings(profile=st.session_state.get('results_perf_profile', False))
+timings.start_profile()
 try:
     # 1. LOAD DATA SECTION
     df_path = os.path.join(data_dir, 'Data Ulasan.tsv')
-    df = pd.read_csv(df_path, sep='\t')
+    pos_threshold, neg_threshold = get_thresholds()
+    with timings.stage('fingerprint'):
+        reviews_key = (*file_fingerprint(df_path), lexicon_version(), (pos_threshold, neg_threshold))
+    with timings.stage('load_reviews') as info:
+        df = load_scored_reviews(*reviews_key)
+        info['rows'] = len(df)
     
-    with st.expander("📂 Klik untuk melihat Dataset Awal (Raw Data)", expanded=False):
-        st.dataframe(df, use_container_width=True)
+    with timings.stage('search_index', rows=len(df)):
+        search_index = get_search_index(*reviews_key[:3], df['content'])
+
+    def query_scored(labels, compound_range, sort_by, ascending, search=''):
+        return query_reviews(reviews_key, labels, compound_range, sort_by, ascending, search)
+
+    with st.expander("📂 Klik untuk melihat & mencari Dataset Awal (Raw Data)", expanded=False), \
+            timings.stage('render_table') as info:
+        info['rows'] = paged_dataframe(
+            df, key='raw_table', query=query_scored,
+            sort_options=['content', 'compound'], columns=['content', 'label', 'compound'],
+            search=True,
+        )
+        st.caption(
+            f"Index pencarian: {len(search_index.vocab):,} kata unik dari {len(search_index.texts):,} teks unik "
+            "(dibangun sekali per versi dataset)."
+        )
 
     # 2. IMPLEMENTATION SECTION
     st.markdown('<div class="header-style">1. VADER Implementation & Scoring</div>', unsafe_allow_html=True)
@@ -69,49 +178,63 @@ try:
         Proses ini menghitung skor polaritas untuk setiap ulasan.
         Skor **Compound** adalah metrik utama normalisasi (-1 s/d 1).
         """)
+        n_unique = df.attrs.get('unique_texts', len(df))
+        st.caption(
+            f"🧬 {n_unique:,} teks unik dari {len(df):,} ulasan "
+            f"(dedup ratio {1 - n_unique / max(len(df), 1):.1%}) — setiap teks unik hanya diskor sekali."
+        )
+        if df.attrs.get('source') == 'artifact':
+            st.caption("📦 Skor dimuat dari artifact `data/scored_reviews.feather`.")
+        elif df.attrs.get('source') == 'incremental':
+            st.caption(
+                f"🔁 Data bertambah/berubah: hanya {df.attrs.get('rescored_texts', 0):,} teks baru/berubah "
+                "yang diskor, sisanya dipakai ulang dari artifact."
+            )
+        else:
+            st.caption("⚙️ Artifact tidak ada / versi lexicon berubah, semua skor dihitung dari TSV lalu disimpan ke artifact.")
     
     with col_process:
-        # Proses Analisis
-        df['scores'] = df['content'].apply(lambda content: sid.polarity_scores(str(content)))
-        
-        # Ekstrak compound untuk visualisasi dataframe
-        df['compound'] = df['scores'].apply(lambda d: d['compound'])
-        
-        # Tampilkan Dataframe dengan Bar Chart mini pada kolom Compound
-        st.dataframe(
-            df[['content', 'compound']],
-            column_config={
-                "compound": st.column_config.ProgressColumn(
-                    "Sentiment Score",
-                    help="Nilai Compound VADER",
-                    format="%.4f",
-                    min_value=-1,
-                    max_value=1,
-                ),
-            },
-            use_container_width=True,
-            height=300
-        )
+        # Skor (neg/neu/pos/compound) & label sudah dihitung di load_scored_reviews (cached)
+        # Tampilkan Dataframe dengan Bar Chart mini pada kolom Compound (per halaman)
+        with timings.stage('render_table') as info:
+            info['rows'] = paged_dataframe(
+                df, key='score_table', query=query_scored, sort_options=[],
+                columns=['content', 'compound'],
+                column_config={
+                    "compound": st.column_config.ProgressColumn(
+                        "Sentiment Score",
+                        help="Nilai Compound VADER",
+                        format="%.4f",
+                        min_value=-1,
+                        max_value=1,
+                    ),
+                },
+                filters=False,
+            )
 
     st.markdown("---")
 
     # 3. LABELING SECTION
     st.markdown('<div class="header-style">2. Labeling & Distribution</div>', unsafe_allow_html=True)
 
-    # Logika Labeling
-    df['label'] = df['compound'].apply(lambda c: 'Positive' if c >= 0.05 else 'Negative' if c <= -0.05 else 'Neutral')
-    
-    # Hitung Distribusi
-    label_counts = df['label'].value_counts()
+    # Hitung Distribusi (agregat cached per versi dataset)
+    with timings.stage('aggregate', rows=len(df)):
+        aggregates = aggregate_reviews(reviews_key)
+    counts = aggregates['label_counts'].set_index('label')['count']
     
     # Tampilkan Metrik Besar
     m1, m2, m3 = st.columns(3)
-    m1.metric("Positive Reviews", label_counts.get('Positive', 0), ">= 0.05")
-    m2.metric("Neutral Reviews", label_counts.get('Neutral', 0), "-0.05 < x < 0.05")
-    m3.metric("Negative Reviews", label_counts.get('Negative', 0), "<= -0.05")
+    m1.metric("Positive Reviews", int(counts['Positive']), f">= {pos_threshold:g}")
+    m2.metric("Neutral Reviews", int(counts['Neutral']), f"{neg_threshold:g} < x < {pos_threshold:g}")
+    m3.metric("Negative Reviews", int(counts['Negative']), f"<= {neg_threshold:g}")
     
     # Grafik Distribusi
-    st.bar_chart(label_counts, color=["#4CAF50"]) # Hijau sederhana
+    c_dist, c_hist = st.columns(2)
+    with timings.stage('render_charts'):
+        with c_dist:
+            label_chart(aggregates['label_counts'], color="#4CAF50") # Hijau sederhana
+        with c_hist:
+            histogram_chart(aggregates['histogram'])
 
     st.markdown("---")
 
@@ -119,61 +242,147 @@ try:
     st.markdown('<div class="header-style">3. Validation: Manual vs VADER</div>', unsafe_allow_html=True)
     
     cm_path = os.path.join(data_dir, 'CM.tsv')
+    metrics = None
     if os.path.exists(cm_path):
-        df1 = pd.read_csv(cm_path, sep='\t')
+        validation_key = file_fingerprint(cm_path)
+        # label_manual di CM.tsv berupa singkatan 'P' / 'NT' / 'N'; core.metrics memetakannya
+        # ke Positive / Neutral / Negative
+        with timings.stage('validation_metrics'):
+            metrics = compute_validation_metrics(reviews_key, validation_key)
+        cm, report, accuracy, ci = metrics
         
-        # Mapping label agar seragam jika di file CM masih singkatan
-        # Asumsi: label_manual di file CM berisi 'P', 'N', 'NT' atau 'Positive' dst.
-        # Kita biarkan apa adanya untuk chart, tapi pastikan data terbaca
-        
-        tab_comp1, tab_comp2 = st.tabs(["📉 Visual Comparison", "📋 Confusion Matrix Data"])
+        tab_comp1, tab_comp2, tab_comp3 = st.tabs(
+            ["📉 Visual Comparison", "📋 Confusion Matrix Data", "📐 Precision / Recall / F1"]
+        )
         
         with tab_comp1:
             c1, c2 = st.columns(2)
             with c1:
                 st.subheader("VADER Prediction")
-                # Gunakan data df utama
-                st.bar_chart(df['label'].value_counts(), color="#FF4B4B")
+                # Gunakan agregat dataset utama
+                label_chart(aggregates['label_counts'], color="#FF4B4B")
             
             with c2:
                 st.subheader("Manual Ground Truth")
-                # Gunakan data CM
-                st.bar_chart(df1['label_manual'].value_counts(), color="#0068C9")
+                # Gunakan data CM (P/NT/N dipetakan ke label lengkap)
+                label_chart(aggregate_validation(validation_key), color="#0068C9")
         
         with tab_comp2:
-            st.write("Cross-tabulation (Confusion Matrix) antara Manual vs VADER:")
-            if 'label_vader' in df1.columns:
-                 ct = pd.crosstab(df1['label_manual'], df1['label_vader'])
-                 st.dataframe(ct, use_container_width=True)
-            else:
-                st.warning("Kolom 'label_vader' tidak ditemukan di CM.tsv")
+            st.write("Confusion Matrix antara Manual (baris) vs VADER (kolom):")
+            st.dataframe(cm, use_container_width=True)
+            st.caption(f"Dihitung dari {int(cm.to_numpy().sum()):,} ulasan berlabel manual yang cocok dengan dataset terskor.")
+
+        with tab_comp3:
+            st.dataframe(
+                report.style.format({'precision': '{:.3f}', 'recall': '{:.3f}', 'f1': '{:.3f}', 'support': '{:,}'}),
+                use_container_width=True,
+            )
+            st.write("Bootstrap 95% Confidence Interval:")
+            st.dataframe(ci.style.format('{:.3f}'), use_container_width=True)
 
     else:
         st.warning("File CM.tsv (Data Pembanding) tidak ditemukan.")
 
     st.markdown("---")
 
-    # 5. CONCLUSION SECTION
-    st.markdown('<div class="header-style">4. Conclusion & Accuracy</div>', unsafe_allow_html=True)
+    # 5. THRESHOLD CALIBRATION SECTION
+    st.markdown('<div class="header-style">4. Threshold Calibration</div>', unsafe_allow_html=True)
+
+    if metrics is not None:
+        # Compound diurutkan sekali per kelas manual; semua kandidat threshold dihitung
+        # dari hitungan kumulatif (searchsorted), bukan melabel ulang per kandidat
+        with timings.stage('threshold_sweep') as info:
+            sweep = compute_threshold_sweep(reviews_key, validation_key)
+            info['rows'] = len(sweep)
+        target_metric = st.selectbox("Optimasi untuk metrik", SWEEP_METRICS, index=1, format_func=METRIC_NAMES.get)
+        best = best_thresholds(sweep, target_metric)
+
+        col_sweep, col_apply = st.columns([2, 1])
+        with col_sweep:
+            tab_sym, tab_grid = st.tabs(["📈 Simetris (±t)", "🗺️ Grid Positive × Negative"])
+            with tab_sym:
+                curve = symmetric_sweep(sweep).melt(
+                    id_vars='pos_threshold', value_vars=SWEEP_METRICS, var_name='metric', value_name='score'
+                )
+                curve['metric'] = curve['metric'].map(METRIC_NAMES)
+                lines = alt.Chart(curve).mark_line().encode(
+                    x=alt.X('pos_threshold:Q', title='Threshold t (Positive >= t, Negative <= -t)'),
+                    y=alt.Y('score:Q', title='Score', scale=alt.Scale(zero=False)),
+                    color=alt.Color('metric:N', title=None),
+                    tooltip=['pos_threshold', 'metric', alt.Tooltip('score:Q', format='.4f')],
+                )
+                current = alt.Chart(alt.Data(values=[{'t': pos_threshold}])).mark_rule(strokeDash=[4, 4]).encode(x='t:Q')
+                st.altair_chart(lines + current, use_container_width=True)
+            with tab_grid:
+                # Grid 0.02 agar jumlah sel tetap di bawah batas baris Altair
+                step = (sweep['pos_threshold'] * 100).round().mod(2).eq(0) & (sweep['neg_threshold'] * 100).round().mod(2).eq(0)
+                heatmap = alt.Chart(sweep[step]).mark_rect().encode(
+                    x=alt.X('pos_threshold:O', title='Positive threshold', axis=alt.Axis(labelOverlap=True)),
+                    y=alt.Y('neg_threshold:O', title='Negative threshold', sort='descending', axis=alt.Axis(labelOverlap=True)),
+                    color=alt.Color(f'{target_metric}:Q', title=METRIC_NAMES[target_metric], scale=alt.Scale(scheme='viridis')),
+                    tooltip=['pos_threshold', 'neg_threshold', alt.Tooltip(f'{target_metric}:Q', format='.4f')],
+                )
+                st.altair_chart(heatmap, use_container_width=True)
+
+        with col_apply:
+            st.metric(f"{METRIC_NAMES[target_metric]} terbaik", f"{best[target_metric]:.4f}")
+            st.caption(
+                f"Threshold terbaik: Positive >= {best['pos_threshold']:g}, Negative <= {best['neg_threshold']:g} "
+                f"(aktif: {pos_threshold:g} / {neg_threshold:g})."
+            )
+            new_pos = st.number_input("Positive threshold", -1.0, 1.0, float(best['pos_threshold']), 0.01, format="%.2f")
+            new_neg = st.number_input("Negative threshold", -1.0, 1.0, float(best['neg_threshold']), 0.01, format="%.2f")
+            if st.button("✅ Terapkan secara global", use_container_width=True):
+                try:
+                    save_thresholds(new_pos, new_neg, metric=target_metric)
+                except (ValueError, OSError) as e:
+                    st.error(f"Gagal menyimpan threshold: {e}")
+                else:
+                    st.rerun()
+            if st.button(f"↩️ Reset ke ±{POS_THRESHOLD:g}", use_container_width=True,
+                         disabled=(pos_threshold, neg_threshold) == (POS_THRESHOLD, NEG_THRESHOLD)):
+                reset_thresholds()
+                st.rerun()
+            st.caption("Threshold global dipakai halaman ini, Live Demo, CLI & server (`data/thresholds.json`).")
+    else:
+        st.info("Kalibrasi membutuhkan CM.tsv (label manual).")
+
+    st.markdown("---")
+
+    # 6. CONCLUSION SECTION
+    st.markdown('<div class="header-style">5. Conclusion & Accuracy</div>', unsafe_allow_html=True)
     
     col_con_img, col_con_text = st.columns([1, 2])
     
     with col_con_img:
+        if metrics is not None:
+            st.dataframe(
+                report[['precision', 'recall', 'f1']].style.format('{:.2f}'),
+                use_container_width=True,
+            )
         img_path = os.path.join(img_dir, 'f1.png')
         if os.path.exists(img_path):
-            image = Image.open(img_path)
-            st.image(image, caption='F1-Score / Accuracy Matrix', use_container_width=True)
-        else:
-            st.text("Image not found")
+            with st.expander("🖼️ F1-Score / Accuracy Matrix (gambar skripsi)"):
+                # Varian WebP lossless ter-cache (per mtime), tanpa decode PNG di setiap rerun
+                st.markdown(asset_html(img_path, caption='F1-Score / Accuracy Matrix'), unsafe_allow_html=True)
             
     with col_con_text:
         # Menggunakan Container berborder untuk kesimpulan
         with st.container(border=True):
-            st.markdown("### 🏆 Final Accuracy: 85%")
-            st.markdown("""
+            if metrics is None:
+                st.markdown("### 🏆 Final Accuracy: -")
+                accuracy_text = "Data validasi (CM.tsv) tidak tersedia untuk menghitung akurasi."
+            else:
+                low, high = ci.loc['accuracy', ['lower', 'upper']]
+                st.markdown(f"### 🏆 Final Accuracy: {accuracy:.1%}")
+                accuracy_text = (
+                    f"VADER mencapai tingkat akurasi **{accuracy:.1%}** (95% CI {low:.1%} – {high:.1%}) "
+                    "pada dataset ulasan Zoom."
+                )
+            st.markdown(f"""
             Berdasarkan hasil pengujian komparasi antara VADER dan pelabelan manual:
             
-            * **Akurasi Tinggi:** VADER mencapai tingkat akurasi **85%** pada dataset ulasan Zoom.
+            * **Akurasi Tinggi:** {accuracy_text}
             * **Efisiensi:** Mampu memproses ribuan ulasan dalam hitungan detik tanpa memerlukan pelatihan model (training) yang berat.
             * **Kesimpulan:** VADER terbukti efektif sebagai solusi *Lexicon-based* untuk analisis sentimen cepat pada teks berbahasa Inggris.
             """)
@@ -182,3 +391,11 @@ except FileNotFoundError as e:
     st.error(f"❌ Error loading file: {e}. Please ensure 'Data Ulasan.tsv' exists in the 'data' folder.")
 except Exception as e:
     st.error(f"⚠️ An unexpected error occurred: {e}")
+finally:
+    timings.stop_profile()
+
+st.markdown("---")
+performance_panel(
+    timings, key='results_perf', profile_toggle=True,
+    scope=" pada rerun ini (tahap yang di-cache hanya mencatat waktu cache hit)",
+)
@@ -1,10 +1,20 @@
+import os
 import streamlit as st
-import langid
 import pandas as pd
-import io
+import time
 import altair as alt
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from deep_translator import GoogleTranslator
+from core.aggregate import segment_counts, summarize
+from core.export import EXPORT_FORMATS, export_bytes
+from core.ingest import UPLOAD_TYPES, content_hash, count_rows, detect_format, read_preview
+from core.instrument import StageTimings
+from core.lexicon import list_overlays, load_analyzer, overlay_key
+from core.parallel import PARALLEL_MIN_ROWS, default_workers, throughput
+from core.pipeline import RESULT_COLUMNS, analyze_text, collect_results, score_file
+from core.scoring import LABELS, get_thresholds
+from core.sentences import aggregate_sentences, iter_sentence_scores, split_sentences
+from core.table import query_rows
+from core.translation import Translator
+from core.ui import paged_dataframe, performance_panel
 
 # --- CONFIGURATION ---
 st.set_page_config(
@@ -34,35 +44,117 @@ st.markdown("""
 
 # --- INITIALIZATION ---
 @st.cache_resource
-def get_analyzer():
-    return SentimentIntensityAnalyzer()
+def get_analyzer(overlays, key):
+    # Analyzer dari lexicon terkompilasi (.cache/) + overlay domain; key = (path, sha256) per overlay,
+    # jadi edit file overlay otomatis membuat analyzer baru
+    return load_analyzer(overlays)
 
-sid = get_analyzer()
+@st.cache_data(show_spinner=False, max_entries=8)
+def load_preview(file_hash, file_format, _file):
+    # Preview di-cache per hash isi file: rerun / upload ulang file yang sama tidak membaca ulang
+    return read_preview(_file, file_format)
+
+# Hasil bulk per (hash file, kolom, opsi) yang disimpan di session; yang terlama dibuang
+SESSION_RESULTS = 4
+
+@st.cache_resource
+def get_translator():
+    # Cache LRU memori + SQLite (.cache/translations.sqlite3), backend GoogleTranslator
+    return Translator()
 
 # --- HELPER FUNCTIONS ---
+class TranslationCancelProbe:
+    """
+    Objek `cancel` untuk score_file: dicek berkala selama menunggu batch terjemahan.
+    Setiap update elemen st adalah titik Streamlit menghentikan run lama, jadi klik
+    Cancel (atau widget lain) langsung memutus tunggu terjemahan lewat RerunException.
+    """
+
+    def __init__(self, job, status_text, started):
+        self.job = job
+        self.status_text = status_text
+        self.started = started
+
+    def is_set(self):
+        self.status_text.text(
+            f"🌐 Menerjemahkan baris non-Inggris... {self.job['rows_done']:,} baris selesai • "
+            f"{time.perf_counter() - self.started:,.0f} detik"
+        )
+        return self.job['cancelled']
+
 def translate_text(text, target='en'):
     try:
-        return GoogleTranslator(source='auto', target=target).translate(text)
+        return get_translator().translate(text, target=target)
     except Exception as e:
         st.error(f"Translation failed: {e}")
         return text
 
-def convert_to_excel(df):
-    """Konversi DataFrame ke Bytes Excel"""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Sentiment Results')
-    return output.getvalue()
+SENTIMENT_COLORS = {
+    'Positive': "#28a745", # Green
+    'Negative': "#dc3545", # Red
+    'Neutral': "#ffc107", # Yellow/Orange
+}
+
+def get_sentiment_color(label):
+    return SENTIMENT_COLORS[label]
+
+# Interval minimum (detik) antar render ulang hasil per kalimat saat streaming
+SENTENCE_RENDER_INTERVAL = 0.2
+
+def sentence_frame(results):
+    # Baris per kalimat sesuai urutan input; kalimat yang belum selesai tidak ditampilkan
+    return pd.DataFrame([
+        {
+            '#': result['index'] + 1,
+            'Kalimat': result['sentence'],
+            'Bahasa': result['lang'],
+            'Terjemahan': result['text'] if result['is_translated'] else '',
+            'compound': result['scores']['compound'],
+            'Label': result['label'],
+            'Cache': '♻️' if result['cached'] else '',
+        }
+        for result in results if result is not None
+    ])
 
-def get_sentiment_color(compound):
-    if compound >= 0.05: return "#28a745" # Green
-    elif compound <= -0.05: return "#dc3545" # Red
-    return "#ffc107" # Yellow/Orange
+def render_sentence_results(summary_slot, table_slot, results, n_done, n_total):
+    summary = aggregate_sentences(result for result in results if result is not None)
+    cmp = summary['scores']['compound']
+    with summary_slot.container(border=True):
+        col_metric1, col_metric2 = st.columns(2)
+        col_metric1.metric("Overall Label", summary['label'])
+        col_metric2.metric("Weighted Compound", f"{cmp:.4f}")
+        st.progress((cmp + 1) / 2)
+        counts = " • ".join(f"{label}: {summary['label_counts'].get(label, 0)}" for label in LABELS)
+        st.caption(
+            f"{n_done:,} / {n_total:,} kalimat • {summary['words']:,} kata • {counts} "
+            "(compound dirata-rata berbobot jumlah kata per kalimat)"
+        )
+    table_slot.dataframe(
+        sentence_frame(results),
+        column_config={
+            "compound": st.column_config.ProgressColumn(
+                "Compound", format="%.4f", min_value=-1, max_value=1,
+            ),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    return summary
 
 # --- MAIN CONTENT ---
 st.title("🎮 VADER Live Demo")
 st.markdown("Uji kemampuan analisis sentimen VADER secara *real-time* atau menggunakan file dataset.")
 
+# Overlay lexicon domain (data/lexicons/*.tsv), dipakai bersama oleh kedua tab
+overlay_paths = st.multiselect(
+    "📚 Domain Lexicon Overlay",
+    list_overlays(),
+    format_func=os.path.basename,
+    help="File `word<TAB>valence` di data/lexicons/ yang menimpa/menambah lexicon VADER bawaan.",
+)
+lexicon_key = overlay_key(overlay_paths)
+sid = get_analyzer(tuple(overlay_paths), lexicon_key)
+
 tab1, tab2 = st.tabs(['💬 Single Sentence', '📂 Bulk File Upload'])
 
 # ==========================================
@@ -80,6 +172,12 @@ with tab1:
             placeholder="Contoh: I really love this new feature! It makes my life so much easier."
         )
         st.caption("ℹ️ Mendukung deteksi bahasa otomatis & terjemahan ke Inggris.")
+        sentence_mode = st.toggle(
+            "🧩 Analisis per kalimat (streaming)",
+            help="Untuk paragraf panjang: setiap kalimat dideteksi bahasanya, diterjemahkan & diskor "
+                 "secara paralel, hasilnya tampil satu per satu. Hasil per kalimat di-cache, jadi "
+                 "mengedit teks hanya menghitung ulang kalimat yang berubah.",
+        )
         
         c_act1, c_act2 = st.columns([1, 4])
         with c_act1:
@@ -88,20 +186,47 @@ with tab1:
             rr = st.button("🔄 Reset", use_container_width=False)
 
     with col_result:
-        if pro and vas:
+        if pro and vas.strip() and sentence_mode:
+            sentences = split_sentences(vas)
+            st.markdown("### Result")
+            summary_slot = st.empty()
+            progress_bar = st.progress(0.0)
+            table_slot = st.empty()
+            
+            # Hasil per kalimat di-stream sesuai urutan selesai (cache hit lebih dulu),
+            # ringkasan & tabel dirender ulang paling sering setiap SENTENCE_RENDER_INTERVAL detik
+            results = [None] * len(sentences)
+            n_done = n_cached = 0
+            last_render = 0.0
+            for item in iter_sentence_scores(sentences, sid, translate=get_translator().translate):
+                results[item['index']] = item
+                n_done += 1
+                n_cached += item['cached']
+                now = time.perf_counter()
+                if now - last_render >= SENTENCE_RENDER_INTERVAL or n_done == len(sentences):
+                    progress_bar.progress(n_done / len(sentences), text=f"⏳ {n_done:,} / {len(sentences):,} kalimat")
+                    summary = render_sentence_results(summary_slot, table_slot, results, n_done, len(sentences))
+                    last_render = now
+            
+            progress_bar.progress(1.0, text=(
+                f"✅ {len(sentences):,} kalimat • {n_cached:,} dari cache, "
+                f"{len(sentences) - n_cached:,} dihitung ulang"
+            ))
+            n_translated = sum(result['is_translated'] for result in results)
+            if n_translated:
+                st.info(f"🌐 {n_translated:,} kalimat non-Inggris diterjemahkan sebelum diskor.")
+            
+            with st.expander("View Detailed Scores (JSON)"):
+                st.json(summary)
+
+        elif pro and vas:
             with st.spinner('🔍 Analyzing sentiment...'):
-                # 1. Deteksi Bahasa
-                lang_detected, confidence = langid.classify(vas)
-                
-                # 2. Translasi jika perlu
-                text_to_analyze = vas
-                is_translated = False
-                if lang_detected != 'en':
-                    text_to_analyze = translate_text(vas)
-                    is_translated = True
-                
-                # 3. Analisis VADER
-                scr = sid.polarity_scores(text_to_analyze)
+                # Deteksi bahasa -> translasi jika perlu -> analisis VADER (core.pipeline)
+                result = analyze_text(vas, sid, translate=translate_text)
+                lang_detected = result['lang']
+                is_translated = result['is_translated']
+                text_to_analyze = result['text']
+                scr = result['scores']
                 cmp = scr["compound"]
                 
                 # --- TAMPILAN HASIL ---
@@ -114,8 +239,8 @@ with tab1:
                     st.success(f"🌐 Language Detected: **{lang_detected}**")
 
                 # Kartu Skor
-                sentiment_color = get_sentiment_color(cmp)
-                sentiment_label = "Positive" if cmp >= 0.05 else "Negative" if cmp <= -0.05 else "Neutral"
+                sentiment_label = result['label']
+                sentiment_color = get_sentiment_color(sentiment_label)
                 
                 with st.container(border=True):
                     col_metric1, col_metric2 = st.columns(2)
@@ -135,83 +260,197 @@ with tab1:
             st.rerun()
 
 # ==========================================
-# TAB 2: FILE UPLOAD (EXCEL SUPPORT)
+# TAB 2: FILE UPLOAD (EXCEL / CSV / PARQUET SUPPORT)
 # ==========================================
 with tab2:
-    st.markdown("#### 📂 Batch Analysis from Excel")
-    st.info("Upload file Excel (`.xlsx`) yang berisi data teks. Sistem akan memproses seluruh baris sekaligus.")
+    st.markdown("#### 📂 Batch Analysis from File")
+    st.info(
+        "Upload file Excel (`.xlsx`), CSV/TSV, atau Parquet/Arrow (`.parquet`, `.feather`, `.arrow`) yang berisi data teks. "
+        "File dibaca & diskor per chunk sehingga penggunaan memori tetap terbatas."
+    )
     
-    # 1. File Uploader khusus XLSX
-    file = st.file_uploader("Upload Excel File", type=['xlsx'])
+    # 1. File Uploader (Excel, CSV/TSV, Parquet/Arrow)
+    file = st.file_uploader("Upload Data File", type=UPLOAD_TYPES)
     
     if file is not None:
         try:
-            # Baca Excel dengan engine openpyxl
-            data_files = pd.read_excel(file, engine='openpyxl')
+            # Hanya preview yang dibaca di awal; isi file di-stream saat diproses.
+            # Hash isi file dihitung sekali per upload (file_id) lalu dipakai sebagai cache key
+            file_format = detect_format(file.name)
+            upload_hashes = st.session_state.setdefault('upload_hashes', {})
+            if file.file_id not in upload_hashes:
+                upload_hashes[file.file_id] = content_hash(file)
+            file_hash = upload_hashes[file.file_id]
+            preview = load_preview(file_hash, file_format, file)
             
             st.write("### Preview Data")
-            st.dataframe(data_files.head(), use_container_width=True)
+            st.dataframe(preview, use_container_width=True)
             
             # Pilihan Kolom
-            columns = data_files.columns.tolist()
+            columns = preview.columns.tolist()
             col_sel1, col_sel2 = st.columns([1, 2])
             
             with col_sel1:
                 option = st.selectbox('Pilih Kolom Teks untuk Dianalisis:', columns)
+                keep_columns = st.multiselect(
+                    'Kolom lain yang disertakan di hasil:',
+                    [name for name in columns if name != option],
+                    default=[name for name in columns if name != option],
+                    help="Kosongkan untuk file sangat besar: hanya kolom teks yang dibaca."
+                )
+                n_workers = st.number_input(
+                    'Jumlah Worker (CPU):',
+                    min_value=1,
+                    max_value=default_workers(),
+                    value=default_workers(),
+                    help=f"File < {PARALLEL_MIN_ROWS:,} baris otomatis diproses serial (1 core)."
+                )
+                dedup_bulk = st.checkbox(
+                    '🧬 Skor teks identik sekali saja (dedup)',
+                    value=True,
+                    help="Baris dengan teks sama diskor sekali lalu hasilnya disebar kembali."
+                )
+                translate_bulk = st.checkbox(
+                    '🌐 Deteksi bahasa & terjemahkan baris non-Inggris',
+                    help="Hanya teks unik non-Inggris yang diterjemahkan (paralel & ber-cache)."
+                )
+                export_format = st.selectbox(
+                    'Format File Hasil:',
+                    list(EXPORT_FORMATS),
+                    format_func=lambda key: EXPORT_FORMATS[key]['label'],
+                    help="CSV/Parquet/JSONL jauh lebih cepat dari Excel untuk data besar."
+                )
+                profile_bulk = st.checkbox(
+                    '🔬 Profil cProfile',
+                    help="Rekam profil fungsi (cProfile) selama scoring; tampil di panel Performance. Menambah overhead."
+                )
             
             with col_sel2:
                 st.write("") # Spacer
                 st.write("") 
-                prf = st.button('⚡ Process Entire File', type="primary")
+                c_run, c_cancel = st.columns([1, 1])
+                with c_run:
+                    prf = st.button('⚡ Process Entire File', type="primary")
+                with c_cancel:
+                    # Klik Cancel memicu rerun yang menghentikan loop scoring;
+                    # chunk yang sudah selesai tetap tersimpan di session_state
+                    cancel = st.button('⛔ Cancel')
             
             # Proses Data
-            if prf:
-                progress_bar = st.progress(0)
-                status_text = st.empty()
+            # Key hasil: isi file + kolom + opsi yang memengaruhi skor (jumlah worker tidak)
+            job_key = (file_hash, option, tuple(keep_columns), translate_bulk, dedup_bulk, lexicon_key, get_thresholds())
+            jobs = st.session_state.setdefault('bulk_jobs', {})
+            job = jobs.get(job_key)
+            if cancel and job is not None and not job['finished']:
+                job['cancelled'] = True
+            
+            show_result = False
+            if prf and job is not None and job['finished']:
+                st.info("♻️ File & opsi ini sudah diproses di sesi ini — hasil dipakai ulang tanpa scoring ulang.")
+                show_result = True
+            elif prf:
+                timings = StageTimings(profile=profile_bulk)
+                with timings.stage('count_rows') as info:
+                    total = count_rows(file, file_format)
+                    info['rows'] = total or 0
+                job = {'key': job_key, 'parts': [], 'rows_done': 0, 'total': total,
+                       'finished': False, 'cancelled': False, 'stats': {}, 'timings': timings}
+                jobs.pop(job_key, None)
+                jobs[job_key] = job
+                while len(jobs) > SESSION_RESULTS:
+                    jobs.pop(next(iter(jobs)))
                 
-                # Simulasi progress
+                progress_bar = st.progress(0.0)
+                status_text = st.empty()
                 status_text.text('⏳ Calculating Sentiment Scores...')
-                progress_bar.progress(30)
                 
-                # Pastikan kolom string
-                data_files['scores'] = data_files[option].astype(str).apply(
-                    lambda content: sid.polarity_scores(content)
+                # Pipeline streaming: baca chunk -> (deteksi bahasa & terjemahan) ->
+                # scoring per chunk (multi-proses jika cukup besar); progress
+                # dilaporkan setelah setiap chunk selesai
+                # Tahap read / detect_language / translate / score / label dicatat di job['timings']
+                started = time.perf_counter()
+                results = score_file(
+                    file, file_format, option, sid,
+                    keep_columns=keep_columns,
+                    workers=n_workers,
+                    dedup=dedup_bulk,
+                    translator=get_translator() if translate_bulk else None,
+                    stats=job['stats'],
+                    timings=timings,
+                    cancel=TranslationCancelProbe(job, status_text, started) if translate_bulk else None,
                 )
-                
-                progress_bar.progress(60)
-                status_text.text('🏷️ Assigning Labels...')
-                
-                # Ekstrak compound & label
-                data_files['compound'] = data_files["scores"].apply(lambda d: d['compound'])
-                data_files['label'] = data_files['compound'].apply(
-                    lambda c: 'Positive' if c >= 0.05 else 'Negative' if c <= -0.05 else 'Neutral'
+                try:
+                    with timings.profiled():
+                        for rows_done, part in results:
+                            job['parts'].append(part)
+                            job['rows_done'] = rows_done
+                            # Jumlah baris CSV hanya estimasi, jadi total disesuaikan bila terlampaui
+                            total = max(total or 0, rows_done)
+                            rate, eta = throughput(rows_done, total, time.perf_counter() - started)
+                            progress_bar.progress(rows_done / total)
+                            status_text.text(
+                                f"⏳ {rows_done:,} / ~{total:,} baris • {rate:,.0f} baris/detik • ETA {eta:,.1f} detik"
+                            )
+                    job['finished'] = True
+                    job['total'] = job['rows_done']
+                finally:
+                    if not job['finished']:
+                        # Run terputus (Cancel, widget lain memicu rerun, atau error): job ditandai
+                        # dibatalkan agar hasil parsial tetap tampil & Process memulai ulang job ini
+                        job['cancelled'] = True
+                        results.close()
+                elapsed = time.perf_counter() - started
+                progress_bar.progress(1.0)
+                n_rows = job['rows_done']
+                n_unique = job['stats'].get('unique', n_rows)
+                status_text.text(
+                    f"✅ Done! {n_rows:,} baris ({n_unique:,} teks unik, dedup ratio "
+                    f"{1 - n_unique / max(n_rows, 1):.1%}) dalam {elapsed:,.2f} detik."
                 )
-                
-                progress_bar.progress(100)
-                status_text.text('✅ Done!')
+                show_result = True
+            elif job is not None and job['cancelled'] and job['rows_done'] > 0:
+                st.warning(
+                    f"⛔ Proses dibatalkan. Menampilkan hasil parsial "
+                    f"{job['rows_done']:,} dari ~{job['total'] or 0:,} baris."
+                )
+                show_result = True
+            elif job is not None and job['finished']:
+                # Rerun karena filter/halaman tabel: pakai hasil yang sudah ada, tanpa scoring ulang
+                show_result = True
+            
+            if show_result:
+                # Potongan hasil per chunk (kolom input + neg/neu/pos/compound/label),
+                # digabung sekali lalu disimpan di job agar rerun tidak concat ulang
+                # Job dari sesi lama (sebelum ada instrumentasi) mendapat akumulator kosong
+                timings = job.setdefault('timings', StageTimings())
+                if job.get('result') is None:
+                    with timings.stage('concat', rows=job['rows_done']):
+                        job['result'] = collect_results(job['parts'])
+                    # Potongan sudah tergabung di result; jangan simpan data dua kali di session_state
+                    job['parts'] = []
+                data_files = job['result']
                 
                 # --- VISUALISASI HASIL (CHART) ---
                 st.markdown("---")
                 st.markdown("### 📊 Visualisasi Hasil")
                 
-                # 1. Hitung Jumlah Label
-                label_counts = data_files['label'].value_counts().reset_index()
-                label_counts.columns = ['Sentiment', 'Count']
+                # 1. Hitung Jumlah Label & histogram compound sekali per hasil (agregat kecil, disimpan di job)
+                if job.get('aggregates') is None:
+                    with timings.stage('aggregate', rows=len(data_files)):
+                        job['aggregates'] = summarize(data_files)
+                aggregates = job['aggregates']
+                label_counts = aggregates['label_counts'].rename(columns={'label': 'Sentiment', 'count': 'Count'})
+                counts = label_counts.set_index('Sentiment')['Count']
                 
                 # 2. Tampilkan Metrik
                 col_m1, col_m2, col_m3 = st.columns(3)
                 
-                # Helper untuk ambil nilai aman
-                def get_count(label):
-                    val = label_counts[label_counts['Sentiment'] == label]['Count'].values
-                    return val[0] if len(val) > 0 else 0
-                
                 with col_m1:
-                    st.metric("Positive Reviews", int(get_count('Positive')), border=True)
+                    st.metric("Positive Reviews", int(counts['Positive']), border=True)
                 with col_m2:
-                    st.metric("Neutral Reviews", int(get_count('Neutral')), border=True)
+                    st.metric("Neutral Reviews", int(counts['Neutral']), border=True)
                 with col_m3:
-                    st.metric("Negative Reviews", int(get_count('Negative')), border=True)
+                    st.metric("Negative Reviews", int(counts['Negative']), border=True)
                 
                 # 3. Buat Chart dengan Altair (Warna Kustom)
                 # Skala Warna: Positive=Hijau, Neutral=Kuning, Negative=Merah
@@ -232,37 +471,97 @@ with tab2:
                 ).interactive()
                 
                 st.altair_chart(chart, use_container_width=True)
+
+                # 4. Histogram compound (pre-binned) & breakdown per kolom lain
+                color_scale = alt.Scale(domain=list(SENTIMENT_COLORS), range=list(SENTIMENT_COLORS.values()))
+                col_hist, col_seg = st.columns(2)
+                with col_hist:
+                    st.markdown("**Distribusi Compound**")
+                    histogram = alt.Chart(aggregates['histogram']).mark_bar().encode(
+                        x=alt.X('bin_start:Q', bin='binned', title='Compound'),
+                        x2='bin_end:Q',
+                        y=alt.Y('sum(count):Q', stack=True, title='Count'),
+                        color=alt.Color('label:N', scale=color_scale, legend=None),
+                        tooltip=['label', 'bin_start', 'bin_end', 'count'],
+                    ).properties(height=300)
+                    st.altair_chart(histogram, use_container_width=True)
+                with col_seg:
+                    segment_options = [
+                        column for column in data_files.columns
+                        if column not in RESULT_COLUMNS + [option, 'translated_text']
+                    ]
+                    st.markdown("**Breakdown per Segmen**")
+                    if segment_options:
+                        segment_column = st.selectbox('Kolom segmen:', segment_options, key='bulk_segment')
+                        by_month = st.checkbox('Kolom tanggal (per bulan)', key='bulk_segment_month')
+                        # Agregat per (kolom, periode) di-memo di job; interaksi berikutnya instan
+                        segments = job.setdefault('segments', {})
+                        segment_key = (segment_column, 'M' if by_month else None)
+                        if segment_key not in segments:
+                            segments[segment_key] = segment_counts(
+                                data_files[segment_column], data_files['label'], freq=segment_key[1]
+                            )
+                        breakdown = alt.Chart(segments[segment_key]).mark_bar().encode(
+                            x=alt.X('segment:N', sort=None, title=segment_column),
+                            y=alt.Y('count:Q', stack=True, title='Count'),
+                            color=alt.Color('label:N', scale=color_scale, legend=None),
+                            tooltip=['segment', 'label', 'count'],
+                        ).properties(height=240)
+                        st.altair_chart(breakdown, use_container_width=True)
+                    else:
+                        st.caption("Sertakan kolom lain (mis. tanggal / rating) di hasil untuk breakdown per segmen.")
                 
                 # --- TABEL DATA ---
                 st.markdown("### 📋 Tabel Data Lengkap")
-                st.dataframe(
-                    data_files,
-                    column_config={
-                        "compound": st.column_config.ProgressColumn(
-                            "Score",
-                            format="%.4f",
-                            min_value=-1,
-                            max_value=1,
-                            help="VADER Compound Score"
-                        )
-                    },
-                    use_container_width=True
-                )
+
+                def query_result(labels, compound_range, sort_by, ascending, search=''):
+                    # Memo satu query terakhir per job (posisi baris), dihitung ulang hanya jika filter berubah;
+                    # tabel bulk tanpa kotak pencarian, jadi `search` selalu kosong
+                    params = (labels, compound_range, sort_by, ascending)
+                    if job.get('query') is None or job['query'][0] != params:
+                        job['query'] = (params, query_rows(data_files, *params))
+                    return job['query'][1]
+
+                # render_table dicatat di setiap rerun (filter/halaman): calls = jumlah render
+                with timings.stage('render_table') as info:
+                    info['rows'] = paged_dataframe(
+                        data_files,
+                        key='bulk_table',
+                        query=query_result,
+                        sort_options=list(data_files.columns),
+                        column_config={
+                            "compound": st.column_config.ProgressColumn(
+                                "Score",
+                                format="%.4f",
+                                min_value=-1,
+                                max_value=1,
+                                help="VADER Compound Score"
+                            )
+                        },
+                    )
                 
-                # Download Section (EXCEL FORMAT)
+                # Download Section (Excel write-only / CSV / Parquet / JSONL, kolom skor flat)
                 st.success("Analisis Selesai! Silakan unduh hasilnya.")
                 
-                excel_data = convert_to_excel(data_files)
+                export_spec = EXPORT_FORMATS[export_format]
+                # File unduhan dibuat sekali per format, bukan di setiap rerun tabel
+                exports = job.setdefault('exports', {})
+                if export_format not in exports:
+                    with timings.stage(f'export_{export_format}', rows=len(data_files)):
+                        exports[export_format] = export_bytes(data_files, export_format)
+                export_data = exports[export_format]
                 
                 st.download_button(
-                    label="📥 Download Result as Excel (.xlsx)",
-                    data=excel_data,
-                    file_name="vader_analysis_result.xlsx",
-                    mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                    label=f"📥 Download Result as {export_spec['label']}",
+                    data=export_data,
+                    file_name=f"vader_analysis_result.{export_spec['ext']}",
+                    mime=export_spec['mime'],
                 )
 
+                performance_panel(timings, key='bulk')
+
         except ImportError:
-            st.error("❌ Library `openpyxl` belum terinstall. Mohon tambahkan ke requirements.txt.")
+            st.error("❌ Library `openpyxl` / `pyarrow` belum terinstall. Mohon tambahkan ke requirements.txt.")
         except Exception as e:
             st.error(f"❌ Terjadi kesalahan saat memproses file: {e}")
             
@@ -271,7 +570,7 @@ with tab2:
         st.markdown(
             """
             <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; border: 1px dashed #ccc; text-align: center;">
-                <p style="margin: 0; color: #666;">Drag and drop file Excel (.xlsx) di sini</p>
+                <p style="margin: 0; color: #666;">Drag and drop file Excel (.xlsx), CSV/TSV, atau Parquet/Arrow di sini</p>
             </div>
             """, 
             unsafe_allow_html=True
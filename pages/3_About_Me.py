@@ -1,6 +1,6 @@
 import streamlit as st
-from PIL import Image
 import os
+from core.assets import asset_html
 
 st.set_page_config(
     page_title="About Me",
@@ -53,10 +53,12 @@ with col1:
     profile_pic_path = os.path.join(img_dir, 'profile.png')
     
     if os.path.exists(profile_pic_path):
-        image = Image.open(profile_pic_path)
-        # Menampilkan gambar dengan class CSS untuk membuatnya bulat (perlu trik st.image atau markdown html)
-        # Streamlit standard image:
-        st.image(image, width=220, caption="Husna Rezal Dewantara")
+        # Varian WebP 440px (2x untuk HiDPI) dibuat sekali per mtime file lalu di-cache;
+        # rerun hanya mengirim ~10 KB, bukan decode PNG ~3 MB
+        st.markdown(
+            asset_html(profile_pic_path, display_width=220, caption="Husna Rezal Dewantara"),
+            unsafe_allow_html=True,
+        )
     else:
         # Placeholder jika foto belum diupload
         st.info("⚠️ Silakan upload foto profil bernama 'profile.png' ke folder 'img'.")
@@ -0,0 +1,108 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.export import EXPORT_FORMATS, export_bytes, format_from_path, write_result_stream, write_results
+from core.ingest import count_rows, iter_frames
+
+RESULTS = pd.DataFrame({
+    'content': ["great app", "aplikasi jelek, sering \"crash\"", "multi\nline, comma", "émoji 😀"],
+    'lang': ['en', 'id', 'en', 'fr'],
+    'neg': [0.0, 0.5, 0.0, 0.0],
+    'neu': [0.2, 0.5, 1.0, 1.0],
+    'pos': [0.8, 0.0, 0.0, 0.0],
+    'compound': [0.6249, -0.4767, 0.0, 0.0],
+    'label': ['Positive', 'Negative', 'Neutral', 'Neutral'],
+})
+
+
+def _read_back(data, fmt):
+    buffer = io.BytesIO(data)
+    if fmt == 'csv':
+        return pd.read_csv(buffer)
+    if fmt == 'jsonl':
+        return pd.read_json(buffer, lines=True)
+    if fmt == 'parquet':
+        return pd.read_parquet(buffer)
+    return pd.read_excel(buffer, engine='openpyxl')
+
+
+def _assert_same(frame, expected):
+    assert list(frame.columns) == list(expected.columns)
+    assert len(frame) == len(expected)
+    for name in expected.columns:
+        if expected[name].dtype.kind == 'f':
+            np.testing.assert_allclose(frame[name].to_numpy(dtype=np.float64), expected[name].to_numpy())
+        else:
+            assert frame[name].astype(str).tolist() == expected[name].astype(str).tolist(), name
+
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_export_bytes_round_trip(fmt):
+    _assert_same(_read_back(export_bytes(RESULTS, fmt), fmt), RESULTS)
+
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_stream_round_trip_in_parts(fmt, tmp_path):
+    path = tmp_path / f"results.{EXPORT_FORMATS[fmt]['ext']}"
+    parts = [RESULTS.iloc[:1], RESULTS.iloc[1:3], RESULTS.iloc[3:]]
+    assert write_result_stream(iter(parts), str(path), fmt) == len(RESULTS)
+    _assert_same(_read_back(path.read_bytes(), fmt), RESULTS)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet', 'xlsx'])
+def test_export_reads_back_through_ingest(fmt, tmp_path):
+    path = tmp_path / f"results.{fmt}"
+    write_results(RESULTS, str(path), fmt)
+    # CSV dihitung dari baris fisik (field multi-baris ikut terhitung); xlsx write-only tanpa dimensi -> None
+    assert count_rows(str(path), fmt) == {'csv': len(RESULTS) + 1, 'parquet': len(RESULTS), 'xlsx': None}[fmt]
+    frames = list(iter_frames(str(path), fmt, columns=['content', 'label'], chunk_size=3))
+    assert [len(frame) for frame in frames] == [3, 1]
+    _assert_same(pd.concat(frames, ignore_index=True), RESULTS[['content', 'label']])
+
+
+def test_nested_columns_are_dropped():
+    frame = RESULTS.assign(scores=[{'compound': value} for value in RESULTS['compound']])
+    _assert_same(_read_back(export_bytes(frame, 'csv'), 'csv'), RESULTS)
+
+
+def test_format_from_path_and_unknown_format():
+    assert format_from_path('out/results.PARQUET') == 'parquet'
+    assert format_from_path('-') == 'csv'
+    with pytest.raises(ValueError):
+        write_results(RESULTS, io.BytesIO(), 'xml')
+
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_stream_with_empty_parts(fmt):
+    # Potongan kosong (mis. chunk tanpa baris valid) tidak boleh menggandakan header
+    parts = [RESULTS.iloc[:0], RESULTS.iloc[:2], RESULTS.iloc[2:2], RESULTS.iloc[2:]]
+    output = io.BytesIO()
+    assert write_result_stream(iter(parts), output, fmt) == len(RESULTS)
+    _assert_same(_read_back(output.getvalue(), fmt), RESULTS)
+
+
+def test_parquet_stream_with_changing_dtypes():
+    # Tipe per chunk bergantung isi: kolom kosong (NaN / None) di potongan pertama,
+    # int yang menjadi float karena NaN, object campuran di potongan berikutnya
+    parts = [
+        RESULTS.iloc[:2].assign(reply=[np.nan, np.nan], rating=[5, 4], translated_text=[None, None]),
+        RESULTS.iloc[2:].assign(reply=['thanks', np.nan], rating=[np.nan, 3.0], translated_text=['hello', None]),
+    ]
+    parts[1]['note'] = pd.Series([1, 'a'], dtype=object, index=parts[1].index)
+    parts[0]['note'] = pd.Series(['x', None], dtype=object, index=parts[0].index)
+    output = io.BytesIO()
+    assert write_result_stream(iter(parts), output, 'parquet') == len(RESULTS)
+    frame = _read_back(output.getvalue(), 'parquet')
+    assert frame['reply'].tolist()[2] == 'thanks' and frame['reply'].isna().tolist() == [True, True, False, True]
+    assert frame['rating'].tolist()[:2] == [5, 4] and frame['rating'].isna().tolist() == [False, False, True, False]
+    assert frame['translated_text'].isna().tolist() == [True, True, False, True]
+    _assert_same(frame[RESULTS.columns], RESULTS)
+
+
+def test_parquet_stream_rejects_incompatible_types():
+    parts = [RESULTS.iloc[:2].assign(rating=[5.0, 4.0]), RESULTS.iloc[2:].assign(rating=['n/a', 'good'])]
+    with pytest.raises(ValueError, match="rating"):
+        write_result_stream(iter(parts), io.BytesIO(), 'parquet')
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.artifact import REVIEWS_TSV, build_reviews_artifact, load_validation, read_artifact
+from core.calibration import SWEEP_METRICS, best_thresholds, sweep_confusions, sweep_thresholds, threshold_grid
+from core.lexicon import load_analyzer
+from core.metrics import confusion_matrix, encode_labels
+from core.scoring import SCORE_COLUMNS, get_thresholds, label_compound, save_thresholds, score_texts
+
+# Threshold simetris yang dulu memberi label berbeda antara artifact float32 dan score_texts
+BOUNDARY_THRESHOLDS = [0.12, 0.19, 0.21, 0.29, 0.51, 0.57, 0.65, 0.69, 0.94]
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return load_analyzer()
+
+
+@pytest.fixture(scope='module')
+def artifact(analyzer, tmp_path_factory):
+    # Artifact dibangun ulang dari TSV ke folder sementara (bukan data/ milik repo)
+    target = str(tmp_path_factory.mktemp('artifact') / 'scored_reviews.feather')
+    build_reviews_artifact(analyzer, source=REVIEWS_TSV, target=target, incremental=False)
+    df, _ = read_artifact(target)
+    return df
+
+
+@pytest.fixture(scope='module')
+def fresh(artifact, analyzer):
+    return score_texts(artifact['content'], analyzer)
+
+
+@pytest.fixture(scope='module')
+def pairs(artifact):
+    # Sama seperti halaman Argumentation: label manual CM.tsv + compound dari artifact
+    validation = load_validation()
+    scored = artifact.drop_duplicates('content').set_index('content')
+    return validation['label_manual'], validation['content'].map(scored['compound'])
+
+
+def _calibrated(pairs):
+    sweep = sweep_thresholds(pairs[1], pairs[0])
+    best = [best_thresholds(sweep, metric) for metric in SWEEP_METRICS]
+    return [(float(row['pos_threshold']), float(row['neg_threshold'])) for row in best]
+
+
+def test_artifact_keeps_float64_scores(artifact, fresh):
+    for name in SCORE_COLUMNS:
+        assert artifact[name].dtype == np.float64
+        np.testing.assert_array_equal(artifact[name].to_numpy(), fresh[name])
+
+
+def test_artifact_labels_match_score_texts(artifact, fresh, pairs):
+    thresholds = [(t, -t) for t in threshold_grid()] + _calibrated(pairs)
+    for pos, neg in thresholds:
+        stored = label_compound(artifact['compound'], pos, neg)
+        scored = label_compound(fresh['compound'], pos, neg)
+        assert (stored == scored).all(), (pos, neg)
+
+
+def test_sweep_matches_label_compound(pairs):
+    labels, compound = pairs
+    true_codes = encode_labels(labels)
+    pos_grid, neg_grid = threshold_grid(), 0.0 - threshold_grid()
+    cms = sweep_confusions(compound, true_codes, pos_grid, neg_grid)
+    valid = compound.notna().to_numpy()
+    for i, pos in enumerate(pos_grid):
+        for j, neg in enumerate(neg_grid):
+            if neg >= pos or (i + j) % 7:
+                continue
+            predicted = encode_labels(label_compound(compound[valid], pos, neg))
+            expected = confusion_matrix(true_codes[valid], predicted)
+            np.testing.assert_array_equal(cms[i, j], expected, err_msg=f"{pos} / {neg}")
+
+
+def test_saved_thresholds_equal_grid_values(tmp_path, pairs):
+    # Nilai dari number_input (0.1 + 0.2, 0.06 - 0.07) harus disimpan sama persis dengan kandidat sweep
+    path = str(tmp_path / 'thresholds.json')
+    save_thresholds(0.1 + 0.2, 0.06 - 0.07, path=path)
+    assert get_thresholds(path) == (0.3, -0.01)
+    pos, neg = get_thresholds(path)
+    compound = pd.Series([0.3, 0.2999, -0.01, -0.0099])
+    assert list(label_compound(compound, pos, neg)) == ['Positive', 'Neutral', 'Negative', 'Neutral']
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import core.language as language
+from core.language import detect_language, detect_languages, translate_rows
+
+TEXTS = [
+    "The app keeps crashing when I share my screen",
+    "Aplikasinya sering keluar sendiri saat rapat",
+    "La aplicación funciona muy bien",
+    "Die Verbindung bricht ständig ab",
+]
+
+
+@pytest.fixture
+def small_cache(monkeypatch):
+    # Cache kecil & kosong agar eviksi terjadi berulang kali selama test
+    monkeypatch.setattr(language, '_lang_cache', OrderedDict())
+    monkeypatch.setattr(language, 'LANG_CACHE_SIZE', 8)
+    return language
+
+
+def test_detect_languages_spreads_unique_results():
+    langs = detect_languages(TEXTS + TEXTS[:2])
+    assert list(langs[:2]) == ['en', 'id']
+    assert list(langs[4:]) == list(langs[:2])
+
+
+def test_detect_language_is_thread_safe(small_cache):
+    texts = [f"{text} {i}" for i in range(40) for text in TEXTS]
+    expected = [detect_language(text) for text in texts]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(5):
+            assert list(executor.map(detect_language, texts)) == expected
+    assert len(small_cache._lang_cache) <= small_cache.LANG_CACHE_SIZE
+
+
+def test_translate_rows_masks_only_changed_rows():
+    from core.translation import StubBackend, TranslationCache, Translator
+
+    class MissingBackend(StubBackend):
+        # Teks tanpa mapping gagal diterjemahkan (None), seperti error/timeout backend
+        def translate_batch(self, texts, source='auto', target='en'):
+            return [self.mapping.get(text) for text in texts]
+
+    backend = MissingBackend({TEXTS[1]: "The app often quits by itself during meetings"})
+    translator = Translator(backend, TranslationCache(path=None))
+    # Spasi ganda/di tepi: teks gagal harus kembali persis seperti input, bukan versi ternormalisasi
+    messy = "Koneksinya  sering putus saat   rapat "
+    texts, langs, translated = translate_rows(TEXTS + [TEXTS[1], messy], translator)
+    assert list(langs[:2]) == ['en', 'id']
+    assert list(translated) == [False, True, False, False, True, False]
+    assert texts[1] == texts[4] == "The app often quits by itself during meetings"
+    assert texts[2] == TEXTS[2]
+    assert texts[5] == messy
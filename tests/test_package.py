@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+import core
+
+
+def test_import_core_loads_no_submodules():
+    # Subproses baru: test lain di sesi pytest ini sudah mengimpor submodul core
+    code = "import sys, core; print(sorted(m for m in sys.modules if m.startswith('core.')))"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == '[]'
+
+
+def test_lazy_exports_resolve_to_submodule_objects():
+    from core.scoring import score_texts
+    from core.translation import StubBackend
+
+    assert core.score_texts is score_texts
+    assert core.StubBackend is StubBackend
+    for name in core.__all__:
+        assert getattr(core, name) is not None
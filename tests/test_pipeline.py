@@ -0,0 +1,42 @@
+import threading
+
+import pandas as pd
+
+from core.lexicon import load_analyzer
+from core.pipeline import collect_results, score_frames
+from core.translation import StubBackend, TranslationCache, Translator
+
+FRAME = pd.DataFrame({
+    'content': [f"review number {i} is {'great' if i % 2 else 'awful'}" for i in range(23)],
+    'rating': range(23),
+})
+
+
+def _frames(chunk_size=10):
+    for start in range(0, len(FRAME), chunk_size):
+        yield FRAME.iloc[start:start + chunk_size]
+
+
+def test_score_frames_keeps_order_and_columns():
+    result = collect_results([part for _, part in score_frames(_frames(), 'content', load_analyzer(), workers=1)])
+    assert result['content'].tolist() == FRAME['content'].tolist()
+    assert result['rating'].tolist() == FRAME['rating'].tolist()
+    assert set(result['label']) == {'Positive', 'Negative'}
+
+
+def test_score_frames_stops_when_cancelled():
+    cancel = threading.Event()
+    translator = Translator(StubBackend(), TranslationCache(path=None))
+    parts = []
+    for _, part in score_frames(_frames(), 'content', load_analyzer(), workers=1, translator=translator, cancel=cancel):
+        parts.append(part)
+        cancel.set()
+    assert len(collect_results(parts)) == 10
+
+
+def test_translated_text_is_string_without_translations():
+    # Chunk tanpa teks asing: kolom tetap bertipe string (bukan object berisi None)
+    translator = Translator(StubBackend(), TranslationCache(path=None))
+    [(_, part)] = score_frames(_frames(chunk_size=30), 'content', load_analyzer(), workers=1, translator=translator)
+    assert isinstance(part['translated_text'].dtype, pd.StringDtype)
+    assert part['translated_text'].isna().all()
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.lexicon import load_analyzer
+from core.scoring import (
+    SCORE_COLUMNS, dedupe_texts, label_compound, label_from_compound, scores_frame, score_texts,
+)
+
+TEXTS = [
+    "I love this app, it works great!",
+    "Terrible. It keeps crashing   during calls",
+    "It is an app.",
+    "",
+    "Terrible. It keeps crashing during calls",
+    "I love this app, it works great!",
+]
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return load_analyzer()
+
+
+def test_score_texts_matches_polarity_scores(analyzer):
+    columns = score_texts(TEXTS, analyzer)
+    for name in SCORE_COLUMNS:
+        assert columns[name].dtype == np.float64
+        expected = [analyzer.polarity_scores(text)[name] for text in TEXTS]
+        np.testing.assert_array_equal(columns[name], expected)
+
+
+def test_score_texts_dedup_equals_full_scoring(analyzer):
+    full = score_texts(pd.Series(TEXTS), analyzer)
+    dedup = score_texts(pd.Series(TEXTS), analyzer, dedup=True)
+    for name in SCORE_COLUMNS:
+        np.testing.assert_array_equal(dedup[name], full[name])
+
+
+def test_dedupe_texts_normalizes_whitespace():
+    uniques, codes = dedupe_texts(TEXTS)
+    assert len(uniques) == 4
+    assert codes[1] == codes[4]
+    assert [uniques[code] for code in codes][0] == TEXTS[0]
+
+
+def test_label_compound_matches_scalar_version():
+    compound = np.array([-1.0, -0.05, -0.0499, 0.0, 0.0499, 0.05, 1.0, np.nan])
+    labels = label_compound(compound, 0.05, -0.05)
+    assert list(labels) == ['Negative', 'Negative', 'Neutral', 'Neutral', 'Neutral', 'Positive', 'Positive', 'Neutral']
+    assert list(labels) == [label_from_compound(value, 0.05, -0.05) for value in compound]
+
+
+def test_scores_frame_keeps_series_index(analyzer):
+    texts = pd.Series(TEXTS, index=range(10, 10 + len(TEXTS)))
+    frame = scores_frame(texts, analyzer)
+    assert list(frame.index) == list(texts.index)
+    assert list(frame.columns) == SCORE_COLUMNS + ['label']
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from core.search import SearchIndex, build_index, load_index, parse_query, tokenize
+
+TEXTS = [
+    "No sound at all during the meeting",
+    "The audio is great, no complaints",
+    "Piano sound is lovely",
+    "Video freezes but audio works",
+    "no-sound bug again!",
+    "Connection drops, cannot connect",
+    "The audio is great, no complaints",
+]
+
+
+@pytest.fixture(scope='module')
+def index():
+    return build_index(TEXTS)
+
+
+def _reference(predicate):
+    return np.flatnonzero([predicate(f" {' '.join(tokenize(text))} ") for text in TEXTS])
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("No-Sound, AUDIO!!") == ['no', 'sound', 'audio']
+
+
+def test_parse_query_syntax():
+    include, exclude, prefixes, phrases, neg_phrases = parse_query('audio -video connect* "no sound" -"piano sound"')
+    assert include == ['audio', 'no', 'sound']
+    assert exclude == ['video']
+    assert prefixes == ['connect']
+    assert phrases == [' no sound ']
+    assert neg_phrases == [['piano', 'sound']]
+
+
+def test_empty_query_matches_everything(index):
+    assert index.search('') is None
+    assert index.search('   ') is None
+
+
+def test_terms_are_anded_and_excluded(index):
+    assert index.search('audio').tolist() == _reference(lambda t: ' audio ' in t).tolist()
+    assert index.search('audio -video').tolist() == [1, 6]
+
+
+def test_prefix(index):
+    assert index.search('connect*').tolist() == [5]
+    assert index.search('conn*').tolist() == [5]
+
+
+def test_phrase_matches_token_sequence(index):
+    # "piano sound" tidak boleh cocok dengan frasa "no sound"; "no-sound" cocok
+    assert index.search('"no sound"').tolist() == [0, 4]
+
+
+def test_negated_phrase_excludes_only_the_phrase(index):
+    result = index.search('-"no sound"')
+    assert result.tolist() == _reference(lambda t: ' no sound ' not in t).tolist()
+    # Berbeda dari -no: ulasan yang memuat "no" tanpa frasa tetap muncul
+    assert 1 in result and 1 not in index.search('-no')
+
+
+def test_duplicate_texts_map_to_every_row(index):
+    assert index.search('complaints').tolist() == [1, 6]
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    path = str(tmp_path / 'index.npz')
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    for query in ['audio', 'connect*', '"no sound"', '-"no sound"', 'sound -piano']:
+        assert loaded.search(query).tolist() == index.search(query).tolist()
+
+
+def test_load_index_uses_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr('core.search.CACHE_DIR', str(tmp_path))
+    first = load_index(TEXTS)
+    assert list(tmp_path.glob('search-*.npz'))
+    assert load_index(TEXTS).search('audio').tolist() == first.search('audio').tolist()
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from core.lexicon import load_analyzer
+from core.server import MAX_BODY_BYTES, ScoringService, start_server
+from core.translation import StubBackend, TranslationCache, Translator
+
+# Terjemahan lokal (tanpa jaringan, cache hanya di memori)
+MAPPING = {"aplikasi ini sangat bagus": "this app is very good"}
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    translator = Translator(StubBackend(MAPPING), TranslationCache(path=None))
+    service = ScoringService(load_analyzer(), translator, workers=1)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    state = {}
+
+    async def serve():
+        server, batcher = await start_server(service, port=0, window_ms=1)
+        state['port'] = server.sockets[0].getsockname()[1]
+        state['stop'] = asyncio.Event()
+        ready.set()
+        async with server:
+            await state['stop'].wait()
+        await batcher.stop()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True)
+    thread.start()
+    assert ready.wait(30), "server tidak siap"
+    yield f"http://127.0.0.1:{state['port']}"
+    loop.call_soon_threadsafe(state['stop'].set)
+    thread.join(10)
+    service.close()
+    loop.close()
+
+
+def _post(url, payload):
+    data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+    try:
+        with urllib.request.urlopen(f"{url}/score", data, timeout=10) as response:
+            return response.status, json.loads(response.read()), response.headers
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), e.headers
+
+
+def _raw(url, request):
+    # Request mentah (header yang tidak bisa dibuat urllib), dibaca sampai server menutup koneksi
+    host, port = url.rsplit('/', 1)[-1].split(':')
+    with socket.create_connection((host, int(port)), timeout=10) as sock:
+        sock.sendall(request)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    head, _, body = b''.join(chunks).partition(b'\r\n\r\n')
+    return int(head.split(b' ')[1]), json.loads(body)
+
+
+def test_health(server_url):
+    with urllib.request.urlopen(f"{server_url}/health", timeout=10) as response:
+        assert response.status == 200
+        assert json.loads(response.read()) == {'status': 'ok'}
+
+
+def test_score_single_text(server_url):
+    status, payload, headers = _post(server_url, {'text': 'I love this app'})
+    assert status == 200
+    [result] = payload['results']
+    assert result['label'] == 'Positive'
+    assert result['translated'] is None
+    assert headers['X-Batch-Size'] == '1'
+
+
+def test_score_batch_translates_foreign_texts(server_url):
+    texts = ["aplikasi ini sangat bagus", "terrible, it keeps crashing", ""]
+    status, payload, _ = _post(server_url, {'texts': texts})
+    assert status == 200
+    results = payload['results']
+    assert [result['text'] for result in results] == texts
+    assert results[0]['translated'] == MAPPING[texts[0]]
+    assert results[0]['label'] == 'Positive'
+    assert results[1]['label'] == 'Negative'
+
+    status, payload, _ = _post(server_url, {'texts': texts[:1], 'translate': False})
+    assert payload['results'][0]['translated'] is None
+
+
+@pytest.mark.parametrize('payload', [
+    b'{not json',
+    [1, 2],
+    {'other': 'x'},
+    {'text': None},
+    {'text': 123},
+    {'texts': 'not a list'},
+    {'texts': ['ok', None]},
+    {'texts': ['ok', {'a': 1}]},
+])
+def test_score_rejects_bad_payload(server_url, payload):
+    status, body, _ = _post(server_url, payload)
+    assert status == 400
+    assert 'error' in body
+
+
+def test_unknown_path_and_method(server_url):
+    with pytest.raises(urllib.error.HTTPError) as info:
+        urllib.request.urlopen(f"{server_url}/nope", timeout=10)
+    assert info.value.code == 404
+    with pytest.raises(urllib.error.HTTPError) as info:
+        urllib.request.urlopen(f"{server_url}/score", timeout=10)
+    assert info.value.code == 405
+
+
+@pytest.mark.parametrize('length', [b'abc', b'-5', b'1.5'])
+def test_invalid_content_length(server_url, length):
+    status, body = _raw(server_url, b'POST /score HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n{}')
+    assert status == 400
+    assert 'Content-Length' in body['error']
+
+
+def test_body_too_large(server_url):
+    length = str(MAX_BODY_BYTES + 1).encode('ascii')
+    status, body = _raw(server_url, b'POST /score HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n')
+    assert status == 413
+    assert 'error' in body
@@ -0,0 +1,94 @@
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from core.translation import GoogleBackend, StubBackend, TranslationCache, Translator, translate_concurrent
+
+
+class FlakyBackend(StubBackend):
+    """Stub yang gagal (None / string kosong) untuk teks di `failing`."""
+
+    def __init__(self, mapping, failing):
+        super().__init__(mapping)
+        self.failing = failing
+        self.sent = []
+
+    def translate_batch(self, texts, source='auto', target='en'):
+        self.sent.append(list(texts))
+        return [('' if i % 2 else None) if text in self.failing else self.mapping[text]
+                for i, text in enumerate(texts)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(path=str(tmp_path / 'translations.sqlite3'))
+    yield cache
+    cache.close()
+
+
+def test_failed_translations_fall_back_without_caching(cache):
+    backend = FlakyBackend({'halo dunia': 'hello world'}, failing={'gagal', 'kosong'})
+    translator = Translator(backend, cache)
+    assert translator.translate_batch(['halo  dunia', 'gagal', 'kosong']) == ['hello world', 'gagal', 'kosong']
+    assert cache.get_many(['halo dunia', 'gagal', 'kosong'], 'auto', 'en') == {'halo dunia': 'hello world'}
+
+    # Panggilan berikutnya hanya mengirim ulang teks yang gagal
+    assert translator.translate_batch(['halo dunia', 'gagal']) == ['hello world', 'gagal']
+    assert backend.sent[-1] == ['gagal']
+
+
+def test_cache_persists_to_sqlite(tmp_path):
+    path = str(tmp_path / 'translations.sqlite3')
+    first = TranslationCache(path=path)
+    Translator(StubBackend(prefix='EN: '), first).translate_batch(['satu', 'dua'])
+    first.close()
+    second = TranslationCache(path=path)
+    assert second.get_many(['satu', 'dua', 'tiga'], 'auto', 'en') == {'satu': 'EN: satu', 'dua': 'EN: dua'}
+    second.close()
+
+
+def test_translate_concurrent_keeps_order_and_falls_back():
+    class BrokenBackend(StubBackend):
+        def translate_batch(self, texts, source='auto', target='en'):
+            if 'rusak' in texts:
+                raise RuntimeError('network down')
+            return super().translate_batch(texts, source, target)
+
+    translator = Translator(BrokenBackend(prefix='EN: '), TranslationCache(path=None))
+    texts = ['a', 'b', 'rusak', 'c', 'd']
+    assert translate_concurrent(texts, translator, batch_size=2) == ['EN: a', 'EN: b', 'rusak', 'c', 'EN: d']
+
+
+def test_google_backend_returns_none_for_empty_results(monkeypatch):
+    class FakeGoogleTranslator:
+        def __init__(self, source, target):
+            pass
+
+        def translate(self, text):
+            return '\n'.join('' if line == 'kosong' else line.upper() for line in text.split('\n'))
+
+    monkeypatch.setitem(sys.modules, 'deep_translator', types.SimpleNamespace(GoogleTranslator=FakeGoogleTranslator))
+    assert GoogleBackend().translate_batch(['kosong']) == [None]
+    assert GoogleBackend().translate_batch(['satu', 'kosong', 'dua']) == ['SATU', None, 'DUA']
+
+
+def test_translate_concurrent_stops_waiting_on_cancel():
+    release = threading.Event()
+
+    class SlowBackend(StubBackend):
+        def translate_batch(self, texts, source='auto', target='en'):
+            release.wait(10)
+            return super().translate_batch(texts, source, target)
+
+    cancel = threading.Event()
+    translator = Translator(SlowBackend(prefix='EN: '), TranslationCache(path=None))
+    threading.Timer(0.2, cancel.set).start()
+    started = time.perf_counter()
+    try:
+        assert translate_concurrent(['a', 'b', 'c'], translator, batch_size=1, cancel=cancel) == ['a', 'b', 'c']
+    finally:
+        release.set()
+    assert time.perf_counter() - started < 2